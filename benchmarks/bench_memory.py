@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# ================================================
+# Бенчмарк памяти: байт на сущность в pydantic-моделях, dict-зеркале и компактном зеркале,
+# байт на страницу в кэше ответов без сжатия и со сжатием
+# ================================================
+#
+#     python benchmarks/bench_memory.py --projects 5000 --output memory.json
+#
+# Данные - ответы stub_api, прогнанные через json.loads (как ответ httpx), поэтому строки
+# не разделяются между сущностями заранее. Память считается tracemalloc по разнице снимков.
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from common import git_revision, percentile
+
+from freelancehunt_mcp import models  # noqa: E402
+from freelancehunt_mcp.cache import ResponseCache  # noqa: E402
+from freelancehunt_mcp.compression import ZLIB, ZSTD, zstd_available  # noqa: E402
+from freelancehunt_mcp.mirror import LocalMirror  # noqa: E402
+from stub_api import StubAPI  # noqa: E402
+
+
+def allocated(build: Callable[[], Any]) -> int:
+    """Байт, удерживаемых результатом build()"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = build()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return size
+
+
+def mirror_of(payloads: List[Dict[str, Any]], endpoint: str, compact: bool) -> LocalMirror:
+    mirror = LocalMirror(compact=compact, max_entries=0)
+    for payload in payloads:
+        mirror.ingest(endpoint, json.loads(payload))
+    return mirror
+
+
+def measure_entity(name: str, items: List[Dict[str, Any]], endpoint: str, model: Any, collection: str) -> Dict[str, Any]:
+    # Страницы по 50, как их отдает API
+    payloads = [json.dumps({"data": items[i:i + 50]}, ensure_ascii=False) for i in range(0, len(items), 50)]
+
+    sizes = {
+        "pydantic": allocated(lambda: [model(**item) for payload in payloads for item in json.loads(payload)["data"]]),
+        "dict": allocated(lambda: mirror_of(payloads, endpoint, compact=False)),
+        "compact": allocated(lambda: mirror_of(payloads, endpoint, compact=True))
+    }
+
+    # Цена сборки dict при чтении из компактного зеркала
+    mirror = mirror_of(payloads, endpoint, compact=True)
+    ids = [item["id"] for item in items]
+    timings = []
+    for item_id in ids:
+        started = time.perf_counter()
+        mirror.get(collection, item_id)
+        timings.append(time.perf_counter() - started)
+
+    result = {
+        "count": len(items),
+        "json_bytes_per_item": round(sum(len(payload.encode()) for payload in payloads) / len(items)),
+        **{f"{kind}_bytes_per_item": round(size / len(items)) for kind, size in sizes.items()},
+        "compact_vs_dict": round(sizes["compact"] / sizes["dict"], 3),
+        "materialize_p50_us": round(percentile(timings, 0.5) * 1e6, 1),
+        "materialize_p95_us": round(percentile(timings, 0.95) * 1e6, 1)
+    }
+    print(
+        f"{name:12} n={result['count']:<6} json={result['json_bytes_per_item']}B "
+        f"pydantic={result['pydantic_bytes_per_item']}B dict={result['dict_bytes_per_item']}B "
+        f"compact={result['compact_bytes_per_item']}B ({result['compact_vs_dict']:.0%}) "
+        f"get={result['materialize_p50_us']}us",
+        file=sys.stderr
+    )
+    return result
+
+
+def measure_cache(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Страницы /projects по 50 в ResponseCache: память на запись и время чтения payload"""
+    payloads = [json.dumps({"data": items[i:i + 50]}, ensure_ascii=False) for i in range(0, len(items), 50)]
+    codecs = [None, ZLIB] + ([ZSTD] if zstd_available() else [])
+    results = {}
+    for codec in codecs:
+        def build() -> ResponseCache:
+            cache = ResponseCache(len(payloads), codec=codec)
+            for index, payload in enumerate(payloads):
+                cache.set(f"/projects?page={index}", json.loads(payload))
+            return cache
+
+        size = allocated(build)
+        cache = build()
+        keys = [key for key, _ in cache.recent()]
+        # Первое попадание разбирает сжатую запись, повторное (соседняя нарезанная страница) - из памяти
+        timings: Dict[str, List[float]] = {"cold": [], "hot": []}
+        for key in keys:
+            for kind in ("cold", "hot"):
+                started = time.perf_counter()
+                cache.get(key, float("inf")).payload
+                timings[kind].append(time.perf_counter() - started)
+        name = codec or "none"
+        results[name] = {
+            "bytes_per_page": round(size / len(payloads)),
+            **{f"{kind}_hit_p50_us": round(percentile(values, 0.5) * 1e6, 1) for kind, values in timings.items()},
+            **{f"{kind}_hit_p95_us": round(percentile(values, 0.95) * 1e6, 1) for kind, values in timings.items()}
+        }
+        print(
+            f"cache/{name:7} pages={len(payloads):<5} bytes={results[name]['bytes_per_page']}B/page "
+            f"cold hit={results[name]['cold_hit_p50_us']}us hot hit={results[name]['hot_hit_p50_us']}us",
+            file=sys.stderr
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Bytes per cached entity: pydantic models vs dict mirror vs compact mirror, compressed response cache"
+    )
+    parser.add_argument("--projects", type=int, default=5000)
+    parser.add_argument("--freelancers", type=int, default=1000)
+    parser.add_argument("--description-size", type=int, default=600)
+    parser.add_argument("--output", default="bench_memory.json")
+    args = parser.parse_args()
+
+    stub = StubAPI(projects=args.projects, freelancers=args.freelancers, contests=0, threads=0,
+                   description_size=args.description_size)
+    results = {
+        "projects": measure_entity("projects", list(stub.projects.values()), "/projects", models.Project, "projects"),
+        "freelancers": measure_entity(
+            "freelancers", list(stub.freelancers.values()), "/freelancers", models.FreelancerProfile, "freelancers"
+        )
+    }
+    cache = measure_cache(list(stub.projects.values()))
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "revision": git_revision(),
+            "description_size": args.description_size,
+            "entities": results,
+            "cache": cache
+        }, f, indent=2)
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# ================================================
+# Микробенчмарк: разбор pydantic и сериализация ответов из кассеты
+# ================================================
+#
+#     CASSETTE_MODE=record CASSETTE_PATH=prod.jsonl.gz python server.py   # записать сессию
+#     python benchmarks/bench_parsing.py prod.jsonl.gz --output parsing.json
+#
+# Без кассеты записывает короткую сессию из stub_api в памяти процесса.
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from common import git_revision, percentile
+
+from freelancehunt_mcp import models  # noqa: E402
+from freelancehunt_mcp.cassette import read_cassette  # noqa: E402
+from freelancehunt_mcp.handlers.base import create_json_response  # noqa: E402
+
+
+def _data(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return payload["data"]
+
+
+# Путь -> (модель, извлечение данных для модели)
+PATH_MODELS: List[Tuple["re.Pattern[str]", Any, Callable[[Dict[str, Any]], Dict[str, Any]]]] = [
+    (re.compile(r"^/projects(\?|$)"), models.ProjectsListResponse, dict),
+    (re.compile(r"^/projects/\d+$"), models.Project, _data),
+    (re.compile(r"^/projects/\d+/bids"), models.BidsResponse, dict),
+    (re.compile(r"^/projects/\d+/comments"), models.ProjectCommentsResponse, dict),
+    (re.compile(r"^/freelancers/\d+$"), models.FreelancerProfile, _data),
+    (re.compile(r"^/freelancers/\d+/portfolio"), models.PortfolioResponse, dict),
+    (re.compile(r"^/my/profile"), models.UserProfile, _data),
+    (re.compile(r"^/my/bids"), models.BidsResponse, dict),
+    (re.compile(r"^/contests(\?|$)"), models.ContestsResponse, dict),
+    (re.compile(r"^/contests/\d+$"), models.Contest, _data),
+    (re.compile(r"^/threads"), models.ThreadsListResponse, dict),
+    (re.compile(r"^/countries"), models.CountriesResponse, dict)
+]
+
+
+def model_for(path: str) -> Optional[Tuple[Any, Callable[[Dict[str, Any]], Dict[str, Any]]]]:
+    for pattern, model, extract in PATH_MODELS:
+        if pattern.search(path):
+            return model, extract
+    return None
+
+
+def measure(func: Callable[[], Any], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def record_stub_cassette(path: str) -> None:
+    import httpx
+
+    from freelancehunt_mcp.api_client import FreelanceHuntClient
+    from freelancehunt_mcp.cassette import RecordingTransport
+    from stub_api import StubAPI
+
+    os.environ.setdefault("REQUEST_DELAY", "0")
+    transport = RecordingTransport(path, inner=httpx.ASGITransport(app=StubAPI()))
+    client = FreelanceHuntClient(api_key="stub", base_url="http://stub/v2", transport=transport)
+
+    async def session() -> None:
+        projects = await client.search_projects(page=1, per_page=50)
+        for project in projects.data[:10]:
+            await client.get_project(project.id)
+            await client.get_project_bids(project.id, per_page=50)
+            await client.get_project_comments(project.id)
+        for freelancer_id in range(100, 110):
+            await client.get_freelancer(freelancer_id)
+            await client.get_freelancer_portfolio(freelancer_id)
+        await client.get_my_profile()
+        await client.search_contests(per_page=50)
+        await client.get_threads(per_page=50)
+        await client.get_countries()
+
+    asyncio.run(session())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="pydantic parse / JSON encode microbenchmark over cassette payloads")
+    parser.add_argument("cassette", nargs="?", help="Cassette file (default: record one from the stub API)")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", default="bench_parsing.json")
+    args = parser.parse_args()
+
+    cassette = args.cassette
+    if not cassette:
+        cassette = os.path.join(tempfile.mkdtemp(), "stub.jsonl.gz")
+        record_stub_cassette(cassette)
+
+    by_model: Dict[str, Dict[str, List[float]]] = {}
+    for record in read_cassette(cassette):
+        if record["status"] != 200:
+            continue
+        target = model_for(record["path"])
+        if target is None:
+            continue
+        model, extract = target
+        data = extract(json.loads(record["response"]))
+        parsed = model(**data)
+        dumped = parsed.model_dump()
+
+        stats = by_model.setdefault(model.__name__, {"parse": [], "dump": [], "encode": [], "bytes": []})
+        stats["parse"] += measure(lambda: model(**data), args.repeat)
+        stats["dump"] += measure(parsed.model_dump, args.repeat)
+        stats["encode"] += measure(lambda: create_json_response(dumped), args.repeat)
+        stats["bytes"].append(len(record["response"].encode()))
+
+    results = {}
+    for name, stats in sorted(by_model.items()):
+        results[name] = {
+            "payloads": len(stats["bytes"]),
+            "mean_payload_bytes": round(sum(stats["bytes"]) / len(stats["bytes"])),
+            **{
+                f"{phase}_p50_us": round(percentile(stats[phase], 0.5) * 1e6, 1)
+                for phase in ("parse", "dump", "encode")
+            },
+            **{
+                f"{phase}_p95_us": round(percentile(stats[phase], 0.95) * 1e6, 1)
+                for phase in ("parse", "dump", "encode")
+            }
+        }
+        print(
+            f"{name:26} payloads={results[name]['payloads']:<4} bytes={results[name]['mean_payload_bytes']:<7} "
+            f"parse={results[name]['parse_p50_us']}us dump={results[name]['dump_p50_us']}us "
+            f"encode={results[name]['encode_p50_us']}us",
+            file=sys.stderr
+        )
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"revision": git_revision(), "cassette": cassette, "repeat": args.repeat, "models": results}, f, indent=2)
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# ================================================
+# Бенчмарк: холодный старт сервера
+# ================================================
+#
+# Импорт freelancehunt_mcp.server под `python -X importtime` (медиана по запускам)
+# и время от запуска server.py до ответа на list_tools. Завершается с кодом 1,
+# если превышен порог или результат хуже базового на --tolerance.
+#
+#     python benchmarks/bench_startup.py --output startup.json
+#     python benchmarks/bench_startup.py --baseline startup.json --tolerance 0.2
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+from common import SRC_DIR, git_revision, mcp_session, server_env
+
+PACKAGE = "freelancehunt_mcp"
+
+
+def measure_import() -> Dict[str, Any]:
+    """Один запуск интерпретатора с -X importtime; времена в миллисекундах"""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [SRC_DIR, os.getenv("PYTHONPATH")]))}
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}.server"],
+        env=env, capture_output=True, text=True, check=True
+    )
+    wall = time.perf_counter() - started
+
+    total_us = 0
+    own_us = 0
+    modules: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if not self_us.isdigit():
+            continue
+        if name == f"{PACKAGE}.server":
+            total_us = int(cumulative_us)
+        if name.startswith(PACKAGE):
+            own_us += int(self_us)
+            modules[name] = int(self_us)
+
+    return {
+        "process_ms": wall * 1000,
+        "import_ms": total_us / 1000,
+        "own_import_ms": own_us / 1000,
+        "modules": sorted(modules)
+    }
+
+
+async def measure_first_list_tools(env: Dict[str, str]) -> float:
+    started = time.perf_counter()
+    async with mcp_session(env) as session:
+        await session.list_tools()
+        return (time.perf_counter() - started) * 1000
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    imports = [measure_import() for _ in range(args.repeat)]
+    # URL не важен: list_tools не ходит в API
+    env = server_env("http://127.0.0.1:9/v2")
+    first_list = [asyncio.run(measure_first_list_tools(env)) for _ in range(args.repeat)]
+
+    def median(values: List[float]) -> float:
+        return round(statistics.median(values), 3)
+
+    return {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "import_ms": median([item["import_ms"] for item in imports]),
+        "own_import_ms": median([item["own_import_ms"] for item in imports]),
+        "process_ms": median([item["process_ms"] for item in imports]),
+        "first_list_tools_ms": median(first_list),
+        "eager_modules": imports[-1]["modules"]
+    }
+
+
+def check(result: Dict[str, Any], args: argparse.Namespace) -> List[str]:
+    failures = []
+    limits = {"import_ms": args.max_import_ms, "first_list_tools_ms": args.max_first_list_ms}
+    for name, limit in limits.items():
+        if limit is not None and result[name] > limit:
+            failures.append(f"{name} {result[name]:.1f}ms exceeds threshold {limit:.1f}ms")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        for name in ("import_ms", "own_import_ms", "first_list_tools_ms"):
+            allowed = baseline[name] * (1 + args.tolerance)
+            if result[name] > allowed:
+                failures.append(
+                    f"{name} {result[name]:.1f}ms regressed vs baseline {baseline[name]:.1f}ms "
+                    f"(+{args.tolerance:.0%} allowed)"
+                )
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Server cold start benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, help="fail if importing the server takes longer")
+    parser.add_argument("--max-first-list-ms", type=float, help="fail if spawn to first list_tools takes longer")
+    parser.add_argument("--baseline", help="JSON written by a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression vs baseline")
+    parser.add_argument("--output", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    result = run(args)
+    print(
+        f"import {result['import_ms']:.1f}ms (own {result['own_import_ms']:.1f}ms), "
+        f"process {result['process_ms']:.1f}ms, first list_tools {result['first_list_tools_ms']:.1f}ms"
+    )
+    print(f"{PACKAGE} modules imported eagerly: {', '.join(result['eager_modules'])}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"Results written to {args.output}")
+
+    failures = check(result, args)
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
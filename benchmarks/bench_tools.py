@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# ================================================
+# Бенчмарк: латентность и пропускная способность tools
+# ================================================
+#
+# Поднимает stub_api, запускает server.py по stdio и гоняет каждый tool
+# на разных уровнях параллелизма и размерах ответа.
+#
+#     python benchmarks/bench_tools.py --concurrency 1 8 --per-page 10 50 --output bench.json
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from common import (
+    gather_limited,
+    git_revision,
+    latency_summary,
+    mcp_session,
+    server_env,
+    stub_server,
+    timed_call
+)
+
+
+# tool -> генератор аргументов по номеру вызова и размеру страницы
+TOOL_ARGUMENTS: Dict[str, Callable[[int, int], Dict[str, Any]]] = {
+    "search_projects": lambda i, per_page: {"page": i % 5 + 1, "per_page": per_page},
+    "get_project": lambda i, per_page: {"project_id": 1000 + i % 500},
+    "get_project_bids": lambda i, per_page: {"project_id": 1000 + i % 500, "per_page": per_page},
+    "get_project_comments": lambda i, per_page: {"project_id": 1000 + i % 500, "per_page": per_page},
+    "get_freelancer": lambda i, per_page: {"freelancer_id": 100 + i % 200},
+    "get_freelancer_portfolio": lambda i, per_page: {"freelancer_id": 100 + i % 200, "per_page": per_page},
+    "get_freelancer_reviews": lambda i, per_page: {"freelancer_id": 100 + i % 200, "per_page": per_page},
+    "get_my_profile": lambda i, per_page: {},
+    "get_my_bids": lambda i, per_page: {"per_page": per_page},
+    "search_contests": lambda i, per_page: {"page": i % 2 + 1, "per_page": per_page},
+    "get_contest": lambda i, per_page: {"contest_id": 3000 + i % 60},
+    "get_threads": lambda i, per_page: {"per_page": per_page},
+    "get_skills": lambda i, per_page: {},
+    "get_countries": lambda i, per_page: {},
+    "get_cities": lambda i, per_page: {"country_id": i % 6 + 1}
+}
+
+
+async def bench_tool(session: Any, tool: str, iterations: int, concurrency: int, per_page: int) -> Dict[str, Any]:
+    make_arguments = TOOL_ARGUMENTS[tool]
+    # Прогрев: первый вызов платит за ленивые импорты и пустой кэш
+    await timed_call(session, tool, make_arguments(0, per_page))
+
+    started = time.perf_counter()
+    results = await gather_limited(
+        [timed_call(session, tool, make_arguments(i, per_page)) for i in range(iterations)],
+        concurrency
+    )
+    elapsed = time.perf_counter() - started
+
+    summary = latency_summary([result["latency"] for result in results], elapsed)
+    summary["errors"] = sum(result["error"] for result in results)
+    summary["mean_response_bytes"] = round(sum(result["bytes"] for result in results) / len(results))
+    return summary
+
+
+async def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    tools = args.tools or list(TOOL_ARGUMENTS)
+    runs: List[Dict[str, Any]] = []
+
+    for description_size in args.description_size:
+        with stub_server(description_size=description_size, latency=args.stub_latency) as base_url:
+            env = server_env(base_url, REQUEST_DELAY=str(args.request_delay))
+            async with mcp_session(env) as session:
+                for concurrency in args.concurrency:
+                    for per_page in args.per_page:
+                        for tool in tools:
+                            summary = await bench_tool(session, tool, args.iterations, concurrency, per_page)
+                            run = {
+                                "tool": tool,
+                                "concurrency": concurrency,
+                                "per_page": per_page,
+                                "description_size": description_size,
+                                **summary
+                            }
+                            runs.append(run)
+                            print(
+                                f"{tool:26} c={concurrency:<3} per_page={per_page:<3} desc={description_size:<5} "
+                                f"p50={run['p50_ms']}ms p95={run['p95_ms']}ms p99={run['p99_ms']}ms "
+                                f"{run['calls_per_sec']} calls/s errors={run['errors']}",
+                                file=sys.stderr
+                            )
+
+    return {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "iterations": args.iterations,
+            "stub_latency": args.stub_latency,
+            "request_delay": args.request_delay
+        },
+        "runs": runs
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end tool latency/throughput benchmark over MCP stdio")
+    parser.add_argument("--tools", nargs="*", help="Tools to benchmark (default: all read tools)")
+    parser.add_argument("--iterations", type=int, default=50, help="Calls per tool and configuration")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--per-page", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--description-size", type=int, nargs="+", default=[600, 5000],
+                        help="Average project description length served by the stub")
+    parser.add_argument("--stub-latency", type=float, default=0.0, help="Latency added by the stub API per request")
+    parser.add_argument("--request-delay", type=float, default=0.0, help="REQUEST_DELAY passed to the server")
+    parser.add_argument("--output", default="bench_results.json", help="JSON file for results")
+    args = parser.parse_args()
+
+    unknown = set(args.tools or []) - set(TOOL_ARGUMENTS)
+    if unknown:
+        parser.error(f"unknown tools: {', '.join(sorted(unknown))}")
+
+    results = asyncio.run(run_benchmarks(args))
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# ================================================
+# Общие утилиты бенчмарков
+# ================================================
+
+import asyncio
+import math
+import os
+import subprocess
+import sys
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(REPO_ROOT, "src")
+SERVER_SCRIPT = os.path.join(REPO_ROOT, "server.py")
+
+sys.path.insert(0, SRC_DIR)
+
+from stub_api import stub_process as stub_server  # noqa: E402
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Перцентиль по методу nearest-rank"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    # Ранг ceil(q*n); округление убирает ошибку float (0.1 * 30 = 3.0000000000000004)
+    index = max(0, min(len(ordered) - 1, math.ceil(round(q * len(ordered), 9)) - 1))
+    return ordered[index]
+
+
+def latency_summary(latencies: List[float], elapsed: float) -> Dict[str, Any]:
+    return {
+        "calls": len(latencies),
+        "calls_per_sec": round(len(latencies) / elapsed, 2) if elapsed > 0 else None,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3) if latencies else None,
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3) if latencies else None,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else None
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def server_env(base_url: str, **overrides: str) -> Dict[str, str]:
+    env = {
+        **os.environ,
+        "FREELANCEHUNT_API_KEY": "stub",
+        "FREELANCEHUNT_BASE_URL": base_url,
+        "REQUEST_DELAY": "0"
+    }
+    env.update(overrides)
+    return env
+
+
+@asynccontextmanager
+async def mcp_session(env: Dict[str, str]) -> AsyncIterator[ClientSession]:
+    """Сессия MCP поверх stdio с сервером из репозитория, как в client.py"""
+    async with AsyncExitStack() as stack:
+        server_params = StdioServerParameters(command=sys.executable, args=[SERVER_SCRIPT], env=env)
+        read, write = await stack.enter_async_context(stdio_client(server_params))
+        session = await stack.enter_async_context(ClientSession(read, write))
+        await session.initialize()
+        yield session
+
+
+async def timed_call(session: ClientSession, tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    result = await session.call_tool(tool, arguments)
+    latency = time.perf_counter() - started
+    text = result.content[0].text if result.content else ""
+    return {
+        "latency": latency,
+        "bytes": sum(len(item.text.encode()) for item in result.content if hasattr(item, "text")),
+        "error": bool(result.isError) or text.startswith(("Error:", "FreelanceHunt API Error:", "Unexpected error:"))
+    }
+
+
+async def gather_limited(coroutines: List[Any], concurrency: int) -> List[Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(coroutine: Any) -> Any:
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*(run(coroutine) for coroutine in coroutines))
@@ -0,0 +1,705 @@
+# ================================================
+# Локальная заглушка FreelanceHunt API v2 (ASGI) для бенчмарков и генератора нагрузки
+# ================================================
+#
+# In-process (каталог benchmarks в sys.path):
+#     client = FreelanceHuntClient(api_key="stub", base_url="http://stub/v2",
+#                                  transport=httpx.ASGITransport(app=StubAPI()))
+# Отдельный процесс (нужен uvicorn):
+#     python benchmarks/stub_api.py --port 8765 --latency 0.05 --error-rate 0.01
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+
+SKILLS = [
+    (1, "PHP"), (2, "JavaScript"), (22, "Python"), (24, "Java"), (28, "C#"),
+    (41, "HTML и CSS верстка"), (43, "Дизайн сайтов"), (57, "Веб-программирование"),
+    (59, "Разработка ботов"), (68, "Копирайтинг"), (75, "Перевод текстов"),
+    (86, "Мобильные приложения"), (96, "Базы данных и SQL"), (99, "Парсинг данных"),
+    (103, "Интернет-магазины и электронная коммерция"), (106, "Логотипы"),
+    (113, "Поисковое продвижение (SEO)"), (124, "Контекстная реклама"),
+    (129, "Тестирование и QA"), (134, "Системное администрирование"),
+    (160, "Рерайтинг"), (169, "Иллюстрации и рисунки"), (174, "Видеомонтаж"),
+    (180, "Машинное обучение"), (186, "DevOps")
+]
+
+COUNTRIES = [
+    (1, "UA", "Украина"), (2, "PL", "Польша"), (3, "DE", "Германия"),
+    (4, "KZ", "Казахстан"), (5, "US", "США"), (6, "CZ", "Чехия")
+]
+
+CITIES = {
+    1: ["Киев", "Львов", "Одесса", "Харьков", "Днепр", "Запорожье", "Винница", "Черновцы", "Ивано-Франковск"],
+    2: ["Варшава", "Краков", "Вроцлав", "Гданьск"],
+    3: ["Берлин", "Мюнхен", "Гамбург"],
+    4: ["Алматы", "Астана"],
+    5: ["Нью-Йорк", "Сан-Франциско"],
+    6: ["Прага", "Брно"]
+}
+
+CURRENCIES = ["UAH", "UAH", "UAH", "USD", "EUR"]
+SAFE_TYPES = [None, "employer", "developer", "split", "employer_cashless"]
+FIRST_NAMES = ["Олександр", "Марія", "Іван", "Олена", "Дмитро", "Анна", "Сергій", "Юлія", "Andrii", "Kateryna"]
+LAST_NAMES = ["Шевченко", "Коваленко", "Бондаренко", "Ткаченко", "Кравченко", "Мельник", "Бойко", "Savchenko"]
+WORDS = (
+    "нужно сделать сайт бот интеграция api парсер дизайн логотип магазин доработка "
+    "telegram wordpress django react laravel shopify срочно проект задача модуль "
+    "оплата crm мобильное приложение верстка макет figma тексты seo реклама"
+).split()
+
+PROJECT_STATUSES = [(11, "Открыт для предложений"), (12, "Выбор исполнителя"), (13, "Закрыт")]
+
+ROUTES: List[Tuple[str, "re.Pattern[str]", str]] = []
+
+
+def route(method: str, pattern: str) -> Callable:
+    def decorator(func: Callable) -> Callable:
+        ROUTES.append((method, re.compile(f"^{pattern}$"), func.__name__))
+        return func
+    return decorator
+
+
+class StubAPI:
+    """ASGI-приложение, имитирующее эндпоинты v2, используемые FreelanceHuntClient"""
+
+    def __init__(
+        self,
+        seed: int = 42,
+        projects: int = 500,
+        freelancers: int = 200,
+        contests: int = 60,
+        threads: int = 40,
+        description_size: int = 600,
+        repost_rate: float = 0.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        rate_limit: int = 0,
+        rate_window: float = 3600.0,
+        base_url: str = "http://stub/v2"
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.base_url = base_url.rstrip("/")
+        self.description_size = description_size
+        self.repost_rate = repost_rate
+
+        self.request_count = 0
+        self._window_started = time.monotonic()
+        self._window_count = 0
+        self._random = random.Random(seed)
+        self._now = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+        self.freelancers = {100 + i: self._make_freelancer(100 + i) for i in range(freelancers)}
+        self.employers = [self._make_person(5000 + i, "employer") for i in range(max(1, projects // 5))]
+        self.projects: Dict[int, Dict[str, Any]] = {}
+        for i in range(projects):
+            self.projects[1000 + i] = self._make_project(1000 + i)
+        self.contests = {3000 + i: self._make_contest(3000 + i) for i in range(contests)}
+        self.threads = [self._make_thread(7000 + i) for i in range(threads)]
+        self.my_id = next(iter(self.freelancers), 100)
+        self.my_bids: List[Dict[str, Any]] = []
+        self._bids: Dict[int, List[Dict[str, Any]]] = {}
+
+    # ------------------------------------------------
+    # Генерация данных
+    # ------------------------------------------------
+
+    def _text(self, rng: random.Random, size: int) -> str:
+        words: List[str] = []
+        length = 0
+        while length < size:
+            word = rng.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+        return " ".join(words).capitalize() + "."
+
+    def _date(self, rng: random.Random, max_days: int = 60) -> str:
+        return (self._now - timedelta(minutes=rng.randint(0, max_days * 24 * 60))).isoformat()
+
+    def _avatar(self, login: str) -> Dict[str, Any]:
+        return {
+            "small": {"url": f"https://content.freelancehunt.com/profile/photo/50/{login}.png", "width": 50, "height": 50},
+            "large": {"url": f"https://content.freelancehunt.com/profile/photo/225/{login}.png", "width": 225, "height": 225}
+        }
+
+    def _make_person(self, person_id: int, kind: str) -> Dict[str, Any]:
+        rng = random.Random(person_id)
+        login = f"{kind[:3]}{person_id}"
+        return {
+            "id": person_id,
+            "type": kind,
+            "login": login,
+            "first_name": rng.choice(FIRST_NAMES),
+            "last_name": rng.choice(LAST_NAMES),
+            "avatar": self._avatar(login),
+            "self": f"{self.base_url}/{kind}s/{person_id}"
+        }
+
+    def _location(self, rng: random.Random) -> Dict[str, Any]:
+        country_id, iso2, country_name = rng.choice(COUNTRIES)
+        city_index = rng.randrange(len(CITIES[country_id]))
+        return {
+            "country": {"id": country_id, "name": country_name},
+            "city": {"id": country_id * 100 + city_index + 1, "name": CITIES[country_id][city_index]}
+        }
+
+    def _make_project(self, project_id: int) -> Dict[str, Any]:
+        rng = random.Random(project_id)
+        skills = [{"id": skill_id, "name": name} for skill_id, name in rng.sample(SKILLS, rng.randint(1, 3))]
+        description = self._text(rng, rng.randint(self.description_size // 2, self.description_size * 3 // 2))
+        status_id, status_name = rng.choice(PROJECT_STATUSES)
+        is_remote = rng.random() < 0.8
+        budget = None
+        if rng.random() < 0.75:
+            currency = rng.choice(CURRENCIES)
+            base = rng.choice([500, 1000, 2000, 3000, 5000, 8000, 15000, 30000])
+            amount = base / (40 if currency != "UAH" else 1)
+            budget = {"amount": round(amount, 2), "currency": currency}
+        links = f"{self.base_url}/projects/{project_id}"
+        project = {
+            "id": project_id,
+            "type": "project",
+            "attributes": {
+                "name": self._text(rng, rng.randint(20, 60)).rstrip("."),
+                "description": description,
+                "description_html": f"<p>{description}</p>",
+                "skills": skills,
+                "status": {"id": status_id, "name": status_name},
+                "budget": budget,
+                "bid_count": rng.randint(0, 40),
+                "is_remote_job": is_remote,
+                "is_premium": rng.random() < 0.1,
+                "is_personal": False,
+                "location": None if is_remote else self._location(rng),
+                "safe_type": rng.choice(SAFE_TYPES),
+                "employer": rng.choice(self.employers),
+                "freelancer": None,
+                "published_at": self._date(rng),
+                "expired_at": (self._now + timedelta(days=rng.randint(1, 30))).isoformat(),
+                "tags": [],
+                "updates": []
+            },
+            "links": {
+                "self": {"api": links, "web": f"https://freelancehunt.com/project/{project_id}.html"},
+                "comments": f"{links}/comments",
+                "bids": f"{links}/bids"
+            }
+        }
+        if self.repost_rate and self.projects and rng.random() < self.repost_rate:
+            self._repost(rng, project)
+        return project
+
+    def _make_freelancer(self, freelancer_id: int) -> Dict[str, Any]:
+        rng = random.Random(freelancer_id)
+        person = self._make_person(freelancer_id, "freelancer")
+        cv = self._text(rng, rng.randint(200, 1500))
+        return {
+            "id": freelancer_id,
+            "type": "freelancer",
+            "attributes": {
+                "login": person["login"],
+                "first_name": person["first_name"],
+                "last_name": person["last_name"],
+                "avatar": person["avatar"],
+                "birth_date": None,
+                "rating": rng.randint(0, 5000),
+                "rating_position": rng.randint(1, 20000),
+                "arbitrages": rng.randint(0, 2),
+                "positive_reviews": rng.randint(0, 150),
+                "negative_reviews": rng.randint(0, 5),
+                "answered_average_minutes": rng.randint(5, 600),
+                "is_plus_active": rng.random() < 0.3,
+                "is_online": rng.random() < 0.2,
+                "location": self._location(rng),
+                "verification": {"identity": rng.random() < 0.5, "phone": True},
+                "status": {"id": 40, "name": "Свободен для работы"},
+                "cv": cv,
+                "cv_html": f"<p>{cv}</p>",
+                "skills": [{"id": skill_id, "name": name} for skill_id, name in rng.sample(SKILLS, rng.randint(2, 8))],
+                "created_at": self._date(rng, 3000),
+                "visited_at": self._date(rng, 3)
+            },
+            "links": {"self": {"api": f"{self.base_url}/freelancers/{freelancer_id}"}}
+        }
+
+    def _repost(self, rng: random.Random, project: Dict[str, Any]) -> None:
+        """Повторная публикация одного из прежних проектов того же заказчика с мелкими правками"""
+        original = self.projects[rng.choice(list(self.projects))]["attributes"]
+        words = original["description"].split(" ")
+        for _ in range(max(1, len(words) // 40)):
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+        description = " ".join(words)
+        project["attributes"].update({
+            "name": original["name"],
+            "description": description,
+            "description_html": f"<p>{description}</p>",
+            "skills": original["skills"],
+            "employer": original["employer"]
+        })
+
+    def _make_contest(self, contest_id: int) -> Dict[str, Any]:
+        rng = random.Random(contest_id)
+        skill_id, skill_name = rng.choice(SKILLS)
+        description = self._text(rng, self.description_size)
+        return {
+            "id": contest_id,
+            "type": "contest",
+            "attributes": {
+                "name": self._text(rng, 40).rstrip("."),
+                "description": description,
+                "description_html": f"<p>{description}</p>",
+                "skill": {"id": skill_id, "name": skill_name},
+                "status": {"id": 100, "name": "Прием работ"},
+                "budget": {"amount": rng.choice([1000, 2000, 5000]), "currency": "UAH"},
+                "application_count": rng.randint(0, 80),
+                "published_at": self._date(rng),
+                "duration_days": rng.randint(3, 14),
+                "employer": rng.choice(self.employers),
+                "tags": [],
+                "updates": []
+            },
+            "links": {"self": {"api": f"{self.base_url}/contests/{contest_id}"}}
+        }
+
+    def _make_thread(self, thread_id: int) -> Dict[str, Any]:
+        rng = random.Random(thread_id)
+        participant = {key: value for key, value in rng.choice(self.employers).items() if key != "self"}
+        me = {key: value for key, value in self._make_person(100, "freelancer").items() if key != "self"}
+        return {
+            "id": thread_id,
+            "type": "thread",
+            "attributes": {
+                "subject": self._text(rng, 30).rstrip("."),
+                "updated_at": self._date(rng, 30),
+                "messages_count": rng.randint(1, 60),
+                "is_unread": rng.random() < 0.3,
+                "participants": {"from": participant, "to": me}
+            }
+        }
+
+    def _project_bids(self, project_id: int) -> List[Dict[str, Any]]:
+        bids = self._bids.get(project_id)
+        if bids is not None:
+            return bids
+        rng = random.Random(project_id * 7919)
+        project = self.projects[project_id]["attributes"]
+        currency = (project["budget"] or {}).get("currency", "UAH")
+        base = (project["budget"] or {}).get("amount") or rng.choice([1000, 3000, 8000])
+        freelancer_ids = list(self.freelancers)
+        count = min(project["bid_count"], len(freelancer_ids))
+        winner = rng.randrange(count) if count and project["status"]["id"] == 13 else None
+        bids = []
+        for index, freelancer_id in enumerate(rng.sample(freelancer_ids, count)):
+            freelancer = self.freelancers[freelancer_id]["attributes"]
+            bids.append({
+                "id": project_id * 100 + index,
+                "type": "bid",
+                "attributes": {
+                    "days": rng.randint(1, 30),
+                    "safe_type": rng.choice(SAFE_TYPES),
+                    "budget": {"amount": round(base * rng.uniform(0.5, 1.6), 2), "currency": currency},
+                    "comment": self._text(rng, rng.randint(80, 600)),
+                    "status": "active",
+                    "is_hidden": False,
+                    "is_winner": index == winner,
+                    "freelancer": {
+                        "id": freelancer_id,
+                        "type": "freelancer",
+                        "login": freelancer["login"],
+                        "first_name": freelancer["first_name"],
+                        "last_name": freelancer["last_name"],
+                        "avatar": freelancer["avatar"]
+                    },
+                    "project": {"id": project_id, "type": "project", "name": project["name"]},
+                    "attachment": None,
+                    "published_at": self._date(rng, 10)
+                }
+            })
+        self._bids[project_id] = bids
+        return bids
+
+    # ------------------------------------------------
+    # ASGI
+    # ------------------------------------------------
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        path = re.sub(r"^/v2(?=/)", "", scope["path"]).rstrip("/") or "/"
+        query = dict(parse_qsl(scope.get("query_string", b"").decode()))
+        status, payload, headers = await self.handle(scope["method"], path, query, body)
+
+        content = json.dumps(payload, ensure_ascii=False).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(content)).encode())]
+            + [(name.encode(), value.encode()) for name, value in headers.items()]
+        })
+        await send({"type": "http.response.body", "body": content})
+
+    async def handle(
+        self, method: str, path: str, query: Dict[str, str], body: bytes
+    ) -> Tuple[int, Any, Dict[str, str]]:
+        self.request_count += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter)))
+
+        headers = self._rate_limit_headers()
+        if self.rate_limit and int(headers["X-Ratelimit-Remaining"]) < 0:
+            headers["X-Ratelimit-Remaining"] = "0"
+            headers["Retry-After"] = str(int(self._window_started + self.rate_window - time.monotonic()) + 1)
+            return 429, {"error": {"status": 429, "title": "Too Many Requests"}}, headers
+        if self.rate_limit_rate and self._random.random() < self.rate_limit_rate:
+            headers["Retry-After"] = "1"
+            return 429, {"error": {"status": 429, "title": "Too Many Requests"}}, headers
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self._random.choice([500, 502, 503]), {"error": {"title": "Internal Server Error"}}, headers
+
+        for route_method, pattern, handler_name in ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                status, payload = getattr(self, handler_name)(query, body, *map(int, match.groups()))
+                return status, payload, headers
+        return 404, {"error": {"status": 404, "title": "Not Found"}}, headers
+
+    def _rate_limit_headers(self) -> Dict[str, str]:
+        now = time.monotonic()
+        if now - self._window_started >= self.rate_window:
+            self._window_started = now
+            self._window_count = 0
+        self._window_count += 1
+        limit = self.rate_limit or 10000
+        return {"X-Ratelimit-Limit": str(limit), "X-Ratelimit-Remaining": str(limit - self._window_count)}
+
+    # ------------------------------------------------
+    # Пагинация и ответы
+    # ------------------------------------------------
+
+    def _page(self, path: str, query: Dict[str, str], items: List[Any]) -> Dict[str, Any]:
+        number = max(1, int(query.get("page[number]", 1)))
+        size = min(50, max(1, int(query.get("page[size]", 10))))
+        last = max(1, -(-len(items) // size))
+
+        def link(page_number: int) -> str:
+            params = {key: value for key, value in query.items() if key != "page[number]"}
+            params["page[number]"] = str(page_number)
+            return f"{self.base_url}{path}?{urlencode(params)}"
+
+        links = {"self": link(number), "first": link(1), "last": link(last)}
+        if number > 1:
+            links["prev"] = link(number - 1)
+        if number < last:
+            links["next"] = link(number + 1)
+
+        data = items[(number - 1) * size:number * size]
+        return {
+            "data": data,
+            "links": links,
+            "meta": {"pagination": {"total": len(items), "count": len(data), "current_page": number, "total_pages": last}}
+        }
+
+    @route("GET", "/projects")
+    def list_projects(self, query: Dict[str, str], body: bytes) -> Tuple[int, Any]:
+        projects = list(self.projects.values())
+        if "filter[skill_id]" in query:
+            skill_ids = {int(value) for value in query["filter[skill_id]"].split(",") if value}
+            projects = [p for p in projects if skill_ids & {s["id"] for s in p["attributes"]["skills"]}]
+        if "filter[employer_id]" in query:
+            employer_id = int(query["filter[employer_id]"])
+            projects = [p for p in projects if p["attributes"]["employer"]["id"] == employer_id]
+        if "filter[status_id]" in query:
+            status_id = int(query["filter[status_id]"])
+            projects = [p for p in projects if p["attributes"]["status"]["id"] == status_id]
+        if query.get("filter[only_remote]", "").lower() in ("1", "true"):
+            projects = [p for p in projects if p["attributes"]["is_remote_job"]]
+        if "filter[location_id]" in query:
+            # ID страны или города; удаленные проекты без локации не подходят
+            location_id = int(query["filter[location_id]"])
+            projects = [
+                p for p in projects
+                if p["attributes"]["location"]
+                and location_id in (p["attributes"]["location"]["country"]["id"], p["attributes"]["location"]["city"]["id"])
+            ]
+        for key, compare in (("filter[budget_from]", float.__ge__), ("filter[budget_to]", float.__le__)):
+            if key in query:
+                limit = float(query[key])
+                projects = [
+                    p for p in projects
+                    if p["attributes"]["budget"] and compare(float(p["attributes"]["budget"]["amount"]), limit)
+                ]
+        projects.sort(key=lambda p: p["attributes"]["published_at"], reverse=True)
+        return 200, self._page("/projects", query, projects)
+
+    @route("GET", r"/projects/(\d+)")
+    def get_project(self, query: Dict[str, str], body: bytes, project_id: int) -> Tuple[int, Any]:
+        if project_id not in self.projects:
+            return 404, {"error": {"status": 404, "title": "Not Found"}}
+        return 200, {"data": self.projects[project_id]}
+
+    @route("GET", r"/projects/(\d+)/bids")
+    def list_bids(self, query: Dict[str, str], body: bytes, project_id: int) -> Tuple[int, Any]:
+        if project_id not in self.projects:
+            return 404, {"error": {"status": 404, "title": "Not Found"}}
+        bids = self._project_bids(project_id)
+        if "is_winner" in query:
+            bids = [b for b in bids if int(b["attributes"]["is_winner"]) == int(query["is_winner"])]
+        if "status" in query:
+            bids = [b for b in bids if b["attributes"]["status"] == query["status"]]
+        page = self._page(f"/projects/{project_id}/bids", query, bids)
+        page.pop("meta")
+        return 200, page
+
+    @route("POST", r"/projects/(\d+)/bids")
+    def create_bid(self, query: Dict[str, str], body: bytes, project_id: int) -> Tuple[int, Any]:
+        if project_id not in self.projects:
+            return 404, {"error": {"status": 404, "title": "Not Found"}}
+        request = json.loads(body or b"{}")
+        bid = {
+            "id": 900000 + len(self.my_bids),
+            "type": "bid",
+            "attributes": {
+                "days": request.get("days"),
+                "safe_type": request.get("safe_type"),
+                "budget": request.get("budget"),
+                "comment": request.get("comment"),
+                "status": "active",
+                "is_hidden": bool(request.get("is_hidden")),
+                "is_winner": False,
+                "project": {"id": project_id, "type": "project", "name": self.projects[project_id]["attributes"]["name"]},
+                "published_at": self._now.isoformat()
+            }
+        }
+        self.my_bids.append(bid)
+        me = self.freelancers[self.my_id]["attributes"]
+        freelancer = {
+            "id": self.my_id, "type": "freelancer", "login": me["login"],
+            "first_name": me["first_name"], "last_name": me["last_name"], "avatar": me["avatar"]
+        }
+        self._project_bids(project_id).append({**bid, "attributes": {**bid["attributes"], "freelancer": freelancer}})
+        return 201, {"data": bid}
+
+    @route("GET", r"/projects/(\d+)/comments")
+    def list_comments(self, query: Dict[str, str], body: bytes, project_id: int) -> Tuple[int, Any]:
+        if project_id not in self.projects:
+            return 404, {"error": {"status": 404, "title": "Not Found"}}
+        rng = random.Random(project_id * 31)
+        comments = []
+        for index in range(rng.randint(0, 12)):
+            message = self._text(rng, rng.randint(40, 300))
+            comments.append({
+                "id": project_id * 1000 + index,
+                "type": "project_comment",
+                "attributes": {
+                    "message": message,
+                    "message_html": f"<p>{message}</p>",
+                    "likes": rng.randint(0, 5),
+                    "level": 1,
+                    "author": self._make_person(rng.choice(list(self.freelancers)), "freelancer"),
+                    "created_at": self._date(rng, 10)
+                }
+            })
+        page = self._page(f"/projects/{project_id}/comments", query, comments)
+        page.pop("meta")
+        return 200, page
+
+    @route("GET", r"/freelancers/(\d+)")
+    def get_freelancer(self, query: Dict[str, str], body: bytes, freelancer_id: int) -> Tuple[int, Any]:
+        if freelancer_id not in self.freelancers:
+            return 404, {"error": {"status": 404, "title": "Not Found"}}
+        return 200, {"data": self.freelancers[freelancer_id]}
+
+    @route("GET", r"/freelancers/(\d+)/portfolio")
+    def list_portfolio(self, query: Dict[str, str], body: bytes, freelancer_id: int) -> Tuple[int, Any]:
+        if freelancer_id not in self.freelancers:
+            return 404, {"error": {"status": 404, "title": "Not Found"}}
+        rng = random.Random(freelancer_id * 17)
+        items = []
+        for index in range(rng.randint(0, 20)):
+            skill_id, skill_name = rng.choice(SKILLS)
+            items.append({
+                "id": freelancer_id * 1000 + index,
+                "type": "snippet",
+                "name": self._text(rng, 25).rstrip("."),
+                "file_type": "image",
+                "skill": {"id": skill_id, "name": skill_name},
+                "comment": self._text(rng, 80),
+                "url": f"https://freelancehunt.com/freelancer/snippet/{freelancer_id}/{index}.html",
+                "views": rng.randint(0, 3000),
+                "votes": rng.randint(0, 50),
+                "created_at": self._date(rng, 1000)
+            })
+        page = self._page(f"/freelancers/{freelancer_id}/portfolio", query, items)
+        page.pop("meta")
+        return 200, page
+
+    @route("GET", r"/freelancers/(\d+)/reviews")
+    def list_reviews(self, query: Dict[str, str], body: bytes, freelancer_id: int) -> Tuple[int, Any]:
+        if freelancer_id not in self.freelancers:
+            return 404, {"error": {"status": 404, "title": "Not Found"}}
+        rng = random.Random(freelancer_id * 23)
+        reviews = [
+            {
+                "id": freelancer_id * 1000 + index,
+                "type": "review",
+                "attributes": {
+                    "grades": {"quality": rng.randint(7, 10), "professionalism": rng.randint(7, 10)},
+                    "comment": self._text(rng, rng.randint(40, 250)),
+                    "published_at": self._date(rng, 700),
+                    "from": self._make_person(rng.choice(self.employers)["id"], "employer")
+                }
+            }
+            for index in range(rng.randint(0, 25))
+        ]
+        page = self._page(f"/freelancers/{freelancer_id}/reviews", query, reviews)
+        page.pop("meta")
+        return 200, page
+
+    @route("GET", "/my/profile")
+    def my_profile(self, query: Dict[str, str], body: bytes) -> Tuple[int, Any]:
+        return 200, {"data": self.freelancers[self.my_id]}
+
+    @route("GET", "/my/bids")
+    def list_my_bids(self, query: Dict[str, str], body: bytes) -> Tuple[int, Any]:
+        page = self._page("/my/bids", query, self.my_bids)
+        page.pop("meta")
+        return 200, page
+
+    @route("GET", "/contests")
+    def list_contests(self, query: Dict[str, str], body: bytes) -> Tuple[int, Any]:
+        contests = list(self.contests.values())
+        if "filter[skill_id]" in query:
+            skill_ids = {int(value) for value in query["filter[skill_id]"].split(",") if value}
+            contests = [c for c in contests if c["attributes"]["skill"]["id"] in skill_ids]
+        return 200, self._page("/contests", query, contests)
+
+    @route("GET", r"/contests/(\d+)")
+    def get_contest(self, query: Dict[str, str], body: bytes, contest_id: int) -> Tuple[int, Any]:
+        if contest_id not in self.contests:
+            return 404, {"error": {"status": 404, "title": "Not Found"}}
+        return 200, {"data": self.contests[contest_id]}
+
+    @route("GET", "/threads")
+    def list_threads(self, query: Dict[str, str], body: bytes) -> Tuple[int, Any]:
+        return 200, self._page("/threads", query, self.threads)
+
+    @route("GET", "/skills")
+    def list_skills(self, query: Dict[str, str], body: bytes) -> Tuple[int, Any]:
+        return 200, {"data": [{"id": skill_id, "name": name} for skill_id, name in SKILLS]}
+
+    @route("GET", "/countries")
+    def list_countries(self, query: Dict[str, str], body: bytes) -> Tuple[int, Any]:
+        return 200, {
+            "data": [{"id": country_id, "iso2": iso2, "name": name} for country_id, iso2, name in COUNTRIES],
+            "links": {"self": f"{self.base_url}/countries"}
+        }
+
+    @route("GET", r"/cities/(\d+)")
+    def list_cities(self, query: Dict[str, str], body: bytes, country_id: int) -> Tuple[int, Any]:
+        if country_id not in CITIES:
+            return 404, {"error": {"status": 404, "title": "Not Found"}}
+        return 200, {
+            "data": [
+                {"id": country_id * 100 + index + 1, "name": name}
+                for index, name in enumerate(CITIES[country_id])
+            ]
+        }
+
+
+@contextmanager
+def stub_process(**options: Any) -> Iterator[str]:
+    """Запустить заглушку отдельным процессом на свободном порту; возвращает base_url"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    args = [sys.executable, os.path.abspath(__file__), "--port", str(port)]
+    for name, value in options.items():
+        args += [f"--{name.replace('_', '-')}", str(value)]
+
+    process = subprocess.Popen(args)
+    try:
+        deadline = time.monotonic() + 15
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("Stub API failed to start")
+                time.sleep(0.05)
+        yield f"http://127.0.0.1:{port}/v2"
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Local FreelanceHunt API v2 stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--description-size", type=int, default=600, help="Average project description length in chars")
+    parser.add_argument("--repost-rate", type=float, default=0.0, help="Share of projects that repost an earlier project")
+    parser.add_argument("--latency", type=float, default=0.0, help="Added latency per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform latency jitter in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 5xx")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--rate-limit", type=int, default=0, help="Requests allowed per --rate-window (0 - unlimited)")
+    parser.add_argument("--rate-window", type=float, default=3600.0)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    app = StubAPI(
+        seed=args.seed,
+        projects=args.projects,
+        description_size=args.description_size,
+        repost_rate=args.repost_rate,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        base_url=f"http://{args.host}:{args.port}/v2"
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 
 import asyncio
+import json
 import sys
-from typing import Optional
+import time
+from typing import Any, Dict, Optional
 from contextlib import AsyncExitStack
 
 from mcp import ClientSession, StdioServerParameters
@@ -10,15 +12,19 @@ from mcp.client.stdio import stdio_client
 
 class MCPTestClient:
     
-    def __init__(self):
+    def __init__(self, record_path: Optional[str] = None):
         self.session: Optional[ClientSession] = None
         self.exit_stack = AsyncExitStack()
+        # Запись вызовов для loadgen.py (JSON lines: session, tool, arguments, at)
+        self.record_path = record_path
+        self.session_id = f"{int(time.time())}-{id(self):x}"
+        self._started = time.monotonic()
     
-    async def connect_to_server(self, server_script_path: str):
+    async def connect_to_server(self, server_script_path: str, env: Optional[Dict[str, str]] = None, quiet: bool = False):
         server_params = StdioServerParameters(
-            command="python",
+            command=sys.executable,
             args=[server_script_path],
-            env=None
+            env=env
         )
         
         stdio_transport = await self.exit_stack.enter_async_context(
@@ -30,6 +36,8 @@ class MCPTestClient:
         )
         
         await self.session.initialize()
+        if quiet:
+            return
         
         # List available tools
         response = await self.session.list_tools()
@@ -38,6 +46,19 @@ class MCPTestClient:
         print("Available tools:", [tool.name for tool in tools])
         print()
     
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Вызвать tool и, если включена запись, дописать вызов в файл"""
+        if self.record_path:
+            record = {
+                "session": self.session_id,
+                "tool": tool_name,
+                "arguments": arguments,
+                "at": round(time.monotonic() - self._started, 3)
+            }
+            with open(self.record_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return await self.session.call_tool(tool_name, arguments)
+    
     async def test_tools(self):
         if not self.session:
             print("Error: Not connected to server")
@@ -51,10 +72,10 @@ class MCPTestClient:
             print(result.content[0].text[:500] + "..." if len(result.content[0].text) > 500 else result.content[0].text)
             print()
             
-            # Test getting locations list  
-            print("=== Testing get_locations ===")
-            result = await self.session.call_tool("get_locations", {})
-            print("Locations result:")
+            # Test getting countries list  
+            print("=== Testing get_countries ===")
+            result = await self.session.call_tool("get_countries", {})
+            print("Countries result:")
             print(result.content[0].text[:500] + "..." if len(result.content[0].text) > 500 else result.content[0].text)
             print()
             
@@ -69,13 +90,10 @@ class MCPTestClient:
             print(result.content[0].text[:1000] + "..." if len(result.content[0].text) > 1000 else result.content[0].text)
             print()
             
-            # Test searching freelancers
-            print("=== Testing search_freelancers ===")
-            result = await self.session.call_tool("search_freelancers", {
-                "page": 1,
-                "per_page": 3
-            })
-            print("Freelancers search result:")
+            # Test getting own profile
+            print("=== Testing get_my_profile ===")
+            result = await self.session.call_tool("get_my_profile", {})
+            print("Profile result:")
             print(result.content[0].text[:1000] + "..." if len(result.content[0].text) > 1000 else result.content[0].text)
             print()
             
@@ -91,10 +109,10 @@ class MCPTestClient:
         print("Available commands:")
         print("1. search_projects [page] [per_page] [only_remote]")
         print("2. get_project <project_id>")
-        print("3. search_freelancers [page] [per_page]")
+        print("3. get_project_bids <project_id>")
         print("4. get_freelancer <freelancer_id>")
         print("5. get_skills")
-        print("6. get_locations")
+        print("6. get_countries")
         print("7. quit")
         print()
         
@@ -126,11 +144,11 @@ class MCPTestClient:
                         continue
                     args["project_id"] = int(parts[1])
                 
-                elif tool_name == "search_freelancers":
-                    if len(parts) > 1:
-                        args["page"] = int(parts[1])
-                    if len(parts) > 2:
-                        args["per_page"] = int(parts[2])
+                elif tool_name == "get_project_bids":
+                    if len(parts) < 2:
+                        print("Error: project_id is required")
+                        continue
+                    args["project_id"] = int(parts[1])
                 
                 elif tool_name == "get_freelancer":
                     if len(parts) < 2:
@@ -138,7 +156,7 @@ class MCPTestClient:
                         continue
                     args["freelancer_id"] = int(parts[1])
                 
-                elif tool_name in ["get_skills", "get_locations"]:
+                elif tool_name in ["get_skills", "get_countries"]:
                     pass  # No arguments needed
                 
                 else:
@@ -146,7 +164,7 @@ class MCPTestClient:
                     continue
                 
                 # Call the tool
-                result = await self.session.call_tool(tool_name, args)
+                result = await self.call_tool(tool_name, args)
                 print("\\nResult:")
                 print(result.content[0].text)
                 print("\\n" + "="*50)
@@ -162,15 +180,17 @@ class MCPTestClient:
 
 async def main():
     if len(sys.argv) < 2:
-        print("Usage: python client.py <path_to_server_script> [test|interactive]")
+        print("Usage: python client.py <path_to_server_script> [test|interactive] [record_file.jsonl]")
         print("  test - Run automated tests")
         print("  interactive - Run interactive mode (default)")
+        print("  record_file.jsonl - append every interactive call for replay with loadgen.py")
         sys.exit(1)
     
     server_path = sys.argv[1]
     mode = sys.argv[2] if len(sys.argv) > 2 else "interactive"
+    record_path = sys.argv[3] if len(sys.argv) > 3 else None
     
-    client = MCPTestClient()
+    client = MCPTestClient(record_path=record_path)
     try:
         await client.connect_to_server(server_path)
         
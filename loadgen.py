@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# ================================================
+# Генератор нагрузки на MCP сервер
+# ================================================
+#
+# Каждая сессия - отдельный процесс server.py по stdio (MCPTestClient), поэтому
+# счетчик upstream-запросов из get_server_stats относится ровно к одной сессии.
+#
+#     python loadgen.py --stub --sessions 20 --calls 30 --think exp:0.5 --output load.json
+#     python loadgen.py --mix calls.jsonl --think recorded --sessions 5
+#
+# Смесь вызовов (--mix):
+#   *.json  - {"calls": [{"tool": ..., "arguments": {...}, "weight": 3}, ...]},
+#             каждая сессия выбирает --calls вызовов по весам
+#   *.jsonl - записанные вызовы (python client.py server.py interactive calls.jsonl),
+#             записанные сессии раздаются по кругу
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional
+
+from client import MCPTestClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+from common import percentile  # noqa: E402
+from stub_api import stub_process  # noqa: E402
+
+
+# Типичная сессия агента на сидированных данных stub_api
+DEFAULT_MIX: List[Dict[str, Any]] = [
+    {"tool": "search_projects", "arguments": {"per_page": 10}, "weight": 6},
+    {"tool": "search_projects", "arguments": {"page": 2, "per_page": 10, "only_remote": True}, "weight": 2},
+    {"tool": "get_project", "arguments": {"project_id": 1000}, "weight": 5},
+    {"tool": "get_project_bids", "arguments": {"project_id": 1000}, "weight": 2},
+    {"tool": "get_project_comments", "arguments": {"project_id": 1000}, "weight": 1},
+    {"tool": "get_freelancer", "arguments": {"freelancer_id": 100}, "weight": 2},
+    {"tool": "get_my_bids", "arguments": {}, "weight": 1},
+    {"tool": "get_skills", "arguments": {}, "weight": 1},
+    {"tool": "search_contests", "arguments": {}, "weight": 1}
+]
+
+# Префиксы ошибок в ответах server.py (дедлайн - "Error: Tool '...' exceeded deadline")
+ERROR_PREFIXES = ("Error:", "FreelanceHunt API Error:", "Unexpected error:")
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, Optional[float]]:
+    def ms(value: Optional[float]) -> Optional[float]:
+        return round(value * 1000, 3) if value is not None else None
+
+    return {
+        "p50_ms": ms(percentile(latencies, 0.50)),
+        "p95_ms": ms(percentile(latencies, 0.95)),
+        "p99_ms": ms(percentile(latencies, 0.99)),
+        "max_ms": ms(max(latencies)) if latencies else None
+    }
+
+
+# ================================================
+# Смесь вызовов и время на размышление
+# ================================================
+
+def load_mix(path: Optional[str]) -> Dict[str, Any]:
+    """Возвращает {"weighted": [...]} или {"recorded": [[call, ...], ...]}"""
+    if not path:
+        return {"weighted": DEFAULT_MIX}
+
+    if path.endswith(".jsonl"):
+        sessions: Dict[str, List[Dict[str, Any]]] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    call = json.loads(line)
+                    sessions.setdefault(str(call.get("session", "default")), []).append(call)
+        if not sessions:
+            raise ValueError(f"No calls recorded in {path}")
+        return {"recorded": [sorted(calls, key=lambda call: call.get("at", 0)) for calls in sessions.values()]}
+
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    calls = data["calls"] if isinstance(data, dict) else data
+    if not calls:
+        raise ValueError(f"No calls in {path}")
+    return {"weighted": calls}
+
+
+def session_plan(mix: Dict[str, Any], index: int, calls: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """Последовательность вызовов сессии; для записанной смеси сохраняются исходные промежутки"""
+    if "recorded" in mix:
+        recorded = mix["recorded"][index % len(mix["recorded"])]
+        plan = []
+        previous_at = recorded[0].get("at", 0)
+        for call in recorded:
+            plan.append({**call, "gap": max(0.0, call.get("at", previous_at) - previous_at)})
+            previous_at = call.get("at", previous_at)
+        return plan
+
+    weighted = mix["weighted"]
+    chosen = rng.choices(weighted, weights=[call.get("weight", 1) for call in weighted], k=calls)
+    return [{"tool": call["tool"], "arguments": call.get("arguments", {}), "gap": 0.0} for call in chosen]
+
+
+def think_sampler(spec: str, rng: random.Random) -> Callable[[Dict[str, Any]], float]:
+    """none | const:S | uniform:A:B | exp:MEAN | lognormal:MEDIAN:SIGMA | recorded[:SCALE]"""
+    kind, _, rest = spec.partition(":")
+    params = [float(value) for value in rest.split(":") if value]
+
+    if kind == "none":
+        return lambda call: 0.0
+    if kind == "const":
+        return lambda call: params[0]
+    if kind == "uniform":
+        return lambda call: rng.uniform(params[0], params[1])
+    if kind == "exp":
+        return lambda call: rng.expovariate(1 / params[0]) if params[0] > 0 else 0.0
+    if kind == "lognormal":
+        return lambda call: rng.lognormvariate(math.log(params[0]), params[1])
+    if kind == "recorded":
+        scale = params[0] if params else 1.0
+        return lambda call: call.get("gap", 0.0) * scale
+    raise ValueError(f"Unknown think time distribution '{spec}'")
+
+
+# ================================================
+# Сессии
+# ================================================
+
+def is_error(result: Any) -> bool:
+    text = result.content[0].text if result.content else ""
+    return bool(result.isError) or text.startswith(ERROR_PREFIXES)
+
+
+async def upstream_requests(client: MCPTestClient) -> Optional[float]:
+    try:
+        result = await client.session.call_tool("get_server_stats", {})
+        return json.loads(result.content[0].text)["upstream_requests"]
+    except (ValueError, KeyError, IndexError):
+        return None
+
+
+async def run_session(
+    index: int,
+    server_path: str,
+    env: Dict[str, str],
+    plan: List[Dict[str, Any]],
+    think: Callable[[Dict[str, Any]], float],
+    start_delay: float
+) -> Dict[str, Any]:
+    await asyncio.sleep(start_delay)
+    client = MCPTestClient()
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    report: Dict[str, Any] = {"session": index, "calls": 0, "errors": 0}
+
+    try:
+        await client.connect_to_server(server_path, env=env, quiet=True)
+        before = await upstream_requests(client)
+        session_started = time.perf_counter()
+
+        for call in plan:
+            delay = think(call)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            started = time.perf_counter()
+            try:
+                result = await client.session.call_tool(call["tool"], call.get("arguments", {}))
+                failed = is_error(result)
+            except Exception:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            if failed:
+                errors[call["tool"]] = errors.get(call["tool"], 0) + 1
+
+        report["duration_s"] = round(time.perf_counter() - session_started, 3)
+        after = await upstream_requests(client)
+        if before is not None and after is not None:
+            report["upstream_requests"] = int(after - before)
+    except Exception as e:
+        report["failed"] = f"{type(e).__name__}: {e}"
+    finally:
+        await client.cleanup()
+
+    report["calls"] = len(latencies)
+    report["errors"] = sum(errors.values())
+    report["errors_by_tool"] = errors
+    report.update(latency_summary(latencies))
+    report["latencies"] = latencies
+    return report
+
+
+async def run_load(args: argparse.Namespace, env: Dict[str, str]) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    mix = load_mix(args.mix)
+    think = think_sampler(args.think, rng)
+
+    started = time.perf_counter()
+    sessions = await asyncio.gather(*(
+        run_session(
+            index,
+            args.server,
+            env,
+            session_plan(mix, index, args.calls, rng),
+            think,
+            args.ramp_up * index / max(1, args.sessions)
+        )
+        for index in range(args.sessions)
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for session in sessions for latency in session.pop("latencies")]
+    calls = sum(session["calls"] for session in sessions)
+    errors = sum(session["errors"] for session in sessions)
+    upstream = [session["upstream_requests"] for session in sessions if "upstream_requests" in session]
+    return {
+        "sessions": args.sessions,
+        "elapsed_s": round(elapsed, 3),
+        "calls": calls,
+        "calls_per_sec": round(calls / elapsed, 2) if elapsed > 0 else None,
+        "error_rate": round(errors / calls, 4) if calls else None,
+        "failed_sessions": sum("failed" in session for session in sessions),
+        "upstream_requests": sum(upstream),
+        "upstream_per_call": round(sum(upstream) / calls, 3) if calls and upstream else None,
+        **latency_summary(latencies),
+        "per_session": sessions
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"Sessions: {report['sessions']}  calls: {report['calls']}  elapsed: {report['elapsed_s']}s  "
+          f"throughput: {report['calls_per_sec']} calls/s")
+    print(f"Latency p50/p95/p99/max: {report['p50_ms']} / {report['p95_ms']} / {report['p99_ms']} / {report['max_ms']} ms")
+    print(f"Error rate: {report['error_rate']}  failed sessions: {report['failed_sessions']}  "
+          f"upstream requests: {report['upstream_requests']} ({report['upstream_per_call']} per call)")
+    print()
+    print(f"{'session':>7} {'calls':>6} {'errors':>6} {'upstream':>8} {'p50_ms':>9} {'p95_ms':>9} {'p99_ms':>9}")
+    for session in report["per_session"]:
+        print(
+            f"{session['session']:>7} {session['calls']:>6} {session['errors']:>6} "
+            f"{str(session.get('upstream_requests', '-')):>8} {str(session['p50_ms']):>9} "
+            f"{str(session['p95_ms']):>9} {str(session['p99_ms']):>9}"
+            + (f"  {session['failed']}" if "failed" in session else "")
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load generator for the FreelanceHunt MCP server")
+    parser.add_argument("--server", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py"))
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--calls", type=int, default=20, help="calls per session for a weighted mix")
+    parser.add_argument("--mix", help="weighted mix (.json) or recorded calls (.jsonl)")
+    parser.add_argument("--think", default="exp:0.2", help="none, const:S, uniform:A:B, exp:MEAN, lognormal:MEDIAN:SIGMA, recorded[:SCALE]")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="seconds over which sessions are started")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--stub", action="store_true", help="run against a local stub_api process")
+    parser.add_argument("--stub-latency", type=float, default=0.02)
+    parser.add_argument("--stub-error-rate", type=float, default=0.0)
+    parser.add_argument("--env", action="append", default=[], metavar="NAME=VALUE", help="extra server environment")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.update(item.split("=", 1) for item in args.env)
+
+    with ExitStack() as stack:
+        if args.stub:
+            base_url = stack.enter_context(stub_process(latency=args.stub_latency, error_rate=args.stub_error_rate))
+            env.update({"FREELANCEHUNT_API_KEY": "stub", "FREELANCEHUNT_BASE_URL": base_url, "REQUEST_DELAY": "0"})
+        report = asyncio.run(run_load(args, env))
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,15 @@ setup(
         "python-dotenv>=1.0.0",
     ],
     extras_require={
+        "analytics": [
+            "numpy>=1.24.0",
+        ],
+        "export": [
+            "pyarrow>=14.0.0",
+        ],
+        "compression": [
+            "zstandard>=0.22.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
@@ -43,6 +52,7 @@ setup(
     entry_points={
         "console_scripts": [
             "freelancehunt-mcp=freelancehunt_mcp.server:main",
+            "freelancehunt-export=freelancehunt_mcp.export:main",
         ],
     },
 )
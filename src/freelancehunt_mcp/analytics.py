@@ -0,0 +1,148 @@
+# ================================================
+# Статистика по бидам (NumPy, если установлен)
+# ================================================
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+QUANTILE_NAMES = ("p10", "p25", "p50", "p75", "p90")
+
+
+def engine() -> str:
+    return "numpy" if np is not None else "python"
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(float(value), 2) if value is not None and not math.isnan(value) else None
+
+
+def _quantiles(values: Sequence[float], qs: Sequence[float]) -> List[float]:
+    """Квантили с линейной интерполяцией, как numpy.quantile по умолчанию"""
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    result = []
+    for q in qs:
+        position = q * last
+        lower = int(math.floor(position))
+        upper = min(lower + 1, last)
+        result.append(ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower))
+    return result
+
+
+def summarize(values: Any) -> Dict[str, Any]:
+    """count, mean, min, p10..p90, max для массива чисел"""
+    if np is not None:
+        array = np.asarray(values, dtype=float)
+        if not array.size:
+            return {"count": 0}
+        quantiles = np.quantile(array, QUANTILES)
+        low, high, mean = array.min(), array.max(), array.mean()
+    else:
+        if not values:
+            return {"count": 0}
+        quantiles = _quantiles(values, QUANTILES)
+        low, high, mean = min(values), max(values), sum(values) / len(values)
+
+    return {
+        "count": int(len(values)),
+        "mean": _round(mean),
+        "min": _round(low),
+        **{name: _round(value) for name, value in zip(QUANTILE_NAMES, quantiles)},
+        "max": _round(high)
+    }
+
+
+def _median(values: Any) -> Optional[float]:
+    if not len(values):
+        return None
+    if np is not None:
+        return float(np.median(values))
+    return _quantiles(values, (0.5,))[0]
+
+
+def bid_columns(bids: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Сырые биды API -> колонки; биды с одинаковым ID учитываются один раз"""
+    columns: Dict[str, List[Any]] = {
+        "amount": [], "currency": [], "days": [], "safe_type": [], "is_winner": [], "project_id": []
+    }
+    seen = set()
+    for bid in bids:
+        bid_id = bid.get("id")
+        if bid_id is not None:
+            if bid_id in seen:
+                continue
+            seen.add(bid_id)
+        attributes = bid.get("attributes") or {}
+        budget = attributes.get("budget") or {}
+        amount = budget.get("amount")
+        columns["amount"].append(float(amount) if amount is not None else math.nan)
+        columns["currency"].append(budget.get("currency") or "")
+        columns["days"].append(attributes.get("days"))
+        columns["safe_type"].append(attributes.get("safe_type") or "none")
+        columns["is_winner"].append(bool(attributes.get("is_winner")))
+        columns["project_id"].append((attributes.get("project") or {}).get("id"))
+    return columns
+
+
+def bid_stats(bids: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Квантили бюджета по валютам, распределение сроков, доли safe_type, разница победителей"""
+    columns = bid_columns(bids)
+    total = len(columns["amount"])
+    days = [value for value in columns["days"] if value is not None]
+
+    safe_types: Dict[str, int] = {}
+    for safe_type in columns["safe_type"]:
+        safe_types[safe_type] = safe_types.get(safe_type, 0) + 1
+
+    budgets: Dict[str, Any] = {}
+    winners: Dict[str, Any] = {}
+    if np is not None:
+        amounts = np.asarray(columns["amount"], dtype=float)
+        currencies = np.asarray(columns["currency"], dtype=object)
+        is_winner = np.asarray(columns["is_winner"], dtype=bool)
+        valid = ~np.isnan(amounts) & (currencies != "")
+        for currency in sorted(set(currencies[valid])):
+            mask = valid & (currencies == currency)
+            budgets[currency] = summarize(amounts[mask])
+            winners[currency] = _winner_spread(amounts[mask & is_winner], amounts[mask & ~is_winner])
+    else:
+        by_currency: Dict[str, Dict[bool, List[float]]] = {}
+        for amount, currency, winner in zip(columns["amount"], columns["currency"], columns["is_winner"]):
+            if currency and not math.isnan(amount):
+                by_currency.setdefault(currency, {True: [], False: []})[winner].append(amount)
+        for currency in sorted(by_currency):
+            groups = by_currency[currency]
+            budgets[currency] = summarize(groups[True] + groups[False])
+            winners[currency] = _winner_spread(groups[True], groups[False])
+
+    return {
+        "bids": total,
+        "projects": len({project_id for project_id in columns["project_id"] if project_id is not None}),
+        "budget_by_currency": budgets,
+        "days": summarize(days),
+        "safe_type": {
+            name: {"count": count, "share": round(count / total, 3)}
+            for name, count in sorted(safe_types.items(), key=lambda item: -item[1])
+        },
+        "winners": {currency: spread for currency, spread in winners.items() if spread["winners"]},
+        "engine": engine()
+    }
+
+
+def _winner_spread(winner_amounts: Any, other_amounts: Any) -> Dict[str, Any]:
+    winner_median = _median(winner_amounts)
+    other_median = _median(other_amounts)
+    return {
+        "winners": int(len(winner_amounts)),
+        "winner_median": _round(winner_median),
+        "others_median": _round(other_median),
+        # < 1: побеждают ставки дешевле типичной
+        "winner_to_others": round(winner_median / other_median, 3) if winner_median and other_median else None
+    }
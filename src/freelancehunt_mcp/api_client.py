@@ -1,42 +1,150 @@
-
+from __future__ import annotations
 
 import asyncio
+import math
 import os
-from typing import List, Optional, Dict, Any
+import re
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlencode
 
 import httpx
 from pydantic import ValidationError
 
-from .models import (
-    Project, 
-    ProjectsListResponse, 
-    FreelancerProfile,
-    SearchFilters,
-    Thread,
-    ThreadsListResponse,
-    ProjectCommentsResponse,
-    BidsResponse,
-    CreateBidRequest,
-    Contest,
-    ContestsResponse,
-    CountriesResponse,
-    PortfolioResponse,
-    UserProfile
-)
+from .cache import NegativeCache, ResponseCache, mark_stale, read_snapshot, write_snapshot
+from .cassette import transport_from_env
+from .circuit_breaker import CircuitBreaker
+from .compression import default_codec
+from .deadline import remaining
+from .dedup import DuplicateIndex
+from .employers import EmployerIndex
+from .metrics import endpoint_label, metrics
+from .mirror import LocalMirror, detail_key, read_mirror
+from .price_index import PriceIndex
+from . import progress
+from .resolver import CatalogResolver
+from .tracing import span
+from . import models
+
+# Модели нужны только для аннотаций; в рантайме берутся как models.X при первом разборе
+if TYPE_CHECKING:
+    from .models import (
+        Project,
+        ProjectsListResponse,
+        FreelancerProfile,
+        SearchFilters,
+        Thread,
+        ThreadsListResponse,
+        ProjectCommentsResponse,
+        BidsResponse,
+        CreateBidRequest,
+        Contest,
+        ContestsResponse,
+        CountriesResponse,
+        PortfolioResponse,
+        UserProfile
+    )
 
 
 class FreelanceHuntAPIError(Exception):
     pass
 
 
+class FreelanceHuntUnavailableError(FreelanceHuntAPIError):
+    """API недоступно: 5xx, 429, сетевая ошибка или таймаут"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Секунды до повтора из заголовка Retry-After (или до закрытия circuit breaker)
+        self.retry_after = retry_after
+
+
+class FreelanceHuntNotFoundError(FreelanceHuntAPIError):
+    """404 от API"""
+
+
+class CircuitOpenError(FreelanceHuntUnavailableError):
+    """Circuit breaker разомкнут, запрос не отправлялся"""
+
+
+class DeadlineExceededError(FreelanceHuntAPIError):
+    """Дедлайн вызова истек раньше ответа API"""
+
+
+def endpoint_group(endpoint: str) -> str:
+    """Группа эндпоинтов: первый сегмент пути (/projects/1/bids -> projects)"""
+    return endpoint.strip('/').split('/', 1)[0]
+
+
+# Свежие ответы отдаются из кэша только для справочников; остальное - лишь при сбое API
+DEFAULT_CACHE_TTLS = {
+    'skills': 3600.0,
+    'countries': 3600.0,
+    'cities': 3600.0
+}
+
+
+# Запросы по ID, для которых 404 кэшируется (get_project, get_freelancer, get_contest, get_cities)
+NEGATIVE_CACHE_PATTERN = re.compile(r'^/(projects|freelancers|contests|cities)/\d+$')
+
+
+# Группы, попадающие в снимок кэша: справочники, проекты, собственный профиль и ставки
+DEFAULT_SNAPSHOT_GROUPS = ('skills', 'countries', 'cities', 'projects', 'my')
+
+
+# Максимальный размер страницы API: страницы меньшего размера нарезаются из страниц этого размера
+UPSTREAM_PAGE_SIZE = 50
+
+_PAGE_NUMBER = re.compile(r'page(?:\[|%5B)number(?:\]|%5D)=(\d+)')
+
+
+def _total_pages(response_data: Dict[str, Any]) -> Optional[int]:
+    """Число страниц списка: meta.pagination или номер страницы в links.last"""
+    pagination = (response_data.get('meta') or {}).get('pagination') or {}
+    if pagination.get('total_pages'):
+        return int(pagination['total_pages'])
+    match = _PAGE_NUMBER.search(str((response_data.get('links') or {}).get('last') or ''))
+    return int(match.group(1)) if match else None
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Retry-After в секундах (дата HTTP не поддерживается)"""
+    try:
+        return max(0.0, float(response.headers['Retry-After']))
+    except (KeyError, ValueError):
+        return None
+
+
+def parse_cache_ttls(value: str) -> Dict[str, float]:
+    """CACHE_TTLS=group=seconds,... (например projects=60,skills=86400)"""
+    ttls = dict(DEFAULT_CACHE_TTLS)
+    for item in value.split(','):
+        if '=' in item:
+            group, seconds = item.split('=', 1)
+            ttls[group.strip()] = float(seconds)
+    return ttls
+
+
 class FreelanceHuntClient:
     
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    # OfflineClient отвечает без сети
+    offline = False
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         self.api_key = api_key or os.getenv('FREELANCEHUNT_API_KEY')
         self.base_url = base_url or os.getenv('FREELANCEHUNT_BASE_URL', 'https://api.freelancehunt.com/v2')
         self.request_delay = float(os.getenv('REQUEST_DELAY', '1.0'))
+        self.request_timeout = float(os.getenv('REQUEST_TIMEOUT', '30.0'))
+        # Подмена транспорта httpx (stub_api, MockTransport, кассеты CASSETTE_MODE)
+        self.transport = transport or transport_from_env()
         
+        if not self.api_key and getattr(self.transport, 'offline', False):
+            self.api_key = 'offline'
         if not self.api_key:
             raise ValueError("API key is required. Set FREELANCEHUNT_API_KEY environment variable.")
         
@@ -48,6 +156,127 @@ class FreelanceHuntClient:
         }
         
         self._last_request_time = 0.0
+        
+        self.cache = ResponseCache(
+            int(os.getenv('CACHE_MAX_ENTRIES', '2000')),
+            max_bytes=int(os.getenv('CACHE_MAX_BYTES', '0')),
+            codec=default_codec(),
+            compress_min_bytes=int(os.getenv('CACHE_COMPRESS_MIN_BYTES', '2048')),
+            decoded_entries=int(os.getenv('CACHE_DECODED_ENTRIES', '32'))
+        )
+        self.cache_ttls = parse_cache_ttls(os.getenv('CACHE_TTLS', ''))
+        self.cache_max_staleness = float(os.getenv('CACHE_MAX_STALENESS', '86400'))
+        # Сколько секунд страница API переиспользуется для соседних логических страниц
+        self.page_slice_ttl = float(os.getenv('PAGE_SLICE_TTL', '60'))
+        self.not_found_cache = NegativeCache(float(os.getenv('NEGATIVE_CACHE_TTL', '300')))
+        snapshot_groups = os.getenv('CACHE_SNAPSHOT_GROUPS')
+        self.snapshot_groups = tuple(
+            group.strip() for group in snapshot_groups.split(',') if group.strip()
+        ) if snapshot_groups else DEFAULT_SNAPSHOT_GROUPS
+        self.snapshot_max_entries = int(os.getenv('CACHE_SNAPSHOT_MAX_ENTRIES', '500'))
+        # Все сущности из успешных GET-ответов (офлайн-режим, аналитика) и индексы поверх них
+        self.price_index = PriceIndex()
+        self.duplicates = DuplicateIndex(float(os.getenv('DUPLICATE_THRESHOLD', '0.7')))
+        self.employers = EmployerIndex()
+        self.attach_mirror(LocalMirror())
+        # Названия навыков и локаций -> ID
+        self.resolver = CatalogResolver(self)
+        # Навыки моего профиля для ранжирования проектов (запрашиваются один раз)
+        self._my_skills: Optional[Dict[int, str]] = None
+        self._my_bid_projects: Optional[Set[int]] = None
+        
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breaker_settings = {
+            'failure_ratio': float(os.getenv('CIRCUIT_FAILURE_RATIO', '0.5')),
+            'min_calls': int(os.getenv('CIRCUIT_MIN_CALLS', '5')),
+            'window': int(os.getenv('CIRCUIT_WINDOW', '20')),
+            'slow_call_seconds': float(os.getenv('CIRCUIT_SLOW_CALL', '10.0')),
+            'open_seconds': float(os.getenv('CIRCUIT_OPEN_SECONDS', '30.0')),
+            'half_open_probes': int(os.getenv('CIRCUIT_HALF_OPEN_PROBES', '1'))
+        }
+    
+    def _get_breaker(self, endpoint: str) -> CircuitBreaker:
+        group = endpoint_group(endpoint)
+        breaker = self._breakers.get(group)
+        if breaker is None:
+            breaker = CircuitBreaker(group, **self._breaker_settings)
+            self._breakers[group] = breaker
+        return breaker
+    
+    def attach_mirror(self, mirror: LocalMirror) -> None:
+        """Использовать зеркало и обновлять по нему индексы клиента (уже сохраненное - сразу)"""
+        self.mirror = mirror
+        for index in (self.price_index, self.duplicates, self.employers):
+            for collection, item in mirror.iter_records():
+                index.observe(collection, item)
+            mirror.add_listener(index.observe, index.forget)
+    
+    def collect_gauges(self) -> None:
+        """Обновить gauges состояния клиента перед экспортом метрик"""
+        metrics.set_gauge('cache_entries', len(self.cache))
+        metrics.set_gauge('cache_bytes', self.cache.bytes)
+        metrics.set_gauge('cache_compressed_entries', self.cache.compressed_entries)
+        metrics.set_gauge('negative_cache_entries', len(self.not_found_cache))
+        metrics.set_gauge('negative_cache_stores', self.not_found_cache.stores)
+        metrics.set_gauge('mirror_entries', len(self.mirror))
+        metrics.set_gauge('mirror_evictions', self.mirror.evictions)
+        metrics.set_gauge('duplicate_index_projects', len(self.duplicates))
+        metrics.set_gauge('employer_index_employers', len(self.employers))
+        for group, breaker in self._breakers.items():
+            metrics.set_gauge('circuit_open', int(breaker.state != CircuitBreaker.CLOSED), group=group)
+    
+    async def save_cache_snapshot(self, path: str) -> int:
+        """Записать самые недавние записи нужных групп; возвращает число записей"""
+        # Список собирается в потоке event loop, сериализация и запись - в отдельном потоке
+        entries = [
+            (key, entry) for key, entry in self.cache.recent()
+            if endpoint_group(key.split('?', 1)[0]) in self.snapshot_groups and entry.age <= self.cache_max_staleness
+        ][:self.snapshot_max_entries]
+        await asyncio.to_thread(write_snapshot, path, entries)
+        return len(entries)
+    
+    async def load_cache_snapshot(self, path: str) -> int:
+        """Прогреть кэш из снимка; записи сохраняют исходное время, так что TTL соблюдаются"""
+        entries = await asyncio.to_thread(read_snapshot, path)
+        loaded = 0
+        for key, entry in entries:
+            if entry.age <= self.cache_max_staleness and self.cache.restore(key, entry):
+                loaded += 1
+        metrics.inc('cache_snapshot_loaded_total', loaded)
+        return loaded
+    
+    async def save_mirror(self, path: str) -> int:
+        records = self.mirror.stored_records()
+        return await asyncio.to_thread(self.mirror.save, path, records)
+    
+    async def load_mirror(self, path: str) -> int:
+        records = await asyncio.to_thread(read_mirror, path)
+        return self.mirror.restore(records)
+    
+    async def _wait_for_rate_limit(self, endpoint: str) -> None:
+        # Simple rate limiting
+        current_time = asyncio.get_event_loop().time()
+        delay = self.request_delay - (current_time - self._last_request_time)
+        if delay <= 0:
+            return
+        
+        # Не занимать слот, если дедлайн истечет раньше, чем он освободится
+        left = remaining()
+        if left is not None and delay >= left:
+            raise DeadlineExceededError(
+                f"Deadline exceeded: rate limit wait {delay:.2f}s for {endpoint} exceeds remaining {max(left, 0):.2f}s"
+            )
+        with span('limiter_wait', delay=round(delay, 4)), \
+                metrics.timer('limiter_wait_seconds', endpoint=endpoint_label(endpoint)):
+            await asyncio.sleep(delay)
+    
+    def _request_timeout(self, endpoint: str) -> float:
+        left = remaining()
+        if left is None:
+            return self.request_timeout
+        if left <= 0:
+            raise DeadlineExceededError(f"Deadline exceeded before request to {endpoint}")
+        return min(self.request_timeout, left)
     
     async def _make_request(
         self, 
@@ -55,43 +284,275 @@ class FreelanceHuntClient:
         endpoint: str, 
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
-        json_data: Optional[Dict[str, Any]] = None
+        json_data: Optional[Dict[str, Any]] = None,
+        min_ttl: float = 0.0
     ) -> Dict[str, Any]:
-        # Simple rate limiting
-        current_time = asyncio.get_event_loop().time()
-        if current_time - self._last_request_time < self.request_delay:
-            await asyncio.sleep(self.request_delay - (current_time - self._last_request_time))
+        if method != 'GET':
+            return await self._call_api(method, endpoint, params, json_data or data)
+        
+        key = self.cache.make_key(endpoint, params)
+        group = endpoint_group(endpoint)
+        negative_cacheable = NEGATIVE_CACHE_PATTERN.match(key) is not None
+        ttl = max(self.cache_ttls.get(group, 0.0), min_ttl)
+        with span('cache_lookup', key=key) as lookup_span:
+            if negative_cacheable and self.not_found_cache.contains(key):
+                metrics.inc('cache_requests_total', group=group, result='negative_hit')
+                if lookup_span:
+                    lookup_span.set_attribute('result', 'negative_hit')
+                raise FreelanceHuntNotFoundError("Resource not found.")
+            
+            if ttl > 0:
+                entry = self.cache.get(key, ttl)
+                result = 'hit' if entry is not None else 'miss'
+                metrics.inc('cache_requests_total', group=group, result=result)
+                if lookup_span:
+                    lookup_span.set_attribute('result', result)
+                if entry is not None:
+                    return entry.payload
+        
+        try:
+            response_data = await self._call_api(method, endpoint, params, None)
+        except FreelanceHuntNotFoundError:
+            if negative_cacheable:
+                self.not_found_cache.add(key)
+            raise
+        except FreelanceHuntUnavailableError as e:
+            # Serve stale: последний успешный ответ в пределах CACHE_MAX_STALENESS
+            entry = self.cache.get(key, self.cache_max_staleness)
+            if entry is not None:
+                metrics.inc('cache_requests_total', group=group, result='stale')
+                mark_stale(key, entry.age, str(e))
+                return entry.payload
+            # Ответ по ID вытеснен из кэша, но сущность есть в зеркале (в том числе из списков)
+            mirrored = self._stale_from_mirror(endpoint)
+            if mirrored is None:
+                raise
+            item, age = mirrored
+            metrics.inc('cache_requests_total', group=group, result='stale_mirror')
+            mark_stale(key, age, str(e))
+            return {'data': item}
+        
+        self.cache.set(key, response_data)
+        self.mirror.ingest(endpoint, response_data)
+        return response_data
+    
+    def _stale_from_mirror(self, endpoint: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """(сущность, возраст) из зеркала для запроса по ID в пределах CACHE_MAX_STALENESS"""
+        detail = detail_key(endpoint)
+        if detail is None:
+            return None
+        item, age = self.mirror.get(*detail), self.mirror.age(*detail)
+        if item is None or age is None or age > self.cache_max_staleness:
+            return None
+        return item, age
+    
+    async def _call_api(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        label = endpoint_label(endpoint)
+        breaker = self._get_breaker(endpoint)
+        if not breaker.allow_request():
+            metrics.inc('upstream_errors_total', endpoint=label, error='CircuitOpenError')
+            raise CircuitOpenError(
+                f"API degraded for '{breaker.name}' endpoints, failing fast (retry in {breaker.retry_after():.0f}s)",
+                retry_after=breaker.retry_after()
+            )
         
+        healthy: Optional[bool] = None
+        started = time.monotonic()
+        try:
+            await self._wait_for_rate_limit(endpoint)
+            timeout = self._request_timeout(endpoint)
+            started = time.monotonic()
+            response_data = await self._send_request(method, endpoint, params, json_data, timeout)
+            healthy = True
+            return response_data
+        except DeadlineExceededError as e:
+            metrics.inc('upstream_errors_total', endpoint=label, error=type(e).__name__)
+            raise
+        except FreelanceHuntUnavailableError as e:
+            healthy = False
+            metrics.inc('upstream_errors_total', endpoint=label, error=type(e).__name__)
+            raise
+        except FreelanceHuntAPIError as e:
+            healthy = True  # 4xx: API отвечает штатно
+            metrics.inc('upstream_errors_total', endpoint=label, error=type(e).__name__)
+            raise
+        finally:
+            latency = time.monotonic() - started
+            breaker.record(healthy, latency)
+            if healthy is not None:
+                metrics.observe('upstream_duration_seconds', latency, endpoint=label, method=method)
+    
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        timeout: float
+    ) -> Dict[str, Any]:
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    params=params,
-                    json=json_data or data,
-                    timeout=30.0
+            with span('http', method=method, endpoint=endpoint_label(endpoint), attempt=1) as http_span:
+                response = await self._http_request(method, url, params, json_data, timeout)
+                if http_span:
+                    http_span.set_attribute('status', response.status_code)
+            
+            self._last_request_time = asyncio.get_event_loop().time()
+            
+            label = endpoint_label(endpoint)
+            metrics.inc('upstream_requests_total', endpoint=label, method=method, status=response.status_code)
+            metrics.inc('upstream_request_bytes_total', len(response.request.content), endpoint=label)
+            metrics.inc('upstream_response_bytes_total', len(response.content), endpoint=label)
+            
+            if response.status_code == 401:
+                raise FreelanceHuntAPIError("Unauthorized. Check your API key.")
+            elif response.status_code == 403:
+                raise FreelanceHuntAPIError("Forbidden. Check your API permissions.")
+            elif response.status_code == 404:
+                raise FreelanceHuntNotFoundError("Resource not found.")
+            elif response.status_code == 429:
+                raise FreelanceHuntUnavailableError("Rate limit exceeded. Please wait.", _retry_after(response))
+            elif response.status_code >= 500:
+                raise FreelanceHuntUnavailableError(
+                    f"API error: {response.status_code} - {response.text}", _retry_after(response)
                 )
-                
-                self._last_request_time = asyncio.get_event_loop().time()
-                
-                if response.status_code == 401:
-                    raise FreelanceHuntAPIError("Unauthorized. Check your API key.")
-                elif response.status_code == 403:
-                    raise FreelanceHuntAPIError("Forbidden. Check your API permissions.")
-                elif response.status_code == 404:
-                    raise FreelanceHuntAPIError("Resource not found.")
-                elif response.status_code == 429:
-                    raise FreelanceHuntAPIError("Rate limit exceeded. Please wait.")
-                elif response.status_code >= 400:
-                    raise FreelanceHuntAPIError(f"API error: {response.status_code} - {response.text}")
-                
-                return response.json()
-                
+            elif response.status_code >= 400:
+                raise FreelanceHuntAPIError(f"API error: {response.status_code} - {response.text}")
+            
+            return response.json()
+            
+        except httpx.TimeoutException as e:
+            if timeout < self.request_timeout:
+                raise DeadlineExceededError(f"Deadline exceeded while waiting for {endpoint}")
+            raise FreelanceHuntUnavailableError(f"Request failed: {e}")
         except httpx.RequestError as e:
-            raise FreelanceHuntAPIError(f"Request failed: {e}")
+            raise FreelanceHuntUnavailableError(f"Request failed: {e}")
+    
+    async def _http_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        timeout: float
+    ) -> httpx.Response:
+        async with httpx.AsyncClient(transport=self.transport) as client:
+            return await client.request(
+                method=method,
+                url=url,
+                headers=self.headers,
+                params=params,
+                json=json_data,
+                timeout=timeout
+            )
+    
+    def _parse(self, model: Any, data: Dict[str, Any]) -> Any:
+        with span('parse', model=model.__name__), \
+                metrics.timer('parse_duration_seconds', model=model.__name__):
+            return model(**data)
+    
+    async def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: int = 10,
+        page_size: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Сырые элементы списка со всех страниц (по links.next), не больше max_pages"""
+        items: List[Dict[str, Any]] = []
+        async for _, data in self.iter_pages(endpoint, params, max_pages=max_pages, page_size=page_size):
+            items.extend(data)
+        return items
+    
+    async def iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        start_page: int = 1,
+        max_pages: Optional[int] = None,
+        page_size: int = 50,
+        store: bool = True
+    ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        """(номер страницы, элементы) по links.next; store=False - мимо кэша и зеркала (выгрузки)"""
+        page = start_page
+        while max_pages is None or page < start_page + max_pages:
+            page_params = {**(params or {}), 'page[number]': page, 'page[size]': page_size}
+            if store:
+                response_data = await self._make_request('GET', endpoint, params=page_params)
+            else:
+                response_data = await self._call_api('GET', endpoint, page_params, None)
+            data = response_data.get('data') or []
+            await progress.page_fetched(page, _total_pages(response_data), len(data))
+            if data:
+                yield page, data
+            if not data or not (response_data.get('links') or {}).get('next'):
+                break
+            page += 1
+    
+    def _page_link(self, endpoint: str, params: Dict[str, Any], page: int, per_page: int) -> str:
+        query = {**params, 'page[number]': page, 'page[size]': per_page}
+        return f"{self.base_url.rstrip('/')}/{endpoint.strip('/')}?{urlencode(query)}"
+    
+    async def _get_page(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        page: int = 1,
+        per_page: int = 20
+    ) -> Dict[str, Any]:
+        """Логическая страница per_page элементов, нарезанная из страниц API по UPSTREAM_PAGE_SIZE.
+
+        Страницы API кэшируются не меньше PAGE_SLICE_TTL секунд, поэтому листание маленькими
+        страницами не порождает отдельный запрос на каждую.
+        """
+        per_page = max(1, min(per_page, UPSTREAM_PAGE_SIZE))
+        page = max(1, page)
+        start = (page - 1) * per_page
+        first = start // UPSTREAM_PAGE_SIZE + 1
+        last = (start + per_page - 1) // UPSTREAM_PAGE_SIZE + 1
+
+        items: List[Dict[str, Any]] = []
+        upstream: Dict[str, Any] = {}
+        for number in range(first, last + 1):
+            upstream = await self._make_request(
+                'GET', endpoint,
+                params={**params, 'page[number]': number, 'page[size]': UPSTREAM_PAGE_SIZE},
+                min_ttl=self.page_slice_ttl
+            )
+            data = upstream.get('data') or []
+            items.extend(data)
+            if len(data) < UPSTREAM_PAGE_SIZE or not (upstream.get('links') or {}).get('next'):
+                break
+        if per_page == UPSTREAM_PAGE_SIZE:
+            return upstream
+
+        offset = start - (first - 1) * UPSTREAM_PAGE_SIZE
+        data = items[offset:offset + per_page]
+        has_more = offset + per_page < len(items) or bool((upstream.get('links') or {}).get('next'))
+        total = ((upstream.get('meta') or {}).get('pagination') or {}).get('total')
+        total_pages = max(1, math.ceil(int(total) / per_page)) if total is not None else (None if has_more else page)
+
+        links = {
+            'self': self._page_link(endpoint, params, page, per_page),
+            'first': self._page_link(endpoint, params, 1, per_page)
+        }
+        if total_pages is not None:
+            links['last'] = self._page_link(endpoint, params, total_pages, per_page)
+        if page > 1:
+            links['prev'] = self._page_link(endpoint, params, page - 1, per_page)
+        if has_more:
+            links['next'] = self._page_link(endpoint, params, page + 1, per_page)
+        pagination = {'count': len(data), 'per_page': per_page, 'current_page': page}
+        if total is not None:
+            pagination.update(total=int(total), total_pages=total_pages)
+        return {**upstream, 'data': data, 'links': links, 'meta': {**(upstream.get('meta') or {}), 'pagination': pagination}}
     
     async def search_projects(
         self,
@@ -99,10 +560,7 @@ class FreelanceHuntClient:
         per_page: int = 20,
         filters: Optional[SearchFilters] = None
     ) -> ProjectsListResponse:
-        params = {
-            'page[number]': page,
-            'page[size]': min(per_page, 50)  # API limit
-        }
+        params: Dict[str, Any] = {}
         
         # Add filters if provided
         if filters:
@@ -115,8 +573,8 @@ class FreelanceHuntClient:
                     params[f'filter[{key}]'] = value
         
         try:
-            response_data = await self._make_request('GET', '/projects', params=params)
-            return ProjectsListResponse(**response_data)
+            response_data = await self._get_page('/projects', params, page, per_page)
+            return self._parse(models.ProjectsListResponse, response_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid response format: {e}")
     
@@ -127,7 +585,7 @@ class FreelanceHuntClient:
             project_data = response_data.get('data')
             if not project_data:
                 raise FreelanceHuntAPIError("No project data in response")
-            return Project(**project_data)
+            return self._parse(models.Project, project_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid project data: {e}")
     
@@ -137,7 +595,7 @@ class FreelanceHuntClient:
             response_data = await self._make_request('GET', f'/freelancers/{freelancer_id}')
             # API returns single freelancer in 'data' field
             freelancer_data = response_data.get('data', response_data)
-            return FreelancerProfile(**freelancer_data)
+            return self._parse(models.FreelancerProfile, freelancer_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid freelancer data: {e}")
     
@@ -169,14 +627,11 @@ class FreelanceHuntClient:
         page: int = 1,
         per_page: int = 20
     ) -> ThreadsListResponse:
-        params = {
-            'page[number]': page,
-            'page[size]': min(per_page, 50)  # API limit
-        }
+        params: Dict[str, Any] = {}
         
         try:
-            response_data = await self._make_request('GET', '/threads', params=params)
-            return ThreadsListResponse(**response_data)
+            response_data = await self._get_page('/threads', params, page, per_page)
+            return self._parse(models.ThreadsListResponse, response_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid threads response format: {e}")
         except Exception as e:
@@ -195,9 +650,7 @@ class FreelanceHuntClient:
         status: Optional[str] = None
     ) -> BidsResponse:
         """Получить биды проекта"""
-        params = {
-            'page[number]': page,
-            'page[size]': min(per_page, 50),
+        params: Dict[str, Any] = {
             'include': 'freelancer,project'  # Включить связанные данные
         }
         
@@ -208,8 +661,8 @@ class FreelanceHuntClient:
             params['status'] = status
         
         try:
-            response_data = await self._make_request('GET', f'/projects/{project_id}/bids', params=params)
-            return BidsResponse(**response_data)
+            response_data = await self._get_page(f'/projects/{project_id}/bids', params, page, per_page)
+            return self._parse(models.BidsResponse, response_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid bids data: {e}")
 
@@ -225,6 +678,11 @@ class FreelanceHuntClient:
                 f'/projects/{project_id}/bids',
                 json_data=bid_data.model_dump()
             )
+            if self._my_bid_projects is not None:
+                self._my_bid_projects.add(project_id)
+            # Списки ставок переиспользуются PAGE_SLICE_TTL секунд: новая ставка должна быть видна сразу
+            self.cache.invalidate('/my/bids')
+            self.cache.invalidate(f'/projects/{project_id}/bids')
             return response_data
         except Exception as e:
             raise FreelanceHuntAPIError(f"Failed to create bid: {e}")
@@ -236,14 +694,11 @@ class FreelanceHuntClient:
         per_page: int = 20
     ) -> ProjectCommentsResponse:
         """Получить комментарии проекта"""
-        params = {
-            'page[number]': page,
-            'page[size]': min(per_page, 50)
-        }
+        params: Dict[str, Any] = {}
         
         try:
-            response_data = await self._make_request('GET', f'/projects/{project_id}/comments', params=params)
-            return ProjectCommentsResponse(**response_data)
+            response_data = await self._get_page(f'/projects/{project_id}/comments', params, page, per_page)
+            return self._parse(models.ProjectCommentsResponse, response_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid comments data: {e}")
 
@@ -253,14 +708,11 @@ class FreelanceHuntClient:
         per_page: int = 20
     ) -> BidsResponse:
         """Получить мои биды"""
-        params = {
-            'page[number]': page,
-            'page[size]': min(per_page, 50)
-        }
+        params: Dict[str, Any] = {}
         
         try:
-            response_data = await self._make_request('GET', '/my/bids', params=params)
-            return BidsResponse(**response_data)
+            response_data = await self._get_page('/my/bids', params, page, per_page)
+            return self._parse(models.BidsResponse, response_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid my bids data: {e}")
 
@@ -271,10 +723,28 @@ class FreelanceHuntClient:
             profile_data = response_data.get('data')
             if not profile_data:
                 raise FreelanceHuntAPIError("No profile data in response")
-            return UserProfile(**profile_data)
+            return self._parse(models.UserProfile, profile_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid profile data: {e}")
 
+    async def get_my_skills(self) -> Dict[int, str]:
+        """Навыки моего профиля (ID -> название), закэшированные на время процесса"""
+        if self._my_skills is None:
+            profile = await self.get_my_profile()
+            self._my_skills = {skill.id: skill.name for skill in profile.attributes.skills}
+        return self._my_skills
+
+    async def get_my_bid_project_ids(self) -> Set[int]:
+        """ID проектов с моими ставками: /my/bids загружается один раз за процесс, новые ставки дописываются"""
+        if self._my_bid_projects is None:
+            bids = await self.paginate('/my/bids')
+            self._my_bid_projects = {
+                project_id for project_id in (
+                    ((bid.get('attributes') or {}).get('project') or {}).get('id') for bid in bids
+                ) if project_id is not None
+            }
+        return self._my_bid_projects
+
     async def get_freelancer_portfolio(
         self,
         freelancer_id: int,
@@ -282,14 +752,11 @@ class FreelanceHuntClient:
         per_page: int = 20
     ) -> PortfolioResponse:
         """Получить портфолио фрилансера"""
-        params = {
-            'page[number]': page,
-            'page[size]': min(per_page, 50)
-        }
+        params: Dict[str, Any] = {}
         
         try:
-            response_data = await self._make_request('GET', f'/freelancers/{freelancer_id}/portfolio', params=params)
-            return PortfolioResponse(**response_data)
+            response_data = await self._get_page(f'/freelancers/{freelancer_id}/portfolio', params, page, per_page)
+            return self._parse(models.PortfolioResponse, response_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid portfolio data: {e}")
 
@@ -300,13 +767,10 @@ class FreelanceHuntClient:
         per_page: int = 20
     ) -> List[Dict[str, Any]]:
         """Получить отзывы о фрилансере"""
-        params = {
-            'page[number]': page,
-            'page[size]': min(per_page, 50)
-        }
+        params: Dict[str, Any] = {}
         
         try:
-            response_data = await self._make_request('GET', f'/freelancers/{freelancer_id}/reviews', params=params)
+            response_data = await self._get_page(f'/freelancers/{freelancer_id}/reviews', params, page, per_page)
             return response_data.get('data', [])
         except Exception as e:
             raise FreelanceHuntAPIError(f"Failed to get freelancer reviews: {e}")
@@ -318,17 +782,14 @@ class FreelanceHuntClient:
         skill_ids: Optional[List[int]] = None
     ) -> ContestsResponse:
         """Поиск конкурсов"""
-        params = {
-            'page[number]': page,
-            'page[size]': min(per_page, 50)
-        }
+        params: Dict[str, Any] = {}
         
         if skill_ids:
             params['filter[skill_id]'] = ','.join(map(str, skill_ids))
         
         try:
-            response_data = await self._make_request('GET', '/contests', params=params)
-            return ContestsResponse(**response_data)
+            response_data = await self._get_page('/contests', params, page, per_page)
+            return self._parse(models.ContestsResponse, response_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid contests data: {e}")
 
@@ -339,7 +800,7 @@ class FreelanceHuntClient:
             contest_data = response_data.get('data')
             if not contest_data:
                 raise FreelanceHuntAPIError("No contest data in response")
-            return Contest(**contest_data)
+            return self._parse(models.Contest, contest_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid contest data: {e}")
 
@@ -347,6 +808,6 @@ class FreelanceHuntClient:
         """Получить список стран"""
         try:
             response_data = await self._make_request('GET', '/countries')
-            return CountriesResponse(**response_data)
+            return self._parse(models.CountriesResponse, response_data)
         except ValidationError as e:
             raise FreelanceHuntAPIError(f"Invalid countries data: {e}")
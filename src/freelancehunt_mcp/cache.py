@@ -0,0 +1,298 @@
+# ================================================
+# Кэш ответов API
+# ================================================
+
+import base64
+import contextvars
+import json
+import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from .compression import compress, decompress, open_text
+
+
+class CacheEntry:
+    """Ответ API; крупные ответы хранятся сжатым JSON, разобранный dict держится, пока запись горячая"""
+
+    __slots__ = ("_payload", "_data", "codec", "size", "stored_at")
+
+    def __init__(
+        self,
+        payload: Optional[Dict[str, Any]],
+        stored_at: float,
+        codec: Optional[str] = None,
+        data: Optional[bytes] = None,
+        size: int = 0
+    ):
+        self._payload = payload
+        self._data = data
+        self.codec = codec
+        self.size = len(data) if data is not None else size
+        self.stored_at = stored_at
+
+    @classmethod
+    def build(
+        cls,
+        payload: Dict[str, Any],
+        stored_at: float,
+        codec: Optional[str] = None,
+        min_bytes: int = 0,
+        measure: bool = False
+    ) -> "CacheEntry":
+        """Сжать ответ не меньше min_bytes (размер нужен и для бюджета кэша в байтах)"""
+        if codec is None and not measure:
+            return cls(payload, stored_at)
+        encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if codec is not None and len(encoded) >= min_bytes:
+            used, data = compress(encoded, codec)
+            if used is not None:
+                return cls(None, stored_at, used, data)
+        return cls(payload, stored_at, size=len(encoded))
+
+    @property
+    def compressed(self) -> bool:
+        return self.codec is not None
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        if self._payload is not None:
+            return self._payload
+        return json.loads(decompress(self.codec, self._data))
+
+    def hold(self) -> None:
+        """Разобрать сжатый ответ один раз и отдавать его из памяти"""
+        if self._payload is None:
+            self._payload = json.loads(decompress(self.codec, self._data))
+
+    def release(self) -> None:
+        if self._data is not None:
+            self._payload = None
+
+    @property
+    def data(self) -> Optional[bytes]:
+        return self._data
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+
+class ResponseCache:
+    """LRU-кэш последних успешных GET-ответов (сырые JSON словари, крупные - сжатые)"""
+
+    def __init__(
+        self,
+        max_entries: int = 2000,
+        max_bytes: int = 0,
+        codec: Optional[str] = None,
+        compress_min_bytes: int = 2048,
+        decoded_entries: int = 32
+    ):
+        self.max_entries = max_entries
+        # Бюджет по размеру JSON (сжатого - для сжатых записей); 0 - без ограничения
+        self.max_bytes = max_bytes
+        self.codec = codec
+        self.compress_min_bytes = compress_min_bytes
+        # Последние прочитанные сжатые записи держат разобранный dict (листание страниц,
+        # нарезанных из одной страницы API, не разбирает ее заново)
+        self.decoded_entries = decoded_entries
+        self.bytes = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._decoded: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        key = '/' + endpoint.strip('/')
+        if params:
+            key += '?' + urlencode(sorted(params.items()))
+        return key
+
+    def get(self, key: str, max_age: float) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None or entry.age > max_age:
+            return None
+        self._entries.move_to_end(key)
+        self._hold(key, entry)
+        return entry
+
+    def _hold(self, key: str, entry: CacheEntry) -> None:
+        if not entry.compressed or self.decoded_entries <= 0:
+            return
+        if key in self._decoded:
+            self._decoded.move_to_end(key)
+            return
+        entry.hold()
+        self._decoded[key] = entry
+        while len(self._decoded) > self.decoded_entries:
+            _, cold = self._decoded.popitem(last=False)
+            cold.release()
+
+    def _drop_decoded(self, key: str) -> None:
+        entry = self._decoded.pop(key, None)
+        if entry is not None:
+            entry.release()
+
+    def _build(self, payload: Dict[str, Any], stored_at: float) -> CacheEntry:
+        return CacheEntry.build(payload, stored_at, self.codec, self.compress_min_bytes, measure=self.max_bytes > 0)
+
+    def _put(self, key: str, entry: CacheEntry) -> None:
+        current = self._entries.pop(key, None)
+        if current is not None:
+            self.bytes -= current.size
+            self._drop_decoded(key)
+        self._entries[key] = entry
+        self.bytes += entry.size
+
+    def _full(self) -> bool:
+        return len(self._entries) > self.max_entries or (self.max_bytes > 0 and self.bytes > self.max_bytes)
+
+    def set(self, key: str, payload: Dict[str, Any]) -> None:
+        self._put(key, self._build(payload, time.time()))
+        while self._full() and len(self._entries) > 1:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted.size
+            self._drop_decoded(evicted_key)
+
+    def invalidate(self, endpoint: str) -> int:
+        """Удалить ответы эндпоинта со всеми параметрами (после записи через API); -> число записей"""
+        path = '/' + endpoint.strip('/')
+        keys = [key for key in self._entries if key == path or key.startswith(path + '?')]
+        for key in keys:
+            self.bytes -= self._entries.pop(key).size
+            self._drop_decoded(key)
+        return len(keys)
+
+    def restore(self, key: str, entry: CacheEntry) -> bool:
+        """Добавить запись из снимка, не затирая более свежую и не вытесняя живые записи"""
+        current = self._entries.get(key)
+        if current is not None and current.stored_at >= entry.stored_at:
+            return False
+        if not entry.compressed:
+            entry = self._build(entry.payload, entry.stored_at)
+        if current is None:
+            if len(self._entries) >= self.max_entries:
+                return False
+            if self.max_bytes > 0 and self.bytes + entry.size > self.max_bytes:
+                return False
+        self._put(key, entry)
+        self._entries.move_to_end(key, last=False)
+        return True
+
+    def recent(self) -> List[Tuple[str, CacheEntry]]:
+        """Записи от последних использованных к давним"""
+        return list(reversed(self._entries.items()))
+
+    @property
+    def compressed_entries(self) -> int:
+        return sum(1 for entry in self._entries.values() if entry.compressed)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ================================================
+# Снимок кэша на диске (прогрев новых сессий)
+# ================================================
+
+SNAPSHOT_VERSION = 2
+
+
+def write_snapshot(path: str, entries: List[Tuple[str, CacheEntry]]) -> None:
+    """Атомарно записать снимок: несколько процессов сервера могут писать один файл.
+
+    Сжатые записи пишутся как есть (кодек и base64), без распаковки.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open_text(tmp_path, "w", like=path) as f:
+        f.write(json.dumps({"version": SNAPSHOT_VERSION, "created_at": time.time()}) + "\n")
+        for key, entry in entries:
+            record: Dict[str, Any] = {"key": key, "stored_at": entry.stored_at}
+            if entry.compressed:
+                record["codec"] = entry.codec
+                record["data"] = base64.b64encode(entry.data).decode("ascii")
+            else:
+                record["payload"] = entry.payload
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: str) -> List[Tuple[str, CacheEntry]]:
+    with open_text(path, "r") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("version") not in (1, SNAPSHOT_VERSION):
+            raise ValueError(f"Unsupported cache snapshot version: {header.get('version')}")
+        entries = []
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                if "codec" in record:
+                    entry = CacheEntry(None, record["stored_at"], record["codec"], base64.b64decode(record["data"]))
+                else:
+                    entry = CacheEntry(record["payload"], record["stored_at"])
+                entries.append((record["key"], entry))
+        return entries
+
+
+class NegativeCache:
+    """Короткоживущий кэш 404 для запросов по ID"""
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.stores = 0
+        self._expires: "OrderedDict[str, float]" = OrderedDict()
+
+    def contains(self, key: str) -> bool:
+        expires_at = self._expires.get(key)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            del self._expires[key]
+            return False
+        self.hits += 1
+        return True
+
+    def add(self, key: str) -> None:
+        if self.ttl <= 0:
+            return
+        self._expires[key] = time.monotonic() + self.ttl
+        self._expires.move_to_end(key)
+        self.stores += 1
+        while len(self._expires) > self.max_entries:
+            self._expires.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+
+# ================================================
+# Отметки об устаревших ответах в рамках вызова tool
+# ================================================
+
+_stale_responses: contextvars.ContextVar[Optional[List[Dict[str, Any]]]] = contextvars.ContextVar(
+    "freelancehunt_stale_responses", default=None
+)
+
+
+@contextmanager
+def track_stale() -> Iterator[List[Dict[str, Any]]]:
+    """Собрать ответы, отданные из кэша вместо API, за время вызова"""
+    stale: List[Dict[str, Any]] = []
+    token = _stale_responses.set(stale)
+    try:
+        yield stale
+    finally:
+        _stale_responses.reset(token)
+
+
+def mark_stale(key: str, age: float, reason: str) -> None:
+    stale = _stale_responses.get()
+    if stale is not None:
+        stale.append({"key": key, "age": age, "reason": reason})
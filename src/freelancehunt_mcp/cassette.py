@@ -0,0 +1,130 @@
+# ================================================
+# Запись и воспроизведение HTTP-обмена с API (кассеты)
+# ================================================
+#
+# Кассета - JSON lines (gzip или zstd, если путь оканчивается на .gz или .zst), одна строка на запрос:
+# {"method", "path", "body", "status", "headers", "response", "elapsed"}
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+from .compression import open_text
+
+
+# Заголовки ответа, которые имеет смысл сохранять
+RECORDED_HEADERS = ("content-type", "retry-after", "x-ratelimit-limit", "x-ratelimit-remaining")
+
+
+def request_key(method: str, url: httpx.URL, body: bytes) -> Tuple[str, str, str]:
+    """Ключ сопоставления: метод, путь без префикса версии, отсортированный query, тело"""
+    path = url.path
+    if path.startswith("/v2/"):
+        path = path[3:]
+    query = urlencode(sorted(parse_qsl(url.query.decode())))
+    return method, f"{path}?{query}" if query else path, body.decode("utf-8", "replace")
+
+
+def read_cassette(path: str) -> Iterator[Dict[str, Any]]:
+    with open_text(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Проксирует запросы в настоящий транспорт и дописывает каждый обмен в кассету"""
+
+    def __init__(self, path: str, inner: Optional[httpx.AsyncBaseTransport] = None):
+        self.path = path
+        self.inner = inner or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self.inner.handle_async_request(request)
+        content = await response.aread()
+        elapsed = time.perf_counter() - started
+
+        method, path, body = request_key(request.method, request.url, request.content)
+        record = {
+            "method": method,
+            "path": path,
+            "body": body,
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "response": content.decode("utf-8", "replace"),
+            "elapsed": round(elapsed, 4)
+        }
+        with open_text(self.path, "a") as f:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+        # Тело уже раскодировано, поэтому заголовки кодирования не передаются дальше
+        headers = [
+            (name, value) for name, value in response.headers.items()
+            if name not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+    async def aclose(self) -> None:
+        # Клиент создает httpx.AsyncClient на каждый запрос и закрывает его вместе с транспортом;
+        # внутренний пул живет столько же, сколько процесс
+        pass
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Отдает ответы из кассеты; повторные одинаковые запросы идут по кругу в порядке записи"""
+
+    # Клиенту не нужен настоящий API ключ
+    offline = True
+
+    def __init__(self, path: str, latency_scale: float = 0.0):
+        self.path = path
+        self.latency_scale = latency_scale
+        self._interactions: Dict[Tuple[str, str, str], Deque[Dict[str, Any]]] = {}
+        for record in read_cassette(path):
+            key = (record["method"], record["path"], record.get("body", ""))
+            self._interactions.setdefault(key, deque()).append(record)
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._interactions.values())
+
+    def records(self) -> List[Dict[str, Any]]:
+        return [record for records in self._interactions.values() for record in records]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request.method, request.url, request.content)
+        records = self._interactions.get(key)
+        if not records:
+            raise httpx.ConnectError(f"No recorded response for {key[0]} {key[1]}", request=request)
+
+        record = records[0]
+        records.rotate(-1)
+        if self.latency_scale > 0:
+            await asyncio.sleep(record.get("elapsed", 0.0) * self.latency_scale)
+
+        return httpx.Response(
+            record["status"],
+            headers=record.get("headers", {}),
+            content=record["response"].encode("utf-8"),
+            request=request
+        )
+
+
+def transport_from_env() -> Optional[httpx.AsyncBaseTransport]:
+    """CASSETTE_MODE=record|replay, CASSETTE_PATH, CASSETTE_REPLAY_LATENCY (множитель записанных задержек)"""
+    mode = os.getenv('CASSETTE_MODE', '').lower()
+    if not mode:
+        return None
+
+    path = os.getenv('CASSETTE_PATH', 'freelancehunt_cassette.jsonl.gz')
+    if mode == 'record':
+        return RecordingTransport(path)
+    if mode == 'replay':
+        return ReplayTransport(path, float(os.getenv('CASSETTE_REPLAY_LATENCY', '0')))
+    raise ValueError(f"Unknown CASSETTE_MODE '{mode}', expected 'record' or 'replay'")
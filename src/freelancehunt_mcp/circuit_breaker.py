@@ -0,0 +1,86 @@
+# ================================================
+# Circuit breaker для групп эндпоинтов API
+# ================================================
+
+import time
+from collections import deque
+from typing import Deque, Optional
+
+
+class CircuitBreaker:
+    """Размыкается по доле ошибок/медленных ответов в скользящем окне"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_ratio: float = 0.5,
+        min_calls: int = 5,
+        window: int = 20,
+        slow_call_seconds: float = 10.0,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1
+    ):
+        self.name = name
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+
+        self.state = self.CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window)  # True - неудачный вызов
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+
+    def retry_after(self) -> float:
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def allow_request(self) -> bool:
+        if self.state == self.OPEN:
+            if self.retry_after() > 0:
+                return False
+            self.state = self.HALF_OPEN
+            self._probes_in_flight = 0
+
+        if self.state == self.HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_probes:
+                return False
+            self._probes_in_flight += 1
+
+        return True
+
+    def record(self, healthy: Optional[bool], latency: float) -> None:
+        """Учесть исход вызова; None - исход ничего не говорит о здоровье API (отмена, дедлайн)"""
+        if self.state == self.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if healthy is None:
+                return
+            if healthy and latency < self.slow_call_seconds:
+                self._close()
+            else:
+                self._open()
+            return
+
+        if healthy is None or self.state == self.OPEN:
+            return
+
+        self._outcomes.append(not healthy or latency >= self.slow_call_seconds)
+        if len(self._outcomes) >= self.min_calls:
+            failures = sum(self._outcomes)
+            if failures / len(self._outcomes) >= self.failure_ratio:
+                self._open()
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    def _close(self) -> None:
+        self.state = self.CLOSED
+        self._outcomes.clear()
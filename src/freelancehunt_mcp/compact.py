@@ -0,0 +1,94 @@
+# ================================================
+# Компактное представление сущностей в памяти
+# ================================================
+#
+# JSON-объект хранится как Node (__slots__) с общим для всех объектов той же формы кортежем
+# ключей и кортежем значений; короткие строки (навыки, валюты, статусы, логины) интернируются,
+# длинные тексты (description_html, cv_html) сжимаются (zstd или zlib, см. compression). Обычный dict восстанавливается
+# только при чтении.
+
+import sys
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .compression import ZSTD, compress, decompress
+
+# Строки от этой длины сжимаются, короче - интернируются
+COMPRESS_MIN_LENGTH = 200
+
+# Кортежи ключей по форме объекта: одинаковые объекты делят один кортеж
+_KEY_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+class Node:
+    """JSON-объект: общий кортеж ключей + кортеж упакованных значений.
+
+    Поддерживает чтение как dict (get, [], in, len), чтобы фильтровать и сортировать
+    сущности без распаковки; вложенные объекты отдаются как Node, списки - как кортежи.
+    """
+
+    __slots__ = ("keys", "values")
+
+    def __init__(self, keys: Tuple[str, ...], values: Tuple[Any, ...]):
+        self.keys = keys
+        self.values = values
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            value = self.values[self.keys.index(key)]
+        except ValueError:
+            return default
+        return str(value) if isinstance(value, Text) else value
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.keys:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class Text:
+    """Сжатая длинная строка"""
+
+    __slots__ = ("codec", "data")
+
+    def __init__(self, codec: Optional[str], data: bytes):
+        self.codec = codec
+        self.data = data
+
+    def __str__(self) -> str:
+        return decompress(self.codec, self.data).decode("utf-8")
+
+
+def pack(value: Any) -> Any:
+    """JSON-значение -> компактная форма (списки становятся кортежами)"""
+    if isinstance(value, str):
+        if len(value) < COMPRESS_MIN_LENGTH:
+            return sys.intern(value)
+        codec, compressed = compress(value.encode("utf-8"), ZSTD)
+        return Text(codec, compressed) if codec is not None else value
+    if isinstance(value, dict):
+        keys = tuple(value)
+        keys = _KEY_TUPLES.setdefault(keys, keys)
+        return Node(keys, tuple(pack(item) for item in value.values()))
+    if isinstance(value, list):
+        return tuple(pack(item) for item in value)
+    return value
+
+
+def unpack(value: Any) -> Any:
+    """Компактная форма -> исходное JSON-значение"""
+    if isinstance(value, Node):
+        return {key: unpack(item) for key, item in zip(value.keys, value.values)}
+    if isinstance(value, tuple):
+        return [unpack(item) for item in value]
+    if isinstance(value, Text):
+        return str(value)
+    return value
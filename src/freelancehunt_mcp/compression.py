@@ -0,0 +1,91 @@
+# ================================================
+# Сжатие записей кэша и файлов на диске
+# ================================================
+#
+# zstd (пакет zstandard, extras "compression"), если установлен, иначе zlib. Кодек хранится
+# рядом с каждой сжатой записью, поэтому данные, сжатые одним кодеком, читаются и после
+# смены настройки. Файлы выбирают формат по расширению: .zst, .gz или обычный текст.
+
+import gzip
+import io
+import os
+import zlib
+from typing import Any, IO, Optional, Tuple
+
+ZSTD = "zstd"
+ZLIB = "zlib"
+
+_zstd_module: Any = None
+_zstd_checked = False
+
+
+def _zstd() -> Any:
+    """Модуль zstandard или None; импортируется при первом сжатии, а не при старте"""
+    global _zstd_module, _zstd_checked
+    if not _zstd_checked:
+        _zstd_checked = True
+        try:
+            import zstandard
+            _zstd_module = zstandard
+        except ImportError:
+            _zstd_module = None
+    return _zstd_module
+
+
+def zstd_available() -> bool:
+    return _zstd() is not None
+
+
+def default_codec() -> Optional[str]:
+    """CACHE_COMPRESSION: auto (zstd, если установлен, иначе zlib), zstd, zlib или none"""
+    setting = os.getenv('CACHE_COMPRESSION', 'auto').lower()
+    if setting in ('none', 'off', '0'):
+        return None
+    if setting == ZLIB or _zstd() is None:
+        return ZLIB
+    return ZSTD
+
+
+def compress(data: bytes, codec: Optional[str] = ZLIB) -> Tuple[Optional[str], bytes]:
+    """-> (кодек, данные); None, если сжатие выключено или не уменьшает размер"""
+    if codec == ZSTD and _zstd() is not None:
+        # zstandard отдает bytes с буфером размера compressBound: копия держит только сжатые данные
+        compressed = bytes(memoryview(_zstd().ZstdCompressor(level=3).compress(data)))
+    elif codec is not None:
+        codec = ZLIB
+        compressed = zlib.compress(data, 6)
+    else:
+        return None, data
+    if len(compressed) >= len(data):
+        return None, data
+    return codec, compressed
+
+
+def decompress(codec: Optional[str], data: bytes) -> bytes:
+    if codec is None:
+        return data
+    if codec == ZLIB:
+        return zlib.decompress(data)
+    if codec == ZSTD:
+        if _zstd() is None:
+            raise RuntimeError("zstd-compressed data requires the zstandard package: pip install zstandard")
+        return _zstd().ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+
+def open_text(path: str, mode: str, like: Optional[str] = None) -> IO[str]:
+    """Текстовый файл: .zst - zstd, .gz - gzip, иначе без сжатия (like - имя для выбора формата)"""
+    name = like or path
+    if name.endswith(".zst"):
+        if _zstd() is None:
+            raise RuntimeError(f"{name}: .zst files require the zstandard package: pip install zstandard")
+        raw = open(path, mode + "b")
+        # Дозапись ("a") добавляет новый кадр zstd, чтение идет через все кадры
+        stream = (
+            _zstd().ZstdDecompressor().stream_reader(raw, read_across_frames=True) if mode == "r"
+            else _zstd().ZstdCompressor(level=3).stream_writer(raw)
+        )
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    if name.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
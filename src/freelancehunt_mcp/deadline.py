@@ -0,0 +1,39 @@
+# ================================================
+# Дедлайны вызовов tools
+# ================================================
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+# Абсолютный дедлайн текущего вызова (time.monotonic), None - без ограничения
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "freelancehunt_deadline", default=None
+)
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]) -> Iterator[Optional[float]]:
+    """Установить дедлайн для вложенных запросов (не позже уже действующего)"""
+    current = _deadline.get()
+    deadline = current
+    if timeout is not None:
+        deadline = time.monotonic() + timeout
+        if current is not None:
+            deadline = min(deadline, current)
+
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Сколько секунд осталось до дедлайна (None, если дедлайна нет)"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
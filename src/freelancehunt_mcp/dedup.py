@@ -0,0 +1,209 @@
+# ================================================
+# Поиск дублей и перепубликаций проектов (MinHash + LSH)
+# ================================================
+#
+# Слушатель LocalMirror: для каждого проекта считается MinHash-подпись словесных
+# биграмм названия и описания, подпись раскладывается по LSH-корзинам. Поиск
+# похожих - объединение нескольких корзин и сравнение подписей, без перебора всех проектов.
+
+import random
+import re
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Подпись 64 хэша = 16 полос по 4: пара с Jaccard 0.7 попадает в общую корзину с вероятностью ~99%
+NUM_PERM = 64
+BANDS = 16
+# Сколько групп одной корзины LSH отслеживается при поиске кластеров
+MAX_BUCKET_REPRESENTATIVES = 64
+ROWS = NUM_PERM // BANDS
+
+_PRIME = (1 << 31) - 1
+# Фиксированное зерно: подписи сравнимы между процессами
+_rng = random.Random(20240601)
+_A = [_rng.randrange(1, _PRIME) for _ in range(NUM_PERM)]
+_B = [_rng.randrange(0, _PRIME) for _ in range(NUM_PERM)]
+
+_WORD = re.compile(r"\w+")
+
+# NumPy импортируется при первой подписи, а не при старте сервера
+_np: Any = None
+_np_arrays: Optional[Tuple[Any, Any]] = None
+
+
+def _numpy() -> Any:
+    global _np, _np_arrays
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+            _np_arrays = (numpy.array(_A, dtype=numpy.int64)[:, None], numpy.array(_B, dtype=numpy.int64)[:, None])
+        except ImportError:
+            _np = False
+    return _np
+
+
+def project_text(project: Dict[str, Any]) -> str:
+    attributes = project.get("attributes") or {}
+    return f"{attributes.get('name') or ''}\n{attributes.get('description') or ''}"
+
+
+def shingles(text: str) -> Set[int]:
+    """Хэши словесных биграмм нормализованного текста"""
+    words = _WORD.findall(text.lower())
+    grams = [" ".join(words[i:i + 2]) for i in range(len(words) - 1)] or words
+    return {zlib.crc32(gram.encode("utf-8")) & _PRIME for gram in grams}
+
+
+def signature(hashes: Iterable[int]) -> Tuple[int, ...]:
+    """MinHash-подпись: минимум (a * h + b) mod p по каждой из NUM_PERM перестановок"""
+    hashes = list(hashes)
+    if not hashes:
+        return ()
+    np = _numpy()
+    if np:
+        a, b = _np_arrays
+        values = np.array(hashes, dtype=np.int64)[None, :]
+        return tuple(((a * values + b) % _PRIME).min(axis=1).tolist())
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in zip(_A, _B))
+
+
+def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+    """Оценка коэффициента Жаккара по совпадающим позициям подписей"""
+    if not first or not second:
+        return 0.0
+    return sum(x == y for x, y in zip(first, second)) / NUM_PERM
+
+
+class DuplicateIndex:
+    """LSH-индекс MinHash-подписей проектов"""
+
+    def __init__(self, threshold: float = 0.7):
+        self.threshold = threshold
+        self._signatures: Dict[int, Tuple[int, ...]] = {}
+        self._fingerprints: Dict[int, int] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[int]] = {}
+
+    def observe(self, collection: str, item: Dict[str, Any]) -> None:
+        """Слушатель LocalMirror"""
+        if collection == "projects":
+            self.add(item)
+
+    def forget(self, collection: str, item_id: Any) -> None:
+        """Слушатель вытеснения LocalMirror"""
+        if collection == "projects":
+            self.remove(item_id)
+
+    def add(self, project: Dict[str, Any]) -> None:
+        project_id = project.get("id")
+        if project_id is None:
+            return
+        text = project_text(project)
+        fingerprint = zlib.crc32(text.encode("utf-8"))
+        # Повторно полученный проект без изменений текста не переиндексируется
+        if self._fingerprints.get(project_id) == fingerprint:
+            return
+        self.remove(project_id)
+        self._fingerprints[project_id] = fingerprint
+        project_signature = signature(shingles(text))
+        if not project_signature:
+            return
+        self._signatures[project_id] = project_signature
+        for band in self._bands(project_signature):
+            self._buckets.setdefault(band, set()).add(project_id)
+
+    def remove(self, project_id: int) -> None:
+        self._fingerprints.pop(project_id, None)
+        project_signature = self._signatures.pop(project_id, None)
+        if project_signature is None:
+            return
+        for band in self._bands(project_signature):
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(project_id)
+                if not bucket:
+                    del self._buckets[band]
+
+    @staticmethod
+    def _bands(project_signature: Tuple[int, ...]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        for band in range(BANDS):
+            yield band, project_signature[band * ROWS:(band + 1) * ROWS]
+
+    def __contains__(self, project_id: int) -> bool:
+        return project_id in self._signatures
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def similar(self, project_id: int, threshold: Optional[float] = None) -> List[Tuple[int, float]]:
+        """Похожие проекты (ID, оценка сходства) по убыванию сходства"""
+        threshold = self.threshold if threshold is None else threshold
+        project_signature = self._signatures.get(project_id)
+        if project_signature is None:
+            return []
+        candidates: Set[int] = set()
+        for band in self._bands(project_signature):
+            candidates |= self._buckets.get(band, set())
+        candidates.discard(project_id)
+        scored = [(candidate, similarity(project_signature, self._signatures[candidate])) for candidate in candidates]
+        return sorted(
+            ((candidate, score) for candidate, score in scored if score >= threshold),
+            key=lambda pair: -pair[1]
+        )
+
+    def clusters(self, threshold: Optional[float] = None) -> List[List[int]]:
+        """Группы дублей (связные компоненты пар со сходством >= threshold), крупные первыми.
+
+        Внутри корзины LSH проект сравнивается только с представителями уже найденных в ней групп
+        (не больше MAX_BUCKET_REPRESENTATIVES), а не со всеми членами: шаблонные объявления дают
+        корзины из тысяч проектов, и попарное сравнение было бы квадратичным.
+        """
+        threshold = self.threshold if threshold is None else threshold
+        parent: Dict[int, int] = {}
+
+        def find(item: int) -> int:
+            root = item
+            while parent.setdefault(root, root) != root:
+                root = parent[root]
+            parent[item] = root
+            return root
+
+        for bucket in self._buckets.values():
+            if len(bucket) < 2:
+                continue
+            representatives: List[int] = []
+            for member in sorted(bucket):
+                joined = False
+                for representative in representatives:
+                    root_member, root_representative = find(member), find(representative)
+                    if root_member == root_representative:
+                        joined = True
+                    elif similarity(self._signatures[member], self._signatures[representative]) >= threshold:
+                        parent[root_member] = root_representative
+                        joined = True
+                if not joined and len(representatives) < MAX_BUCKET_REPRESENTATIVES:
+                    representatives.append(member)
+
+        groups: Dict[int, List[int]] = {}
+        for item in parent:
+            groups.setdefault(find(item), []).append(item)
+        return sorted(
+            (sorted(group) for group in groups.values() if len(group) > 1),
+            key=lambda group: (-len(group), group[0])
+        )
+
+    def collapse(self, project_ids: Iterable[int], threshold: Optional[float] = None) -> Dict[int, List[int]]:
+        """Первый проект каждой группы дублей -> ID скрытых дублей (порядок project_ids сохраняется)"""
+        kept: Dict[int, List[int]] = {}
+        duplicate_of: Dict[int, int] = {}
+        for project_id in project_ids:
+            if project_id in duplicate_of:
+                kept[duplicate_of[project_id]].append(project_id)
+                continue
+            kept[project_id] = []
+            for other, _ in self.similar(project_id, threshold):
+                duplicate_of.setdefault(other, project_id)
+        return kept
+
+    def stats(self) -> Dict[str, int]:
+        return {"projects": len(self._signatures), "buckets": len(self._buckets)}
@@ -0,0 +1,175 @@
+# ================================================
+# Сводки по заказчикам из локальных данных
+# ================================================
+#
+# Слушатель LocalMirror: для каждого проекта хранится компактная запись в индексе
+# employer_id -> проекты; сводка по заказчику считается по его записям по запросу.
+# Записи удаляются вместе с вытесненными из зеркала проектами и ставками.
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set
+
+from .dedup import DuplicateIndex
+
+
+class ProjectRecord:
+    """Поля проекта, нужные для сводки по заказчику"""
+
+    __slots__ = ("project_id", "employer_id", "amount", "currency", "bid_count", "status", "published_at", "has_freelancer")
+
+    def __init__(self, project: Dict[str, Any]):
+        attributes = project.get("attributes") or {}
+        budget = attributes.get("budget") or {}
+        self.project_id: int = project["id"]
+        self.employer_id: int = (attributes.get("employer") or {})["id"]
+        self.amount: Optional[float] = float(budget["amount"]) if budget.get("amount") is not None else None
+        self.currency: Optional[str] = budget.get("currency")
+        self.bid_count: int = attributes.get("bid_count") or 0
+        self.status: Optional[str] = (attributes.get("status") or {}).get("name")
+        self.published_at: Optional[datetime] = _parse_date(attributes.get("published_at"))
+        self.has_freelancer: bool = bool(attributes.get("freelancer"))
+
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class EmployerIndex:
+    """Индекс employer_id -> проекты и данные заказчика"""
+
+    def __init__(self):
+        self.employers: Dict[int, Dict[str, Any]] = {}
+        self._projects: Dict[int, ProjectRecord] = {}
+        self._by_employer: Dict[int, Set[int]] = {}
+        # ID выигравшей ставки -> ID проекта
+        self._winning_bids: Dict[int, int] = {}
+
+    def observe(self, collection: str, item: Dict[str, Any]) -> None:
+        """Слушатель LocalMirror"""
+        if collection == "projects":
+            self._observe_project(item)
+        elif collection.endswith("/bids") and (item.get("attributes") or {}).get("is_winner"):
+            project_id = ((item.get("attributes") or {}).get("project") or {}).get("id")
+            if project_id is not None and item.get("id") is not None:
+                self._winning_bids[item["id"]] = project_id
+
+    def forget(self, collection: str, item_id: Any) -> None:
+        """Слушатель вытеснения LocalMirror"""
+        if collection.endswith("/bids"):
+            self._winning_bids.pop(item_id, None)
+            return
+        if collection != "projects":
+            return
+        record = self._projects.pop(item_id, None)
+        if record is None:
+            return
+        projects = self._by_employer[record.employer_id]
+        projects.discard(item_id)
+        if not projects:
+            del self._by_employer[record.employer_id]
+            self.employers.pop(record.employer_id, None)
+
+    def _observe_project(self, project: Dict[str, Any]) -> None:
+        employer = (project.get("attributes") or {}).get("employer") or {}
+        if project.get("id") is None or employer.get("id") is None:
+            return
+        # Повторно полученный проект заменяет запись (число ставок, статус меняются)
+        record = ProjectRecord(project)
+        previous = self._projects.get(record.project_id)
+        if previous is not None and previous.employer_id != record.employer_id:
+            self.forget("projects", record.project_id)
+        self._projects[record.project_id] = record
+        self._by_employer.setdefault(record.employer_id, set()).add(record.project_id)
+        self.employers[record.employer_id] = employer
+
+    def __contains__(self, employer_id: int) -> bool:
+        return bool(self._by_employer.get(employer_id))
+
+    def __len__(self) -> int:
+        return len(self.employers)
+
+    def project_ids(self, employer_id: int) -> List[int]:
+        return sorted(self._by_employer.get(employer_id, ()))
+
+    def summary(
+        self,
+        employer_id: int,
+        duplicates: Optional[DuplicateIndex] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Число проектов, бюджеты, ставки, доля с выбранным исполнителем, перепубликации, давность"""
+        records = [self._projects[project_id] for project_id in self.project_ids(employer_id)]
+        if not records:
+            return {"employer_id": employer_id, "projects": 0}
+        now = now or datetime.now(timezone.utc)
+        employer = self.employers.get(employer_id) or {}
+
+        budgets: Dict[str, List[float]] = {}
+        statuses: Dict[str, int] = {}
+        for record in records:
+            if record.amount is not None and record.currency:
+                budgets.setdefault(record.currency, []).append(record.amount)
+            if record.status:
+                statuses[record.status] = statuses.get(record.status, 0) + 1
+
+        bid_counts = [record.bid_count for record in records]
+        winning_projects = set(self._winning_bids.values())
+        winners = sum(
+            1 for record in records if record.has_freelancer or record.project_id in winning_projects
+        )
+        dates = sorted(record.published_at for record in records if record.published_at is not None)
+
+        summary: Dict[str, Any] = {
+            "employer": {
+                "id": employer_id,
+                "login": employer.get("login"),
+                "name": " ".join(filter(None, (employer.get("first_name"), employer.get("last_name")))) or None
+            },
+            "projects": len(records),
+            "statuses": statuses,
+            "budget_share": round(sum(len(amounts) for amounts in budgets.values()) / len(records), 3),
+            "budget_by_currency": {
+                currency: {
+                    "count": len(amounts),
+                    "mean": round(sum(amounts) / len(amounts), 2),
+                    "min": min(amounts),
+                    "max": max(amounts)
+                }
+                for currency, amounts in sorted(budgets.items())
+            },
+            "bids": {
+                "total": sum(bid_counts),
+                "mean_per_project": round(sum(bid_counts) / len(records), 1),
+                "max": max(bid_counts)
+            },
+            "winner_share": round(winners / len(records), 3)
+        }
+
+        if duplicates is not None:
+            # Перепубликация - проект, повторяющий более ранний проект того же заказчика
+            ordered = [
+                record.project_id for record in sorted(
+                    records, key=lambda record: record.published_at or datetime.min.replace(tzinfo=timezone.utc)
+                )
+            ]
+            reposts = sum(len(repeated) for repeated in duplicates.collapse(ordered).values())
+            summary["reposts"] = reposts
+            summary["repost_rate"] = round(reposts / len(records), 3)
+
+        if dates:
+            summary["recency"] = {
+                "first_published_at": dates[0].isoformat(),
+                "last_published_at": dates[-1].isoformat(),
+                "days_since_last": round((now - dates[-1]).total_seconds() / 86400, 1),
+                "projects_last_30_days": sum(1 for date in dates if (now - date).days < 30)
+            }
+        return summary
+
+    def stats(self) -> Dict[str, int]:
+        return {"employers": len(self.employers), "projects": len(self._projects)}
@@ -0,0 +1,336 @@
+# ================================================
+# Потоковая выгрузка списков API в JSONL / Parquet
+# ================================================
+#
+# Страницы идут через FreelanceHuntClient.iter_pages (лимит запросов, circuit breaker) мимо
+# кэша и зеркала и сразу пишутся на диск, поэтому память не растет с объемом выгрузки.
+# При 429/5xx страница запрашивается повторно с экспоненциальной паузой (не меньше
+# Retry-After). После каждой записанной порции сохраняется контрольная точка: повторный
+# запуск той же команды продолжает выгрузку с нее, в том числе после исчерпания повторов.
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from .api_client import FreelanceHuntClient, FreelanceHuntNotFoundError, FreelanceHuntUnavailableError
+
+CHECKPOINT_VERSION = 1
+
+# Пауза перед повтором: RETRY_BASE_DELAY * 2^(попытка - 1), не больше RETRY_MAX_DELAY
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 60.0
+
+
+def retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    delay = min(RETRY_BASE_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY)
+    return max(delay, retry_after or 0.0)
+
+
+def parse_params(values: List[str]) -> Dict[str, str]:
+    """key=value -> параметры запроса (filter[skill_id]=22,57)"""
+    params = {}
+    for value in values:
+        key, separator, param_value = value.partition("=")
+        if not separator:
+            raise argparse.ArgumentTypeError(f"Expected key=value, got {value!r}")
+        params[key] = param_value
+    return params
+
+
+def read_ids(path: str) -> List[int]:
+    """ID из прошлой выгрузки: JSONL-файл или каталог Parquet"""
+    if os.path.isdir(path):
+        import pyarrow.dataset
+        return [int(value) for value in pyarrow.dataset.dataset(path).to_table(columns=["id"])["id"].to_pylist()]
+    ids = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                ids.append(int(json.loads(line)["id"]))
+    return ids
+
+
+def flatten(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Элемент API -> строка таблицы: атрибуты в колонки, вложенные объекты - JSON-строками"""
+    row: Dict[str, Any] = {"id": item.get("id"), "type": item.get("type")}
+    for key, value in (item.get("attributes") or {}).items():
+        row[key] = json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+    return row
+
+
+class JsonlWriter:
+    """JSON lines; позиция для контрольной точки - смещение в байтах"""
+
+    def __init__(self, path: str, position: int = 0):
+        if position:
+            # Строки после контрольной точки могли записаться частично - отбрасываются
+            self._file = open(path, "r+b")
+            self._file.truncate(position)
+            self._file.seek(position)
+        else:
+            self._file = open(path, "wb")
+        self._position = position
+
+    @property
+    def bytes(self) -> int:
+        return self._position
+
+    def write(self, items: List[Dict[str, Any]]) -> None:
+        self._file.write("".join(
+            json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n" for item in items
+        ).encode("utf-8"))
+
+    def flush(self, force: bool = False) -> Optional[int]:
+        self._file.flush()
+        self._position = self._file.tell()
+        return self._position
+
+    def close(self) -> int:
+        self.flush()
+        self._file.close()
+        return self._position
+
+
+class ParquetWriter:
+    """Каталог part-NNNNN.parquet; позиция для контрольной точки - число готовых файлов"""
+
+    def __init__(self, path: str, position: int = 0, rows_per_file: int = 50000):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit("Parquet export requires pyarrow: pip install pyarrow")
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.path = path
+        self.part = position
+        self.rows_per_file = rows_per_file
+        self._rows: List[Dict[str, Any]] = []
+        os.makedirs(path, exist_ok=True)
+        # Файлы после контрольной точки недописаны или будут записаны заново
+        for name in os.listdir(path):
+            if name.startswith("part-") and int(name[5:10]) >= position:
+                os.remove(os.path.join(path, name))
+
+    @property
+    def bytes(self) -> int:
+        return sum(entry.stat().st_size for entry in os.scandir(self.path) if entry.name.startswith("part-"))
+
+    def write(self, items: List[Dict[str, Any]]) -> None:
+        self._rows.extend(flatten(item) for item in items)
+
+    def flush(self, force: bool = False) -> Optional[int]:
+        if not self._rows or (len(self._rows) < self.rows_per_file and not force):
+            return None
+        table = self._pa.Table.from_pylist(self._rows)
+        # Колонки без единого значения в порции - строковые, чтобы схемы частей совпадали
+        for index, field in enumerate(table.schema):
+            if self._pa.types.is_null(field.type):
+                table = table.set_column(index, field.name, table.column(index).cast(self._pa.string()))
+        part_path = os.path.join(self.path, f"part-{self.part:05d}.parquet")
+        self._pq.write_table(table, f"{part_path}.tmp")
+        os.replace(f"{part_path}.tmp", part_path)
+        self._rows = []
+        self.part += 1
+        return self.part
+
+    def close(self) -> int:
+        self.flush(force=True)
+        return self.part
+
+
+def _save_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _load_checkpoint(path: str, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get("version") != CHECKPOINT_VERSION or state.get("job") != job:
+        raise SystemExit(f"Checkpoint {path} belongs to a different export; remove it or use --fresh")
+    return state
+
+
+async def export(
+    client: FreelanceHuntClient,
+    endpoint: str,
+    output: str,
+    params: Optional[Dict[str, str]] = None,
+    ids: Optional[List[int]] = None,
+    output_format: str = "jsonl",
+    checkpoint_path: Optional[str] = None,
+    page_size: int = 50,
+    max_pages: Optional[int] = None,
+    rows_per_file: int = 50000,
+    report_interval: float = 5.0,
+    retries: int = 5
+) -> Dict[str, Any]:
+    """Выгрузить endpoint (или шаблон с {id} для каждого ID) в output; возвращает статистику.
+
+    Страница, не полученная за retries повторов, завершает выгрузку через SystemExit
+    с сохраненной контрольной точкой.
+    """
+    targets = [endpoint.format(id=item_id) for item_id in ids] if "{id}" in endpoint else [endpoint]
+    job = {"endpoint": endpoint, "params": params or {}, "format": output_format, "targets": len(targets)}
+    checkpoint_path = checkpoint_path or f"{output.rstrip(os.sep)}.checkpoint.json"
+
+    state = _load_checkpoint(checkpoint_path, job) or {
+        "version": CHECKPOINT_VERSION, "job": job,
+        "target": 0, "next_page": 1, "position": 0, "items": 0, "pages": 0, "missing": 0, "done": False
+    }
+    if state["done"]:
+        print(f"Export already complete: {state['items']} items in {output} (use --fresh to start over)", file=sys.stderr)
+        return {"output": output, "format": output_format, "targets": len(targets), "missing": state["missing"],
+                "pages": state["pages"], "items": state["items"], "seconds": 0.0}
+    if state["position"]:
+        print(f"Resuming from target {state['target'] + 1}/{len(targets)}, page {state['next_page']}", file=sys.stderr)
+
+    writer: Any = (
+        ParquetWriter(output, state["position"], rows_per_file) if output_format == "parquet"
+        else JsonlWriter(output, state["position"])
+    )
+    started = time.monotonic()
+    last_report = started
+    resumed_items = state["items"]
+    progress = dict(state)
+
+    def report(final: bool = False) -> None:
+        elapsed = max(time.monotonic() - started, 1e-9)
+        rate = (progress["items"] - resumed_items) / elapsed
+        print(
+            f"{'done' if final else 'progress'}: target {min(progress['target'] + 1, len(targets))}/{len(targets)}, "
+            f"{progress['pages']} pages, {progress['items']} items, {rate:.0f} items/s, {writer.bytes / 1e6:.1f} MB",
+            file=sys.stderr
+        )
+
+    for target_index in range(state["target"], len(targets)):
+        progress.update(target=target_index, next_page=state["next_page"] if target_index == state["target"] else 1)
+        attempt = 0
+        while True:
+            start_page = progress["next_page"]
+            remaining = None if max_pages is None else max_pages - start_page + 1
+            try:
+                async for page, items in client.iter_pages(
+                    targets[target_index], params, start_page=start_page, max_pages=remaining,
+                    page_size=page_size, store=False
+                ):
+                    attempt = 0
+                    writer.write(items)
+                    progress.update(target=target_index, next_page=page + 1)
+                    progress["items"] += len(items)
+                    progress["pages"] += 1
+                    position = writer.flush()
+                    if position is not None:
+                        state = {**progress, "position": position}
+                        _save_checkpoint(checkpoint_path, state)
+                    if time.monotonic() - last_report >= report_interval:
+                        report()
+                        last_report = time.monotonic()
+            except FreelanceHuntNotFoundError:
+                progress["missing"] += 1
+                print(f"Skipping {targets[target_index]}: not found", file=sys.stderr)
+            except FreelanceHuntUnavailableError as e:
+                attempt += 1
+                if attempt > retries:
+                    # Недописанная порция Parquet записывается, чтобы продолжить ровно с этой страницы
+                    position = writer.flush(force=True)
+                    if position is not None:
+                        _save_checkpoint(checkpoint_path, {**progress, "position": position})
+                    writer.close()
+                    raise SystemExit(
+                        f"Export stopped at {targets[target_index]} page {progress['next_page']} after {retries} retries: {e}\n"
+                        f"{progress['items']} items saved to {output}; run the same command again to resume"
+                    )
+                delay = retry_delay(attempt, e.retry_after)
+                print(
+                    f"Page {progress['next_page']} of {targets[target_index]} failed ({e}); "
+                    f"retry {attempt}/{retries} in {delay:.0f}s",
+                    file=sys.stderr
+                )
+                await asyncio.sleep(delay)
+                continue
+            break
+        progress.update(target=target_index + 1, next_page=1)
+
+    state = {**progress, "position": writer.close(), "done": True}
+    _save_checkpoint(checkpoint_path, state)
+    report(final=True)
+
+    seconds = time.monotonic() - started
+    return {
+        "output": output,
+        "format": output_format,
+        "targets": len(targets),
+        "missing": state["missing"],
+        "pages": state["pages"],
+        "items": state["items"],
+        "bytes": writer.bytes,
+        "seconds": round(seconds, 2),
+        "items_per_second": round((state["items"] - resumed_items) / max(seconds, 1e-9), 1)
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Stream a FreelanceHunt list endpoint to JSONL or Parquet with resumable checkpoints"
+    )
+    parser.add_argument("endpoint", help="List endpoint (/projects, /threads, /my/bids) or a template like /projects/{id}/bids")
+    parser.add_argument("-o", "--output", required=True, help="Output .jsonl file or Parquet directory")
+    parser.add_argument("--format", choices=("jsonl", "parquet"), help="Default: parquet for *.parquet, otherwise jsonl")
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=VALUE", help="Query parameter, repeatable (filter[skill_id]=22)")
+    parser.add_argument("--ids", help="Comma-separated IDs for a {id} endpoint template")
+    parser.add_argument("--ids-from", help="Take IDs for a {id} template from an earlier export (JSONL file or Parquet directory)")
+    parser.add_argument("--max-pages", type=int, help="Max pages per endpoint")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--rows-per-file", type=int, default=50000, help="Rows per Parquet part file")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint.json)")
+    parser.add_argument("--fresh", action="store_true", help="Ignore an existing checkpoint and start over")
+    parser.add_argument("--report-interval", type=float, default=5.0, help="Seconds between progress lines on stderr")
+    parser.add_argument("--retries", type=int, default=5, help="Retries per page on 429/5xx before stopping (resumable)")
+    args = parser.parse_args(argv)
+
+    load_dotenv()
+    output_format = args.format or ("parquet" if args.output.endswith(".parquet") else "jsonl")
+    ids: Optional[List[int]] = None
+    if "{id}" in args.endpoint:
+        if args.ids:
+            ids = [int(part) for part in args.ids.split(",") if part.strip()]
+        elif args.ids_from:
+            ids = read_ids(args.ids_from)
+        else:
+            parser.error("endpoint template with {id} needs --ids or --ids-from")
+
+    checkpoint_path = args.checkpoint or f"{args.output.rstrip(os.sep)}.checkpoint.json"
+    if args.fresh and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    stats = asyncio.run(export(
+        FreelanceHuntClient(),
+        args.endpoint,
+        args.output,
+        params=parse_params(args.param),
+        ids=ids,
+        output_format=output_format,
+        checkpoint_path=checkpoint_path,
+        page_size=args.page_size,
+        max_pages=args.max_pages,
+        rows_per_file=args.rows_per_file,
+        report_interval=args.report_interval,
+        retries=args.retries
+    ))
+    print(json.dumps(stats, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
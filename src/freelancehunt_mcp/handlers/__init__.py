@@ -1,9 +1,53 @@
 # ================================================
 # Экспорт всех обработчиков
 # ================================================
+#
+# Модули обработчиков загружаются при первом обращении: stdio сервер стартует на каждую
+# сессию, и импорт всех модулей сразу заметно удлиняет холодный старт.
 
-from .project_handlers import *
-from .freelancer_handlers import *
-from .contest_handlers import *
-from .thread_handlers import *
-from .location_handlers import *
+import importlib
+from typing import Any, List
+
+# Имя -> модуль пакета
+_EXPORTS = {
+    "handle_search_projects": "project_handlers",
+    "handle_get_project": "project_handlers",
+    "handle_get_project_bids": "project_handlers",
+    "handle_get_project_comments": "project_handlers",
+    "handle_create_bid": "project_handlers",
+    "handle_find_duplicate_projects": "project_handlers",
+    "handle_get_freelancer": "freelancer_handlers",
+    "handle_get_my_profile": "freelancer_handlers",
+    "handle_get_my_bids": "freelancer_handlers",
+    "handle_get_freelancer_portfolio": "freelancer_handlers",
+    "handle_get_freelancer_reviews": "freelancer_handlers",
+    "handle_search_contests": "contest_handlers",
+    "handle_get_contest": "contest_handlers",
+    "handle_get_threads": "thread_handlers",
+    "handle_get_skills": "location_handlers",
+    "handle_get_countries": "location_handlers",
+    "handle_get_cities": "location_handlers",
+    "handle_resolve_names": "location_handlers",
+    "handle_get_bid_stats": "analytics_handlers",
+    "handle_get_price_index": "analytics_handlers",
+    "handle_rank_projects_for_me": "analytics_handlers",
+    "handle_get_employer_summary": "analytics_handlers",
+    "handle_get_server_stats": "stats_handlers",
+    "handle_start_profiling": "stats_handlers",
+    "handle_stop_profiling": "stats_handlers"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,149 @@
+# ================================================
+# Обработчики для аналитики рынка
+# ================================================
+
+from typing import Dict, Any, List
+import mcp.types as types
+
+from ..analytics import bid_stats
+from .. import progress
+from ..api_client import FreelanceHuntClient
+from ..compact import unpack
+from ..ranking import OPEN_STATUS_ID, is_open, project_skill_ids, top_k
+from .base import create_json_response, create_error_response
+
+
+def _skill_ids(project: Dict[str, Any]) -> set:
+    return {skill.get("id") for skill in (project.get("attributes") or {}).get("skills") or []}
+
+
+async def handle_get_bid_stats(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Сводная статистика по бидам проектов вместо самих бидов"""
+    project_ids = list(arguments.get("project_ids") or [])
+    skill_ids = set(arguments.get("skill_ids") or [])
+    max_pages = arguments.get("max_pages", 10)
+    local_only = arguments.get("local_only", False)
+
+    if not project_ids and not skill_ids:
+        return create_error_response("project_ids or skill_ids is required")
+
+    bids: List[Dict[str, Any]] = []
+    # По навыкам - только уже полученные биды из локального зеркала
+    if skill_ids:
+        for project in client.mirror.views("projects"):
+            if skill_ids & _skill_ids(project):
+                bids.extend(client.mirror.items(f"projects/{project['id']}/bids"))
+
+    done: List[int] = []
+
+    def result() -> Dict[str, Any]:
+        return {
+            "scope": {"project_ids": done, "skill_ids": sorted(skill_ids), "local_only": local_only},
+            **bid_stats(bids)
+        }
+
+    # При дедлайне - статистика по уже обработанным проектам
+    progress.begin(len(project_ids), "projects")
+    progress.set_partial(lambda: result() if bids else None)
+    for project_id in project_ids:
+        if local_only:
+            bids.extend(client.mirror.items(f"projects/{project_id}/bids"))
+        else:
+            bids.extend(await client.paginate(f"/projects/{project_id}/bids", max_pages=max_pages))
+        done.append(project_id)
+        await progress.advance()
+
+    if not bids:
+        return create_error_response("No bids found for the given projects/skills")
+
+    return create_json_response(result())
+
+
+async def handle_get_price_index(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Цены по навыкам из накопленных бюджетов проектов и ставок"""
+    skill_ids = arguments.get("skill_ids") or client.price_index.skills()[:arguments.get("limit", 10)]
+    currency = arguments.get("currency")
+
+    if not skill_ids:
+        return create_error_response("Price index is empty: no projects with budgets have been fetched yet")
+
+    return create_json_response({
+        "skills": [client.price_index.lookup(skill_id, currency) for skill_id in skill_ids],
+        "observed": client.price_index.stats()
+    })
+
+
+async def handle_rank_projects_for_me(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Проекты, лучше всего подходящие навыкам моего профиля, с оценкой"""
+    limit = arguments.get("top_k", 10)
+    pages = arguments.get("pages", 2)
+    only_remote = arguments.get("only_remote", False)
+    min_score = arguments.get("min_score", 0.0)
+
+    my_skills = await client.get_my_skills()
+    if not my_skills:
+        return create_error_response("My profile has no skills to match projects against")
+
+    my_bid_projects = await client.get_my_bid_project_ids()
+
+    def rank() -> Dict[str, Any]:
+        # Ранжирование по компактной форме, распаковываются только попавшие в ответ поля;
+        # кандидаты - открытые для ставок проекты без моей ставки
+        candidates = [
+            project for project in client.mirror.views("projects")
+            if is_open(project)
+            and project.get("id") not in my_bid_projects
+            and (not only_remote or project.get("attributes", {}).get("is_remote_job"))
+        ]
+
+        ranked = []
+        for score, project in top_k(my_skills, candidates, limit, min_score):
+            attributes = project.get("attributes") or {}
+            ranked.append({
+                "id": project.get("id"),
+                "name": attributes.get("name"),
+                "score": round(score, 3),
+                "matched_skills": [my_skills[skill_id] for skill_id in project_skill_ids(project) if skill_id in my_skills],
+                "budget": unpack(attributes.get("budget")),
+                "bid_count": attributes.get("bid_count"),
+                "published_at": attributes.get("published_at"),
+                "url": ((project.get("links") or {}).get("self") or {}).get("web")
+            })
+        return {"my_skills": sorted(my_skills.values()), "candidates": len(candidates), "projects": ranked}
+
+    # Свежие проекты по моим навыкам попадают в зеркало, кандидаты - все проекты зеркала;
+    # при дедлайне ранжируются уже полученные
+    progress.set_partial(rank)
+    if pages:
+        await client.paginate(
+            "/projects",
+            params={
+                "filter[skill_id]": ",".join(str(skill_id) for skill_id in sorted(my_skills)),
+                "filter[status_id]": OPEN_STATUS_ID
+            },
+            max_pages=pages
+        )
+
+    return create_json_response(rank())
+
+
+async def handle_get_employer_summary(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Сводка по заказчику из локально известных проектов"""
+    employer_id = arguments.get("employer_id")
+    pages = arguments.get("pages", 0)
+    if not employer_id:
+        return create_error_response("employer_id is required")
+
+    # Для незнакомого заказчика - одна страница его проектов
+    if not pages and employer_id not in client.employers:
+        pages = 1
+    progress.set_partial(
+        lambda: client.employers.summary(employer_id, client.duplicates) if employer_id in client.employers else None
+    )
+    if pages:
+        await client.paginate("/projects", params={"filter[employer_id]": employer_id}, max_pages=pages)
+
+    summary = client.employers.summary(employer_id, client.duplicates)
+    if not summary["projects"]:
+        return create_error_response(f"No projects found for employer {employer_id}")
+    return create_json_response(summary)
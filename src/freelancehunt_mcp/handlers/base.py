@@ -6,13 +6,15 @@ import json
 from typing import Dict, Any, List
 import mcp.types as types
 
+from ..metrics import metrics
+from ..tracing import span
+
 
 def create_json_response(data: Any) -> List[types.TextContent]:
     """Создает стандартный JSON ответ для MCP"""
-    return [types.TextContent(
-        type="text",
-        text=json.dumps(data, indent=2, default=str, ensure_ascii=False)
-    )]
+    with span('encode'), metrics.timer('encode_duration_seconds'):
+        text = json.dumps(data, indent=2, default=str, ensure_ascii=False)
+    return [types.TextContent(type="text", text=text)]
 
 
 def create_error_response(message: str) -> List[types.TextContent]:
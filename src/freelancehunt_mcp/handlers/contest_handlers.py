@@ -12,12 +12,19 @@ from .base import create_json_response, create_error_response
 async def handle_search_contests(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
     page = arguments.get("page", 1)
     per_page = arguments.get("per_page", 20)
-    skill_ids = arguments.get("skill_ids")
+    skill_ids = list(arguments.get("skill_ids") or [])
+    resolved = {}
+    
+    if arguments.get("skills"):
+        ids, resolved, unresolved = await client.resolver.skill_ids(arguments["skills"])
+        if unresolved:
+            return create_error_response(f"Unknown skills: {', '.join(unresolved)}. Use resolve_names to look them up")
+        skill_ids += [skill_id for skill_id in ids if skill_id not in skill_ids]
     
     response = await client.search_contests(
         page=page,
         per_page=per_page,
-        skill_ids=skill_ids
+        skill_ids=skill_ids or None
     )
     
     result = {
@@ -25,6 +32,8 @@ async def handle_search_contests(client: FreelanceHuntClient, arguments: Dict[st
         "links": response.links,
         "meta": response.meta
     }
+    if resolved:
+        result["resolved"] = resolved
     
     return create_json_response(result)
 
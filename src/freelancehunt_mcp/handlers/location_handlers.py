@@ -6,7 +6,7 @@ from typing import Dict, Any, List
 import mcp.types as types
 
 from ..api_client import FreelanceHuntClient
-from .base import create_json_response
+from .base import create_json_response, create_error_response
 
 
 async def handle_get_skills(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
@@ -29,7 +29,6 @@ async def handle_get_cities(client: FreelanceHuntClient, arguments: Dict[str, An
     country_id = arguments.get("country_id")
     
     if not country_id:
-        from .base import create_error_response
         return create_error_response("country_id is required")
     
     cities = await client.get_cities(country_id)
@@ -40,3 +39,22 @@ async def handle_get_cities(client: FreelanceHuntClient, arguments: Dict[str, An
     }
     
     return create_json_response(result)
+
+
+async def handle_resolve_names(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """ID навыков, стран и городов по названиям без выгрузки справочников"""
+    kind = arguments.get("kind", "skill")
+    queries = list(arguments.get("names") or [])
+    limit = arguments.get("limit", 3)
+    country_id = arguments.get("country_id")
+
+    if not queries:
+        return create_error_response("names is required")
+
+    return create_json_response({
+        "kind": kind,
+        "matches": {
+            query: await client.resolver.resolve(kind, query, limit, country_id)
+            for query in queries
+        }
+    })
@@ -15,14 +15,31 @@ from .base import create_json_response, create_error_response
 async def handle_search_projects(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
     page = arguments.get("page", 1)
     per_page = arguments.get("per_page", 20)
+    skill_ids = list(arguments.get("skill_ids") or [])
+    location_id = arguments.get("location_id")
+    resolved = {}
+    
+    # Названия навыков и локации -> ID
+    if arguments.get("skills"):
+        ids, resolved, unresolved = await client.resolver.skill_ids(arguments["skills"])
+        if unresolved:
+            return create_error_response(f"Unknown skills: {', '.join(unresolved)}. Use resolve_names to look them up")
+        skill_ids += [skill_id for skill_id in ids if skill_id not in skill_ids]
+    if arguments.get("location") and not location_id:
+        match = await client.resolver.best("location", arguments["location"])
+        if match is None:
+            return create_error_response(f"Unknown location: {arguments['location']}. Use resolve_names to look it up")
+        location_id = match["id"]
+        resolved[arguments["location"]] = {"id": match["id"], "name": match["name"], "type": match["type"]}
     
     # Build search filters
     filters = SearchFilters(
-        skill_id=arguments.get("skill_ids"),
+        skill_id=skill_ids or None,
         budget_from=arguments.get("budget_from"),
         budget_to=arguments.get("budget_to"),
         employer_id=arguments.get("employer_id"),
-        only_remote=arguments.get("only_remote")
+        only_remote=arguments.get("only_remote"),
+        location_id=location_id
     )
     
     response = await client.search_projects(
@@ -31,15 +48,71 @@ async def handle_search_projects(client: FreelanceHuntClient, arguments: Dict[st
         filters=filters
     )
     
+    projects = response.data
+    collapsed = {}
+    if arguments.get("collapse_duplicates"):
+        # Из каждой группы дублей на странице остается первый (самый свежий) проект
+        groups = client.duplicates.collapse([project.id for project in projects])
+        collapsed = {project_id: duplicates for project_id, duplicates in groups.items() if duplicates}
+        projects = [project for project in projects if project.id in groups]
+    
     result = {
-        "projects": [project.model_dump() for project in response.data],
+        "projects": [project.model_dump() for project in projects],
         "meta": response.meta,
         "links": response.links
     }
+    if collapsed:
+        result["collapsed_duplicates"] = collapsed
+    if resolved:
+        result["resolved"] = resolved
     
     return create_json_response(result)
 
 
+def _duplicate_summary(project: Dict[str, Any]) -> Dict[str, Any]:
+    attributes = project.get("attributes") or {}
+    return {
+        "id": project.get("id"),
+        "name": attributes.get("name"),
+        "employer": (attributes.get("employer") or {}).get("login"),
+        "published_at": attributes.get("published_at")
+    }
+
+
+async def handle_find_duplicate_projects(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Дубли и перепубликации среди уже полученных проектов"""
+    project_id = arguments.get("project_id")
+    threshold = arguments.get("threshold")
+    limit = arguments.get("limit", 20)
+
+    if project_id:
+        if project_id not in client.duplicates:
+            await client.get_project(project_id)
+        duplicates = [
+            {**_duplicate_summary(client.mirror.get("projects", other) or {"id": other}), "similarity": round(score, 3)}
+            for other, score in client.duplicates.similar(project_id, threshold)
+        ]
+        return create_json_response({
+            "project": _duplicate_summary(client.mirror.get("projects", project_id) or {"id": project_id}),
+            "duplicates": duplicates[:limit]
+        })
+
+    clusters = client.duplicates.clusters(threshold)
+    return create_json_response({
+        "indexed_projects": len(client.duplicates),
+        "clusters": len(clusters),
+        "duplicate_projects": sum(len(cluster) for cluster in clusters),
+        "groups": [
+            sorted(
+                (_duplicate_summary(client.mirror.get("projects", member) or {"id": member}) for member in cluster),
+                key=lambda summary: str(summary["published_at"] or ""),
+                reverse=True
+            )
+            for cluster in clusters[:limit]
+        ]
+    })
+
+
 async def handle_get_project(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
     project_id = arguments.get("project_id")
     if not project_id:
@@ -0,0 +1,49 @@
+# ================================================
+# Обработчики для статистики и диагностики сервера
+# ================================================
+
+import os
+from typing import Dict, Any, List
+import mcp.types as types
+
+from ..api_client import FreelanceHuntClient
+from ..metrics import metrics
+from ..profiling import profiler
+from .base import create_json_response, create_error_response
+
+
+async def handle_get_server_stats(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    client.collect_gauges()
+    
+    hits = metrics.counter_value("cache_requests_total", result="hit")
+    misses = metrics.counter_value("cache_requests_total", result="miss")
+    
+    result = {
+        "cache_hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+        "upstream_requests": metrics.counter_value("upstream_requests_total"),
+        **metrics.snapshot()
+    }
+    
+    return create_json_response(result)
+
+
+async def handle_start_profiling(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    try:
+        info = profiler.start(
+            duration=arguments.get("duration", 60),
+            mode=arguments.get("mode", "sample"),
+            interval=arguments.get("interval", 0.005),
+            trace_memory=arguments.get("trace_memory", False),
+            output_dir=os.getenv("PROFILE_DIR", ".")
+        )
+    except (RuntimeError, ValueError) as e:
+        return create_error_response(str(e))
+    
+    return create_json_response({"message": "Profiling started", **info})
+
+
+async def handle_stop_profiling(client: FreelanceHuntClient, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    if not profiler.active:
+        return create_error_response("Profiling is not running")
+    
+    return create_json_response({"message": "Profiling stopped", "files": profiler.stop()})
@@ -0,0 +1,206 @@
+# ================================================
+# Метрики сервера: счетчики, гистограммы, gauges
+# ================================================
+
+import asyncio
+import re
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelsKey = Tuple[Tuple[str, str], ...]
+
+_ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+
+def endpoint_label(endpoint: str) -> str:
+    """/projects/123/bids -> /projects/{id}/bids (ограничивает кардинальность меток)"""
+    return _ID_SEGMENT.sub('/{id}', '/' + endpoint.strip('/'))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Оценка квантиля по бакетам (линейная интерполяция внутри бакета)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for index, bucket_count in enumerate(self.counts):
+            upper = self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+            if bucket_count and seen + bucket_count >= rank:
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+            lower = upper
+        return self.buckets[-1]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            **{
+                name: round(value, 6) if value is not None else None
+                for name, value in (("p50", self.quantile(0.5)), ("p95", self.quantile(0.95)), ("p99", self.quantile(0.99)))
+            }
+        }
+
+
+class Metrics:
+    """Реестр метрик в памяти процесса"""
+
+    def __init__(self, prefix: str = "freelancehunt_"):
+        self.prefix = prefix
+        self._counters: Dict[str, Dict[LabelsKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelsKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelsKey, Histogram]] = {}
+
+    @staticmethod
+    def _key(labels: Dict[str, Any]) -> LabelsKey:
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        series = self._counters.setdefault(name, {})
+        key = self._key(labels)
+        series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        self._gauges.setdefault(name, {})[self._key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        series = self._histograms.setdefault(name, {})
+        key = self._key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram()
+        histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def counter_value(self, name: str, **labels: Any) -> float:
+        """Сумма счетчика по всем сериям, совпадающим с переданными метками"""
+        wanted = set(self._key(labels))
+        return sum(
+            value for key, value in self._counters.get(name, {}).items()
+            if wanted.issubset(key)
+        )
+
+    def reset(self) -> None:
+        self._counters.clear()
+        self._gauges.clear()
+        self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        def series_name(labels: LabelsKey) -> str:
+            return ",".join(f"{name}={value}" for name, value in labels) or "total"
+
+        return {
+            "counters": {
+                name: {series_name(key): value for key, value in series.items()}
+                for name, series in sorted(self._counters.items())
+            },
+            "gauges": {
+                name: {series_name(key): value for key, value in series.items()}
+                for name, series in sorted(self._gauges.items())
+            },
+            "histograms": {
+                name: {series_name(key): histogram.summary() for key, histogram in series.items()}
+                for name, series in sorted(self._histograms.items())
+            }
+        }
+
+    def render_prometheus(self) -> str:
+        """Текстовый формат экспозиции Prometheus"""
+        def fmt_labels(labels: LabelsKey, extra: Optional[Tuple[str, str]] = None) -> str:
+            items = list(labels) + ([extra] if extra else [])
+            if not items:
+                return ""
+            return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in items) + "}"
+
+        lines: List[str] = []
+        for name, series in sorted(self._counters.items()):
+            lines.append(f"# TYPE {self.prefix}{name} counter")
+            for key, value in series.items():
+                lines.append(f"{self.prefix}{name}{fmt_labels(key)} {value:g}")
+        for name, series in sorted(self._gauges.items()):
+            lines.append(f"# TYPE {self.prefix}{name} gauge")
+            for key, value in series.items():
+                lines.append(f"{self.prefix}{name}{fmt_labels(key)} {value:g}")
+        for name, series in sorted(self._histograms.items()):
+            lines.append(f"# TYPE {self.prefix}{name} histogram")
+            for key, histogram in series.items():
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f"{self.prefix}{name}_bucket{fmt_labels(key, ('le', f'{bound:g}'))} {cumulative}")
+                lines.append(f"{self.prefix}{name}_bucket{fmt_labels(key, ('le', '+Inf'))} {histogram.count}")
+                lines.append(f"{self.prefix}{name}_sum{fmt_labels(key)} {histogram.sum:.6f}")
+                lines.append(f"{self.prefix}{name}_count{fmt_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+# Общий реестр процесса
+metrics = Metrics()
+
+
+# ================================================
+# HTTP эндпоинт /metrics
+# ================================================
+
+async def serve_metrics(host: str, port: int, render: Callable[[], str]) -> asyncio.AbstractServer:
+    """Минимальный HTTP/1.0 сервер, отдающий render() на GET /metrics"""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, body = "200 OK", render().encode()
+            else:
+                status, body = "404 Not Found", b"Not found\n"
+            writer.write(
+                f"HTTP/1.0 {status}\r\n"
+                f"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except Exception as e:
+            print(f"Metrics endpoint error: {e}", file=sys.stderr)
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
@@ -0,0 +1,233 @@
+# ================================================
+# Локальное зеркало сущностей API
+# ================================================
+#
+# Каждый успешный GET-ответ раскладывается по коллекциям (путь без query):
+#   projects, freelancers, contests, threads, skills, countries, my/bids,
+#   cities/{country}, projects/{id}/bids, projects/{id}/comments,
+#   freelancers/{id}/portfolio, freelancers/{id}/reviews, my/profile
+# Ответы по ID (/projects/123) попадают в родительскую коллекцию.
+
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .cache import read_snapshot
+from .cassette import read_cassette
+from .compact import pack, unpack
+from .compression import open_text
+
+
+# Коллекции, в которые попадают ответы по ID
+_DETAIL_PATH = re.compile(r'^(projects|freelancers|contests)/(\d+)$')
+
+# Слушатель: (коллекция, сырой элемент) после каждого добавления или обновления
+Listener = Callable[[str, Dict[str, Any]], None]
+# Слушатель вытеснения: (коллекция, ID элемента) после удаления элемента сверх лимита
+EvictListener = Callable[[str, Any], None]
+
+
+def detail_key(endpoint: str) -> Optional[Tuple[str, int]]:
+    """/projects/123 -> ("projects", 123); None, если эндпоинт не ответ по ID"""
+    detail = _DETAIL_PATH.match(collection_name(endpoint))
+    return (detail.group(1), int(detail.group(2))) if detail else None
+
+
+def collection_name(endpoint: str) -> str:
+    """/projects/1/bids?page[number]=2 -> projects/1/bids"""
+    return endpoint.split('?', 1)[0].strip('/')
+
+
+def collection_kind(collection: str) -> str:
+    """Тип элементов коллекции: последний нечисловой сегмент (projects/1/bids -> bids)"""
+    segments = [segment for segment in collection.split('/') if not segment.isdigit()]
+    return segments[-1] if segments else collection
+
+
+def item_key(item: Dict[str, Any]) -> Any:
+    """ID элемента; у элементов без ID (отзывы и т.п.) - их содержимое"""
+    item_id = item.get('id')
+    if item_id is not None:
+        return item_id
+    return json.dumps(item, sort_keys=True, ensure_ascii=False)
+
+
+def read_mirror(path: str) -> List[Tuple[str, Dict[str, Any], float]]:
+    """(коллекция, элемент, время получения); записи без stored_at считаются давними"""
+    with open_text(path, "r") as f:
+        return [
+            (record["collection"], record["item"], record.get("stored_at", 0.0))
+            for record in (json.loads(line) for line in f if line.strip())
+        ]
+
+
+class LocalMirror:
+    """Сущности, когда-либо полученные от API, по коллекциям и ID"""
+
+    def __init__(self, compact: Optional[bool] = None, max_entries: Optional[int] = None):
+        # Элементы хранятся в компактной форме (compact.Node), dict собирается при чтении
+        if compact is None:
+            compact = os.getenv('MIRROR_COMPACT', '1').lower() not in ('0', 'false', 'no')
+        self.compact = compact
+        # Сверх лимита вытесняются давно не обновлявшиеся элементы; 0 - без ограничения
+        if max_entries is None:
+            max_entries = int(os.getenv('MIRROR_MAX_ENTRIES', '20000'))
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._collections: Dict[str, Dict[Any, Any]] = {}
+        # Время последнего обновления элементов, от давних к свежим
+        self._updated: "OrderedDict[Tuple[str, Any], float]" = OrderedDict()
+        self._listeners: List[Listener] = []
+        self._evict_listeners: List[EvictListener] = []
+
+    def add_listener(self, listener: Listener, on_evict: Optional[EvictListener] = None) -> None:
+        """on_evict - чтобы слушатель удалял из своих индексов вытесненные элементы"""
+        self._listeners.append(listener)
+        if on_evict is not None:
+            self._evict_listeners.append(on_evict)
+
+    def ingest(self, endpoint: str, payload: Any) -> int:
+        """Разложить ответ API по коллекциям; возвращает число элементов"""
+        if not isinstance(payload, dict):
+            return 0
+        data = payload.get('data')
+        path = collection_name(endpoint)
+
+        if isinstance(data, list):
+            for item in data:
+                if isinstance(item, dict):
+                    self._store(path, item_key(item), item)
+            return len(data)
+
+        if isinstance(data, dict):
+            detail = detail_key(path)
+            if detail:
+                self._store(*detail, data)
+            else:
+                self._store(path, item_key(data), data)
+            return 1
+        return 0
+
+    def _store(self, collection: str, item_id: Any, item: Dict[str, Any], stored_at: Optional[float] = None) -> None:
+        items = self._collections.setdefault(collection, {})
+        current = items.get(item_id)
+        if current is not None:
+            current = unpack(current)
+            if 'attributes' in current and 'attributes' in item:
+                # Ответ по ID и элемент списка содержат разные наборы атрибутов
+                item = {**current, **item, 'attributes': {**current['attributes'], **item['attributes']}}
+        items[item_id] = pack(item) if self.compact else item
+        self._updated[(collection, item_id)] = time.time() if stored_at is None else stored_at
+        self._updated.move_to_end((collection, item_id))
+        self._evict()
+        for listener in self._listeners:
+            listener(collection, item)
+
+    def _evict(self) -> None:
+        while self.max_entries > 0 and len(self._updated) > self.max_entries:
+            (collection, item_id), _ = self._updated.popitem(last=False)
+            items = self._collections[collection]
+            del items[item_id]
+            if not items:
+                del self._collections[collection]
+            self.evictions += 1
+            for listener in self._evict_listeners:
+                listener(collection, item_id)
+
+    def get(self, collection: str, item_id: Any) -> Optional[Dict[str, Any]]:
+        stored = self._collections.get(collection, {}).get(item_id)
+        return unpack(stored) if stored is not None else None
+
+    def age(self, collection: str, item_id: Any) -> Optional[float]:
+        """Секунд с последнего обновления элемента"""
+        stored_at = self._updated.get((collection, item_id))
+        return time.time() - stored_at if stored_at is not None else None
+
+    def items(self, collection: str) -> List[Dict[str, Any]]:
+        return [unpack(stored) for stored in self._collections.get(collection, {}).values()]
+
+    def views(self, collection: str) -> List[Any]:
+        """Элементы без распаковки (compact.Node читается как dict) - для фильтров и сортировки"""
+        return list(self._collections.get(collection, {}).values())
+
+    def contains(self, collection: str, item_id: Any) -> bool:
+        return item_id in self._collections.get(collection, {})
+
+    def has(self, collection: str) -> bool:
+        return collection in self._collections
+
+    def collections(self) -> List[str]:
+        return sorted(self._collections)
+
+    def counts(self) -> Dict[str, int]:
+        """Число элементов по типам коллекций"""
+        counts: Dict[str, int] = {}
+        for collection, items in self._collections.items():
+            kind = collection_kind(collection)
+            counts[kind] = counts.get(kind, 0) + len(items)
+        return counts
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._collections.values())
+
+    # ------------------------------------------------
+    # Сохранение и источники данных
+    # ------------------------------------------------
+
+    def iter_records(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for collection, items in self._collections.items():
+            for stored in items.values():
+                yield collection, unpack(stored)
+
+    def stored_records(self) -> List[Tuple[str, Any, float]]:
+        """Элементы в форме хранения (неизменяемые) со временем получения - для записи в отдельном потоке"""
+        return [
+            (collection, stored, self._updated[(collection, item_id)])
+            for collection, items in self._collections.items() for item_id, stored in items.items()
+        ]
+
+    def save(self, path: str, records: Optional[Iterable[Tuple[str, Any, float]]] = None) -> int:
+        """JSON lines {"collection", "item", "stored_at"}; запись через временный файл"""
+        # Временный файл с тем же расширением, чтобы сохранить сжатие
+        tmp_path = os.path.join(os.path.dirname(os.path.abspath(path)), f".{os.getpid()}.{os.path.basename(path)}")
+        count = 0
+        with open_text(tmp_path, "w") as f:
+            for collection, item, stored_at in (self.stored_records() if records is None else records):
+                record = {"collection": collection, "item": unpack(item), "stored_at": stored_at}
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+                count += 1
+        os.replace(tmp_path, path)
+        return count
+
+    def restore(self, records: Iterable[Tuple[str, Dict[str, Any], float]]) -> int:
+        """Добавить сохраненные элементы, не затирая и не вытесняя уже полученные от API"""
+        count = 0
+        for collection, item, stored_at in records:
+            if self.max_entries > 0 and len(self._updated) >= self.max_entries:
+                break
+            key = item_key(item)
+            if not self.contains(collection, key):
+                self._store(collection, key, item, stored_at)
+                # Сохраненные элементы старше полученных в этом процессе
+                self._updated.move_to_end((collection, key), last=False)
+                count += 1
+        return count
+
+    def load(self, path: str) -> int:
+        return self.restore(read_mirror(path))
+
+    def ingest_cache_snapshot(self, path: str) -> int:
+        return sum(self.ingest(key, entry.payload) for key, entry in read_snapshot(path))
+
+    def ingest_cassette(self, path: str) -> int:
+        count = 0
+        for record in read_cassette(path):
+            if record.get("method") == "GET" and record.get("status") == 200:
+                try:
+                    count += self.ingest(record["path"], json.loads(record["response"]))
+                except ValueError:
+                    continue
+        return count
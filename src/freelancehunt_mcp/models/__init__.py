@@ -1,12 +1,63 @@
 # ================================================
 # Экспорт всех моделей
 # ================================================
+#
+# Модуль с моделью импортируется при первом обращении к имени (models.Project,
+# from .models import Project), а не при импорте пакета.
 
-from .base import *
-from .project import *
-from .freelancer import *
-from .contest import *
-from .bid import *
-from .thread import *
-from .location import *
-from .filters import *
+import importlib
+from typing import Any, List
+
+# Имя -> модуль пакета
+_EXPORTS = {
+    "Avatar": "base",
+    "ProjectSkill": "base",
+    "ProjectBudget": "base",
+    "Tag": "base",
+    "Country": "base",
+    "CountriesResponse": "base",
+    "ProjectStatus": "project",
+    "Employer": "project",
+    "ProjectAttributes": "project",
+    "ProjectLinks": "project",
+    "Project": "project",
+    "ProjectsListResponse": "project",
+    "ProjectCommentAttributes": "project",
+    "ProjectComment": "project",
+    "ProjectCommentsResponse": "project",
+    "FreelancerAttributes": "freelancer",
+    "FreelancerProfile": "freelancer",
+    "UserProfile": "freelancer",
+    "PortfolioItem": "freelancer",
+    "PortfolioResponse": "freelancer",
+    "ContestAttributes": "contest",
+    "Contest": "contest",
+    "ContestsResponse": "contest",
+    "BidStatus": "bid",
+    "BidAttributes": "bid",
+    "Bid": "bid",
+    "BidsResponse": "bid",
+    "CreateBidRequest": "bid",
+    "ThreadParticipant": "thread",
+    "ThreadParticipants": "thread",
+    "ThreadAttributes": "thread",
+    "Thread": "thread",
+    "ThreadsListResponse": "thread",
+    "Location": "location",
+    "SearchFilters": "filters"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -38,6 +38,7 @@ class Bid(BaseModel):
 class BidsResponse(BaseModel):
     data: List[Bid]
     links: Dict[str, str] = {}
+    meta: Optional[Dict[str, Any]] = {}
 
 
 class CreateBidRequest(BaseModel):
@@ -47,4 +48,3 @@ class CreateBidRequest(BaseModel):
     safe_type: Optional[str] = None  # null, employer, developer, split, employer_cashless
     comment: str
     is_hidden: Optional[bool] = False
-    meta: Optional[Dict[str, Any]] = {}
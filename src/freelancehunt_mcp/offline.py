@@ -0,0 +1,221 @@
+# ================================================
+# Офлайн-режим: клиент поверх локального зеркала и кэша
+# ================================================
+#
+# Публичные методы FreelanceHuntClient не меняются: подменяется только _make_request,
+# который собирает ответ в формате API из LocalMirror (фильтры и пагинация локально),
+# а для прочих запросов отдает точные ответы из снимка кэша или кассеты.
+
+import json
+import math
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlencode
+
+from .api_client import FreelanceHuntAPIError, FreelanceHuntClient, FreelanceHuntNotFoundError
+from .cache import read_snapshot
+from .cassette import read_cassette
+from .metrics import metrics
+from .compact import unpack
+from .mirror import LocalMirror, collection_kind, collection_name
+
+
+def _published_at(item: Dict[str, Any]) -> str:
+    return str(item.get('attributes', {}).get('published_at') or '')
+
+
+def _csv_ints(value: Any) -> List[int]:
+    return [int(part) for part in str(value).split(',') if part.strip()]
+
+
+def _project_matches(project: Dict[str, Any], params: Dict[str, Any]) -> bool:
+    attributes = project.get('attributes', {})
+
+    skill_ids = params.get('filter[skill_id]')
+    if skill_ids and not set(_csv_ints(skill_ids)) & {skill.get('id') for skill in attributes.get('skills') or []}:
+        return False
+
+    employer_id = params.get('filter[employer_id]')
+    if employer_id is not None and (attributes.get('employer') or {}).get('id') != int(employer_id):
+        return False
+
+    status_id = params.get('filter[status_id]')
+    if status_id is not None and (attributes.get('status') or {}).get('id') != int(status_id):
+        return False
+
+    only_remote = params.get('filter[only_remote]')
+    if only_remote in (True, 'true', '1', 1) and not attributes.get('is_remote_job'):
+        return False
+
+    location_id = params.get('filter[location_id]')
+    if location_id is not None:
+        location = attributes.get('location') or {}
+        ids = {(location.get('city') or {}).get('id'), (location.get('country') or {}).get('id')}
+        if int(location_id) not in ids:
+            return False
+
+    amount = ((attributes.get('budget') or {}).get('amount'))
+    budget_from = params.get('filter[budget_from]')
+    if budget_from is not None and (amount is None or float(amount) < float(budget_from)):
+        return False
+    budget_to = params.get('filter[budget_to]')
+    if budget_to is not None and (amount is None or float(amount) > float(budget_to)):
+        return False
+    return True
+
+
+def _bid_matches(bid: Dict[str, Any], params: Dict[str, Any]) -> bool:
+    attributes = bid.get('attributes', {})
+    if 'is_winner' in params and int(bool(attributes.get('is_winner'))) != int(params['is_winner']):
+        return False
+    if params.get('status') and attributes.get('status') != params['status']:
+        return False
+    return True
+
+
+def _contest_matches(contest: Dict[str, Any], params: Dict[str, Any]) -> bool:
+    skill_ids = params.get('filter[skill_id]')
+    if not skill_ids:
+        return True
+    return (contest.get('attributes', {}).get('skill') or {}).get('id') in set(_csv_ints(skill_ids))
+
+
+# Тип коллекции -> фильтр по параметрам запроса API
+FILTERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], bool]] = {
+    'projects': _project_matches,
+    'bids': _bid_matches,
+    'contests': _contest_matches
+}
+
+# Коллекции, которые API отдает от новых к старым
+SORTED_BY_DATE = ('projects', 'bids', 'contests', 'comments', 'reviews')
+
+
+class OfflineClient(FreelanceHuntClient):
+    """Read-only клиент без сети: отвечает из зеркала, снимка кэша и кассеты"""
+
+    offline = True
+
+    def __init__(self, mirror: Optional[LocalMirror] = None, base_url: Optional[str] = None):
+        super().__init__(api_key='offline', base_url=base_url)
+        # Офлайн-данные не вытесняются из кэша
+        self.cache.max_entries = sys.maxsize
+        self.cache.max_bytes = 0
+        self.mirror.max_entries = 0
+        if mirror is not None:
+            self.attach_mirror(mirror)
+
+    @classmethod
+    def from_env(cls) -> "OfflineClient":
+        """Источники: MIRROR_PATH, CACHE_SNAPSHOT_PATH, CASSETTE_PATH (те, что существуют)"""
+        client = cls()
+        loaded = {}
+
+        mirror_path = os.getenv('MIRROR_PATH')
+        if mirror_path and os.path.exists(mirror_path):
+            loaded[mirror_path] = client.mirror.load(mirror_path)
+
+        snapshot_path = os.getenv('CACHE_SNAPSHOT_PATH')
+        if snapshot_path and os.path.exists(snapshot_path):
+            entries = read_snapshot(snapshot_path)
+            for key, entry in entries:
+                client.cache.restore(key, entry)
+                client.mirror.ingest(key, entry.payload)
+            loaded[snapshot_path] = len(entries)
+
+        cassette_path = os.getenv('CASSETTE_PATH')
+        if cassette_path and os.path.exists(cassette_path):
+            count = 0
+            for record in read_cassette(cassette_path):
+                if record.get('method') != 'GET' or record.get('status') != 200:
+                    continue
+                try:
+                    payload = json.loads(record['response'])
+                except ValueError:
+                    continue
+                client.cache.set(record['path'], payload)
+                client.mirror.ingest(record['path'], payload)
+                count += 1
+            loaded[cassette_path] = count
+
+        if not loaded:
+            print("Warning: offline mode without data; set MIRROR_PATH, CACHE_SNAPSHOT_PATH or CASSETTE_PATH", file=sys.stderr)
+        for path, count in loaded.items():
+            print(f"Offline data: {count} records from {path}", file=sys.stderr)
+        return client
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        min_ttl: float = 0.0
+    ) -> Dict[str, Any]:
+        if method != 'GET':
+            raise FreelanceHuntAPIError(f"Offline mode is read-only: {method} {endpoint} is not available")
+
+        params = params or {}
+        group = collection_kind(collection_name(endpoint))
+        response = self._from_mirror(endpoint, params)
+        result = 'mirror'
+        if response is None:
+            # Точный ответ из снимка кэша или кассеты, без учета TTL
+            entry = self.cache.get(self.cache.make_key(endpoint, params), math.inf)
+            if entry is None:
+                metrics.inc('offline_requests_total', group=group, result='miss')
+                raise FreelanceHuntNotFoundError(f"Resource not found in offline data: {endpoint}")
+            response = entry.payload
+            result = 'cache'
+        metrics.inc('offline_requests_total', group=group, result=result)
+        return response
+
+    def _from_mirror(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        path = collection_name(endpoint)
+        segments = path.split('/')
+
+        # Ответ по ID: /projects/123, /freelancers/45, /contests/6
+        if len(segments) == 2 and segments[1].isdigit() and segments[0] in ('projects', 'freelancers', 'contests'):
+            item = self.mirror.get(segments[0], int(segments[1]))
+            return {'data': item} if item is not None else None
+
+        if not self.mirror.has(path):
+            return None
+        # Фильтры и сортировка по компактной форме, распаковывается только отданная страница
+        items = self.mirror.views(path)
+        if path == 'my/profile':
+            return {'data': unpack(items[0])}
+
+        kind = collection_kind(path)
+        matches = FILTERS.get(kind)
+        if matches:
+            items = [item for item in items if matches(item, params)]
+        if kind in SORTED_BY_DATE:
+            items.sort(key=_published_at, reverse=True)
+        if 'page[number]' not in params and 'page[size]' not in params:
+            return {'data': [unpack(item) for item in items]}
+        return self._page(path, params, items)
+
+    def _page(self, path: str, params: Dict[str, Any], items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        number = max(1, int(params.get('page[number]', 1)))
+        size = max(1, int(params.get('page[size]', 20)))
+        last = max(1, math.ceil(len(items) / size))
+
+        def link(page_number: int) -> str:
+            query = {**params, 'page[number]': page_number}
+            return f"{self.base_url.rstrip('/')}/{path}?{urlencode(query)}"
+
+        links = {'self': link(number), 'first': link(1), 'last': link(last)}
+        if number > 1:
+            links['prev'] = link(number - 1)
+        if number < last:
+            links['next'] = link(number + 1)
+
+        data = [unpack(item) for item in items[(number - 1) * size:number * size]]
+        return {
+            'data': data,
+            'links': links,
+            'meta': {'pagination': {'total': len(items), 'count': len(data), 'current_page': number, 'total_pages': last}}
+        }
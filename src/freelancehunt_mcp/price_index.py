@@ -0,0 +1,192 @@
+# ================================================
+# Индекс цен по навыкам (потоковые агрегаты)
+# ================================================
+#
+# Слушатель LocalMirror: бюджеты проектов и ставок складываются в агрегаты
+# (навык, валюта) по мере прохождения ответов через клиент, без пересчета истории.
+# Вытесненные из зеркала проекты и ставки вычитаются из агрегатов.
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class QuantileSketch:
+    """Логарифмические бакеты с относительной точностью (как DDSketch): память O(log(max/min))"""
+
+    __slots__ = ("count", "total", "low", "high", "_buckets")
+
+    # Относительная ошибка квантилей 2%
+    GAMMA = 1.02 / 0.98
+    _LOG_GAMMA = math.log(GAMMA)
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.low = math.inf
+        self.high = -math.inf
+        self._buckets: Dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        if value <= 0:
+            return
+        index = math.ceil(math.log(value) / self._LOG_GAMMA)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.low = min(self.low, value)
+        self.high = max(self.high, value)
+
+    def remove(self, value: float) -> None:
+        """Убрать ранее добавленное значение; min и max остаются границами, пока скетч не опустеет"""
+        if value <= 0:
+            return
+        index = math.ceil(math.log(value) / self._LOG_GAMMA)
+        count = self._buckets.get(index, 0)
+        if not count:
+            return
+        if count == 1:
+            del self._buckets[index]
+        else:
+            self._buckets[index] = count - 1
+        self.count -= 1
+        self.total -= value
+        if not self.count:
+            self.total = 0.0
+            self.low = math.inf
+            self.high = -math.inf
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """Квантили по возрастанию qs за один проход по бакетам"""
+        ranks = [q * (self.count - 1) for q in qs]
+        result: List[float] = []
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            while len(result) < len(ranks) and seen > ranks[len(result)]:
+                value = 2 * self.GAMMA ** index / (self.GAMMA + 1)
+                result.append(min(max(value, self.low), self.high))
+        return result + [self.high] * (len(ranks) - len(result))
+
+    def summary(self) -> Dict[str, Any]:
+        if not self.count:
+            return {"count": 0}
+        p25, p50, p75, p90 = self.quantiles((0.25, 0.5, 0.75, 0.9))
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 2),
+            "min": round(self.low, 2),
+            "p25": round(p25, 2),
+            "p50": round(p50, 2),
+            "p75": round(p75, 2),
+            "p90": round(p90, 2),
+            "max": round(self.high, 2)
+        }
+
+
+# (навыки, валюта, сумма) учтенного проекта или ставки; валюта None - без бюджета
+Observed = Tuple[Tuple[int, ...], Optional[str], float]
+
+
+class PriceIndex:
+    """Агрегаты бюджетов проектов и ставок по (skill_id, валюта)"""
+
+    def __init__(self):
+        self.projects: Dict[Tuple[int, str], QuantileSketch] = {}
+        self.bids: Dict[Tuple[int, str], QuantileSketch] = {}
+        self.skill_names: Dict[int, str] = {}
+        self._currencies: Dict[int, Set[str]] = {}
+        # Учтенные элементы: (навыки, валюта, сумма) - чтобы вычесть их при вытеснении из зеркала
+        self._seen_projects: Dict[int, Observed] = {}
+        self._seen_bids: Dict[int, Observed] = {}
+
+    def observe(self, collection: str, item: Dict[str, Any]) -> None:
+        """Слушатель LocalMirror; каждый проект и ставка учитываются один раз"""
+        if collection == "projects":
+            self._observe_project(item)
+        elif collection.endswith("/bids"):
+            self._observe_bid(item)
+
+    def forget(self, collection: str, item_id: Any) -> None:
+        """Слушатель вытеснения LocalMirror: элемент вычитается из агрегатов"""
+        if collection == "projects":
+            target, observed = self.projects, self._seen_projects.pop(item_id, None)
+        elif collection.endswith("/bids"):
+            target, observed = self.bids, self._seen_bids.pop(item_id, None)
+        else:
+            return
+        if observed is None or observed[1] is None:
+            return
+        skill_ids, currency, amount = observed
+        for skill_id in skill_ids:
+            sketch = target.get((skill_id, currency))
+            if sketch is not None:
+                sketch.remove(amount)
+
+    def _observe_project(self, project: Dict[str, Any]) -> None:
+        project_id = project.get("id")
+        attributes = project.get("attributes") or {}
+        if project_id is None or project_id in self._seen_projects:
+            return
+        skills = attributes.get("skills") or []
+        for skill in skills:
+            if skill.get("name"):
+                self.skill_names[skill["id"]] = skill["name"]
+        skill_ids = tuple(skill["id"] for skill in skills if skill.get("id") is not None)
+        self._seen_projects[project_id] = self._add(self.projects, skill_ids, attributes.get("budget"))
+
+    def _observe_bid(self, bid: Dict[str, Any]) -> None:
+        bid_id = bid.get("id")
+        attributes = bid.get("attributes") or {}
+        project = self._seen_projects.get((attributes.get("project") or {}).get("id"))
+        # Навыки ставки - навыки проекта; ставки неизвестных проектов пропускаются
+        if bid_id is None or bid_id in self._seen_bids or not project or not project[0]:
+            return
+        self._seen_bids[bid_id] = self._add(self.bids, project[0], attributes.get("budget"))
+
+    def _add(
+        self,
+        target: Dict[Tuple[int, str], QuantileSketch],
+        skill_ids: Tuple[int, ...],
+        budget: Optional[Dict[str, Any]]
+    ) -> Observed:
+        if not budget or budget.get("amount") is None or not budget.get("currency"):
+            return skill_ids, None, 0.0
+        amount = float(budget["amount"])
+        for skill_id in skill_ids:
+            sketch = target.get((skill_id, budget["currency"]))
+            if sketch is None:
+                sketch = target[(skill_id, budget["currency"])] = QuantileSketch()
+                self._currencies.setdefault(skill_id, set()).add(budget["currency"])
+            sketch.add(amount)
+        return skill_ids, budget["currency"], amount
+
+    def skills(self) -> List[int]:
+        """Навыки по убыванию числа наблюдений"""
+        counts: Dict[int, int] = {}
+        for series in (self.projects, self.bids):
+            for (skill_id, _), sketch in series.items():
+                counts[skill_id] = counts.get(skill_id, 0) + sketch.count
+        return sorted(counts, key=lambda skill_id: -counts[skill_id])
+
+    def lookup(self, skill_id: int, currency: Optional[str] = None) -> Dict[str, Any]:
+        currencies = sorted(
+            code for code in self._currencies.get(skill_id, ()) if currency is None or code == currency
+        )
+        return {
+            "skill_id": skill_id,
+            "skill": self.skill_names.get(skill_id),
+            "currencies": {
+                code: {
+                    "project_budgets": self.projects.get((skill_id, code), QuantileSketch()).summary(),
+                    "bid_budgets": self.bids.get((skill_id, code), QuantileSketch()).summary()
+                }
+                for code in currencies
+            }
+        }
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "projects": len(self._seen_projects),
+            "bids": len(self._seen_bids),
+            "series": len(self.projects) + len(self.bids)
+        }
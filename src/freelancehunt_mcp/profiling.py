@@ -0,0 +1,175 @@
+# ================================================
+# Профилирование выполнения tools
+# ================================================
+
+import asyncio
+import cProfile
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class ToolProfiler:
+    """Профилирует только время внутри handle_call_tool в течение заданного окна.
+
+    sample   - сэмплер стеков в отдельном потоке, пишет collapsed stacks (flamegraph.pl, speedscope)
+    cprofile - детерминированный cProfile, пишет .prof (pstats, snakeviz, flameprof)
+    """
+
+    MODES = ("sample", "cprofile")
+
+    def __init__(self):
+        self.active = False
+        self.mode: Optional[str] = None
+        self.output_prefix = ""
+        self._generation = 0
+        self._active_calls = 0
+        self._interval = 0.005
+        self._trace_memory = False
+        self._loop_thread_id: Optional[int] = None
+        self._samples: Counter = Counter()
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_sampler = threading.Event()
+        self._profile: Optional[cProfile.Profile] = None
+        self._stop_handle: Optional[asyncio.TimerHandle] = None
+
+    def start(
+        self,
+        duration: float,
+        mode: str = "sample",
+        interval: float = 0.005,
+        trace_memory: bool = False,
+        output_dir: str = "."
+    ) -> Dict[str, Any]:
+        """Запустить окно профилирования; вызывать из потока event loop"""
+        if self.active:
+            raise RuntimeError("Profiling is already running")
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown profiling mode '{mode}', expected one of {', '.join(self.MODES)}")
+
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_prefix = os.path.join(output_dir, f"freelancehunt_profile_{time.strftime('%Y%m%d_%H%M%S')}")
+        self.mode = mode
+        self.active = True
+        self._generation += 1
+        self._active_calls = 0
+        self._interval = interval
+        self._samples.clear()
+        self._loop_thread_id = threading.get_ident()
+
+        if mode == "sample":
+            self._stop_sampler.clear()
+            self._sampler = threading.Thread(target=self._sample_loop, name="tool-profiler", daemon=True)
+            self._sampler.start()
+        else:
+            self._profile = cProfile.Profile()
+
+        self._trace_memory = trace_memory and not tracemalloc.is_tracing()
+        if self._trace_memory:
+            tracemalloc.start(25)
+
+        self._stop_handle = asyncio.get_running_loop().call_later(duration, self.stop)
+        return {"mode": mode, "duration": duration, "files": self._output_files()}
+
+    def stop(self) -> List[str]:
+        """Завершить окно и записать результаты; возвращает пути файлов"""
+        if not self.active:
+            return []
+        self.active = False
+        if self._stop_handle:
+            self._stop_handle.cancel()
+            self._stop_handle = None
+
+        if self._sampler:
+            self._stop_sampler.set()
+            self._sampler.join()
+            self._sampler = None
+            with open(f"{self.output_prefix}.collapsed", "w", encoding="utf-8") as f:
+                for stack, count in self._samples.most_common():
+                    f.write(f"{stack} {count}\n")
+
+        if self._profile:
+            if self._active_calls:
+                self._profile.disable()
+            self._profile.dump_stats(f"{self.output_prefix}.prof")
+            self._profile = None
+
+        if self._trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            snapshot.dump(f"{self.output_prefix}.tracemalloc")
+            with open(f"{self.output_prefix}.tracemalloc.txt", "w", encoding="utf-8") as f:
+                for stat in snapshot.statistics("lineno")[:50]:
+                    f.write(f"{stat}\n")
+
+        files = self._output_files()
+        self._active_calls = 0
+        print(f"Profiling finished: {', '.join(files)}", file=sys.stderr)
+        return files
+
+    def _output_files(self) -> List[str]:
+        files = [f"{self.output_prefix}.collapsed" if self.mode == "sample" else f"{self.output_prefix}.prof"]
+        if self._trace_memory:
+            files += [f"{self.output_prefix}.tracemalloc", f"{self.output_prefix}.tracemalloc.txt"]
+        return files
+
+    @contextmanager
+    def tool_call(self) -> Iterator[None]:
+        """Обернуть выполнение tool: сэмплы и cProfile учитываются только внутри"""
+        if not self.active:
+            yield
+            return
+
+        generation = self._generation
+        self._active_calls += 1
+        if self._profile and self._active_calls == 1:
+            self._profile.enable()
+        try:
+            yield
+        finally:
+            if self.active and generation == self._generation:
+                self._active_calls -= 1
+                if self._profile and self._active_calls == 0:
+                    self._profile.disable()
+
+    def _sample_loop(self) -> None:
+        while not self._stop_sampler.wait(self._interval):
+            if not self._active_calls:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self._samples[";".join(reversed(stack))] += 1
+
+
+# Общий профайлер процесса
+profiler = ToolProfiler()
+
+
+def start_from_env() -> None:
+    """PROFILE_MODE=sample|cprofile включает профилирование на PROFILE_DURATION секунд при старте"""
+    mode = os.getenv('PROFILE_MODE')
+    if not mode:
+        return
+    try:
+        info = profiler.start(
+            duration=float(os.getenv('PROFILE_DURATION', '300')),
+            mode=mode,
+            interval=float(os.getenv('PROFILE_INTERVAL', '0.005')),
+            trace_memory=os.getenv('PROFILE_TRACEMALLOC', '').lower() in ('1', 'true', 'yes'),
+            output_dir=os.getenv('PROFILE_DIR', '.')
+        )
+    except (ValueError, RuntimeError, OSError) as e:
+        # Опечатка в настройках профилирования не должна мешать старту сервера
+        print(f"Warning: profiling not started: {e}", file=sys.stderr)
+        return
+    print(f"Profiling tool calls for {info['duration']:g}s: {', '.join(info['files'])}", file=sys.stderr)
@@ -0,0 +1,131 @@
+# ================================================
+# Прогресс длинных вызовов tools
+# ================================================
+#
+# На время вызова tool в контексте лежит ProgressReporter: пагинация клиента и обработчики
+# сообщают в него страницы и обработанные единицы, он отправляет MCP progress notifications
+# (если клиент передал progressToken) и хранит частичный результат на случай дедлайна.
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, Optional, Tuple
+
+Sender = Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+
+
+class ProgressReporter:
+    """Прогресс одного вызова: страницы, единицы верхнего уровня, ETA, частичный результат"""
+
+    def __init__(self, send: Optional[Sender] = None, min_interval: float = 0.5):
+        self._send = send
+        self.min_interval = min_interval
+        self.started = time.monotonic()
+        self._last_sent = 0.0
+        self.sent = 0
+        # Единицы верхнего уровня (проекты, ID), если обработчик их объявил
+        self.total: Optional[float] = None
+        self.unit = ""
+        self.done = 0.0
+        self._fraction = 0.0
+        # Страницы всех пагинаций вызова
+        self.pages = 0
+        self.items = 0
+        self._pages_left: Optional[int] = None
+        self._partial: Optional[Callable[[], Any]] = None
+
+    def begin(self, total: int, unit: str) -> None:
+        self.total = float(total)
+        self.unit = unit
+
+    async def advance(self, step: float = 1) -> None:
+        self.done += step
+        self._fraction = 0.0
+        await self._emit()
+
+    async def page(self, page: int, total_pages: Optional[int], items: int) -> None:
+        self.pages += 1
+        self.items += items
+        self._pages_left = total_pages - page if total_pages else None
+        if total_pages:
+            self._fraction = max(self._fraction, min(page / total_pages, 1.0))
+        await self._emit()
+
+    def set_partial(self, build: Callable[[], Any]) -> None:
+        """Функция, собирающая результат из уже обработанных данных (вызывается только при дедлайне)"""
+        self._partial = build
+
+    def partial(self) -> Optional[Any]:
+        return self._partial() if self._partial is not None else None
+
+    def _position(self) -> Tuple[float, Optional[float]]:
+        # Значение прогресса по протоколу только растет
+        if self.total is not None:
+            return self.done + self._fraction, self.total
+        if self._pages_left is not None:
+            return float(self.pages), float(self.pages + self._pages_left)
+        return float(self.pages), None
+
+    async def _emit(self) -> None:
+        if self._send is None:
+            return
+        now = time.monotonic()
+        if now - self._last_sent < self.min_interval:
+            return
+        self._last_sent = now
+
+        progress, total = self._position()
+        parts = []
+        if self.total is not None:
+            parts.append(f"{self.done:g}/{self.total:g} {self.unit}")
+        parts.append(f"{self.pages} pages, {self.items} items")
+        if total and progress:
+            parts.append(f"ETA {(now - self.started) * (total - progress) / progress:.0f}s")
+        try:
+            await self._send(progress, total, ", ".join(parts))
+            self.sent += 1
+        except Exception:
+            # Уведомление не должно ронять сам вызов
+            pass
+
+
+_reporter: contextvars.ContextVar[Optional[ProgressReporter]] = contextvars.ContextVar(
+    "freelancehunt_progress", default=None
+)
+
+
+@contextmanager
+def progress_scope(reporter: ProgressReporter) -> Iterator[ProgressReporter]:
+    token = _reporter.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _reporter.reset(token)
+
+
+def current() -> Optional[ProgressReporter]:
+    return _reporter.get()
+
+
+def begin(total: int, unit: str) -> None:
+    reporter = _reporter.get()
+    if reporter is not None:
+        reporter.begin(total, unit)
+
+
+async def advance(step: float = 1) -> None:
+    reporter = _reporter.get()
+    if reporter is not None:
+        await reporter.advance(step)
+
+
+async def page_fetched(page: int, total_pages: Optional[int], items: int) -> None:
+    reporter = _reporter.get()
+    if reporter is not None:
+        await reporter.page(page, total_pages, items)
+
+
+def set_partial(build: Callable[[], Any]) -> None:
+    reporter = _reporter.get()
+    if reporter is not None:
+        reporter.set_partial(build)
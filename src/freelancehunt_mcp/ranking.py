@@ -0,0 +1,92 @@
+# ================================================
+# Ранжирование проектов по навыкам профиля
+# ================================================
+#
+# Навыки - разреженные векторы с весами IDF по кандидатам (редкий общий навык
+# значит больше частого), оценка - косинусное сходство с вектором профиля.
+
+import math
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Статус проекта "Открыт для предложений" - на остальные ставку сделать нельзя
+OPEN_STATUS_ID = 11
+
+
+def is_open(project: Dict[str, Any]) -> bool:
+    return ((project.get("attributes") or {}).get("status") or {}).get("id") == OPEN_STATUS_ID
+
+
+def project_skill_ids(project: Dict[str, Any]) -> List[int]:
+    return [
+        skill["id"] for skill in (project.get("attributes") or {}).get("skills") or []
+        if skill.get("id") is not None
+    ]
+
+
+def _idf(document_frequency: int, documents: int) -> float:
+    return math.log((documents + 1) / (document_frequency + 1)) + 1.0
+
+
+def score_projects(profile_skills: Iterable[int], projects: Sequence[Dict[str, Any]]) -> List[float]:
+    """Косинусное сходство TF-IDF векторов навыков проекта и профиля, по проекту"""
+    profile = set(profile_skills)
+    rows = [project_skill_ids(project) for project in projects]
+    if not profile or not rows:
+        return [0.0] * len(rows)
+
+    if np is not None:
+        columns = {skill_id: index for index, skill_id in enumerate(sorted(profile.union(*map(set, rows))))}
+        matrix = np.zeros((len(rows), len(columns)))
+        row_index = [row for row, skill_ids in enumerate(rows) for _ in skill_ids]
+        column_index = [columns[skill_id] for skill_ids in rows for skill_id in skill_ids]
+        matrix[row_index, column_index] = 1.0
+
+        document_frequency = matrix.sum(axis=0)
+        idf = np.log((len(rows) + 1) / (document_frequency + 1)) + 1.0
+        weighted = matrix * idf
+        profile_vector = np.zeros(len(columns))
+        profile_vector[[columns[skill_id] for skill_id in profile]] = 1.0
+        profile_vector *= idf
+
+        norms = np.linalg.norm(weighted, axis=1) * np.linalg.norm(profile_vector)
+        scores = np.divide(weighted @ profile_vector, norms, out=np.zeros(len(rows)), where=norms > 0)
+        return scores.tolist()
+
+    document_frequency: Dict[int, int] = {}
+    for skill_ids in rows:
+        for skill_id in set(skill_ids):
+            document_frequency[skill_id] = document_frequency.get(skill_id, 0) + 1
+    idf = {skill_id: _idf(count, len(rows)) for skill_id, count in document_frequency.items()}
+    profile_norm = math.sqrt(sum(idf.get(skill_id, _idf(0, len(rows))) ** 2 for skill_id in profile))
+
+    scores = []
+    for skill_ids in rows:
+        unique = set(skill_ids)
+        norm = math.sqrt(sum(idf[skill_id] ** 2 for skill_id in unique))
+        overlap = sum(idf[skill_id] ** 2 for skill_id in unique & profile)
+        scores.append(overlap / (norm * profile_norm) if norm and profile_norm else 0.0)
+    return scores
+
+
+def top_k(
+    profile_skills: Iterable[int],
+    projects: Sequence[Dict[str, Any]],
+    k: int,
+    min_score: float = 0.0
+) -> List[Tuple[float, Dict[str, Any]]]:
+    """Лучшие k проектов; при равной оценке - более свежие"""
+    scores = score_projects(profile_skills, projects)
+    ranked = sorted(
+        (
+            (score, project) for score, project in zip(scores, projects)
+            if score > 0 and score >= min_score
+        ),
+        key=lambda pair: (pair[0], str((pair[1].get("attributes") or {}).get("published_at") or "")),
+        reverse=True
+    )
+    return ranked[:k]
@@ -0,0 +1,205 @@
+# ================================================
+# Поиск ID навыков и локаций по названию
+# ================================================
+#
+# Справочники (навыки, страны, города) загружаются один раз и индексируются:
+# нормализованные названия и их транслитерации (украинская и русская) для точного
+# и префиксного поиска, триграммы - для нечеткого.
+
+import asyncio
+import bisect
+import os
+import re
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .api_client import FreelanceHuntClient
+
+_COMMON = {
+    "а": "a", "б": "b", "в": "v", "д": "d", "е": "e", "ё": "e", "ж": "zh", "з": "z", "й": "y",
+    "к": "k", "л": "l", "м": "m", "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t",
+    "у": "u", "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "shch", "ь": "", "ъ": "",
+    "ю": "yu", "я": "ya", "'": "", "’": ""
+}
+_UKRAINIAN = str.maketrans({**_COMMON, "г": "h", "ґ": "g", "и": "y", "і": "i", "ї": "yi", "є": "ye", "ы": "y", "э": "e"})
+_RUSSIAN = str.maketrans({**_COMMON, "г": "g", "ґ": "g", "и": "i", "і": "i", "ї": "i", "є": "e", "ы": "y", "э": "e"})
+
+_NON_WORD = re.compile(r"[^\w+#]+")
+_CYRILLIC = re.compile(r"[а-яёіїєґ]")
+# Грубый фонетический ключ: Kyiv/Kiev, Kharkiv/Harkov, Dnipro/Dnepr сводятся к общему виду
+_SKELETON = [
+    (re.compile(r"d?zh"), "j"), (re.compile(r"ph"), "f"), (re.compile(r"th"), "t"), (re.compile(r"kh|g"), "h"),
+    (re.compile(r"c(?!h)|ck|q"), "k"), (re.compile(r"x"), "ks"), (re.compile(r"w"), "v"),
+    (re.compile(r"[yie]+"), "i"), (re.compile(r"(.)\1+"), r"\1")
+]
+
+# Минимальная оценка, с которой название в аргументах поиска считается найденным
+MIN_SCORE = 0.45
+
+
+def normalize(text: str) -> str:
+    return _NON_WORD.sub(" ", text.casefold().replace("ё", "е")).strip()
+
+
+def skeleton(text: str) -> str:
+    for pattern, replacement in _SKELETON:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def variants(text: str) -> Set[str]:
+    """Нормализованный текст, его транслитерации и фонетические ключи"""
+    base = normalize(text)
+    if not base:
+        return set()
+    latin = {base.translate(_UKRAINIAN), base.translate(_RUSSIAN)} if _CYRILLIC.search(base) else {base}
+    return {base} | latin | {skeleton(value) for value in latin}
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Индекс названий: точное совпадение, префикс (в том числе отдельного слова), триграммы"""
+
+    def __init__(self):
+        self.entries: List[Dict[str, Any]] = []
+        self._exact: Dict[str, Set[int]] = {}
+        self._prefix_keys: List[Tuple[str, int]] = []
+        self._variants: List[Tuple[int, Set[str]]] = []
+        self._trigrams: Dict[str, Set[int]] = {}
+
+    def add(self, entry_id: int, name: str, aliases: Iterable[str] = (), **extra: Any) -> None:
+        index = len(self.entries)
+        self.entries.append({"id": entry_id, "name": name, **extra})
+        for text in (name, *aliases):
+            for key in variants(text):
+                self._exact.setdefault(key, set()).add(index)
+                for word in {key, *key.split()}:
+                    bisect.insort(self._prefix_keys, (word, index))
+                variant_id = len(self._variants)
+                key_trigrams = trigrams(key)
+                self._variants.append((index, key_trigrams))
+                for trigram in key_trigrams:
+                    self._trigrams.setdefault(trigram, set()).add(variant_id)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Лучшие совпадения: exact 1.0, prefix 0.8-0.95, fuzzy до 0.8"""
+        scores: Dict[int, Tuple[float, str]] = {}
+
+        def offer(index: int, score: float, match: str) -> None:
+            if score > scores.get(index, (0.0, ""))[0]:
+                scores[index] = (score, match)
+
+        for key in variants(query):
+            for index in self._exact.get(key, ()):
+                offer(index, 1.0, "exact")
+
+            position = bisect.bisect_left(self._prefix_keys, (key, -1))
+            while position < len(self._prefix_keys) and self._prefix_keys[position][0].startswith(key):
+                word, index = self._prefix_keys[position]
+                offer(index, 0.8 + 0.15 * len(key) / len(word), "prefix")
+                position += 1
+
+            query_trigrams = trigrams(key)
+            shared: Dict[int, int] = {}
+            for trigram in query_trigrams:
+                for variant_id in self._trigrams.get(trigram, ()):
+                    shared[variant_id] = shared.get(variant_id, 0) + 1
+            for variant_id, count in shared.items():
+                index, variant_trigrams = self._variants[variant_id]
+                dice = 2 * count / (len(query_trigrams) + len(variant_trigrams))
+                if dice >= 0.4:
+                    offer(index, 0.8 * dice, "fuzzy")
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1][0], self.entries[item[0]]["name"]))
+        return [
+            {**self.entries[index], "score": round(score, 3), "match": match}
+            for index, (score, match) in ranked[:limit]
+        ]
+
+
+def _csv_ints(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+class CatalogResolver:
+    """Индексы справочников API, построенные при первом обращении"""
+
+    def __init__(self, client: "FreelanceHuntClient"):
+        self.client = client
+        # Страны, города которых участвуют в поиске локации без указания страны
+        self.city_countries = _csv_ints(os.getenv('RESOLVER_CITY_COUNTRIES', '1'))
+        self._skills: Optional[NameIndex] = None
+        self._countries: Optional[NameIndex] = None
+        self._cities: Dict[int, NameIndex] = {}
+        self._lock = asyncio.Lock()
+
+    async def skills(self) -> NameIndex:
+        async with self._lock:
+            if self._skills is None:
+                index = NameIndex()
+                for skill in await self.client.get_skills():
+                    index.add(skill["id"], skill["name"])
+                self._skills = index
+        return self._skills
+
+    async def countries(self) -> NameIndex:
+        async with self._lock:
+            if self._countries is None:
+                index = NameIndex()
+                for country in await self.client.get_locations():
+                    index.add(country["id"], country["name"], aliases=[country["iso2"]] if country.get("iso2") else ())
+                self._countries = index
+        return self._countries
+
+    async def cities(self, country_id: int) -> NameIndex:
+        async with self._lock:
+            if country_id not in self._cities:
+                index = NameIndex()
+                for city in await self.client.get_cities(country_id):
+                    index.add(city["id"], city["name"], country_id=country_id)
+                self._cities[country_id] = index
+        return self._cities[country_id]
+
+    async def resolve(
+        self,
+        kind: str,
+        query: str,
+        limit: int = 5,
+        country_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """kind: skill, country, city или location (страны и города вместе)"""
+        if kind == "skill":
+            return (await self.skills()).search(query, limit)
+        matches: List[Dict[str, Any]] = []
+        if kind in ("country", "location"):
+            matches += [{**match, "type": "country"} for match in (await self.countries()).search(query, limit)]
+        if kind in ("city", "location"):
+            for city_country in ([country_id] if country_id else self.city_countries):
+                matches += [{**match, "type": "city"} for match in (await self.cities(city_country)).search(query, limit)]
+        return sorted(matches, key=lambda match: -match["score"])[:limit]
+
+    async def best(self, kind: str, query: str) -> Optional[Dict[str, Any]]:
+        matches = await self.resolve(kind, query, limit=1)
+        return matches[0] if matches and matches[0]["score"] >= MIN_SCORE else None
+
+    async def skill_ids(self, names: Iterable[str]) -> Tuple[List[int], Dict[str, Any], List[str]]:
+        """Названия навыков -> (ID, найденные соответствия, не найденные названия)"""
+        ids: List[int] = []
+        resolved: Dict[str, Any] = {}
+        unresolved: List[str] = []
+        for name in names:
+            match = await self.best("skill", name)
+            if match is None:
+                unresolved.append(name)
+                continue
+            resolved[name] = {"id": match["id"], "name": match["name"]}
+            if match["id"] not in ids:
+                ids.append(match["id"])
+        return ids, resolved, unresolved
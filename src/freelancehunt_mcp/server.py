@@ -2,9 +2,16 @@
 # MCP Server для FreelanceHunt API
 # ================================================
 
+import argparse
 import asyncio
+import importlib
+import inspect
+import json
+import math
+import os
 import sys
-from typing import Any, Dict, List, Optional, Sequence
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
 
 from dotenv import load_dotenv
 from mcp.server import NotificationOptions, Server
@@ -12,25 +19,13 @@ from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
 
-from .api_client import FreelanceHuntClient, FreelanceHuntAPIError
-from .handlers import (
-    handle_search_projects,
-    handle_get_project,
-    handle_get_project_bids,
-    handle_get_project_comments,
-    handle_create_bid,
-    handle_get_freelancer,
-    handle_get_my_profile,
-    handle_get_my_bids,
-    handle_get_freelancer_portfolio,
-    handle_get_freelancer_reviews,
-    handle_search_contests,
-    handle_get_contest,
-    handle_get_threads,
-    handle_get_skills,
-    handle_get_countries,
-    handle_get_cities
-)
+from .api_client import DeadlineExceededError, FreelanceHuntClient, FreelanceHuntAPIError
+from .cache import track_stale
+from .deadline import deadline_scope
+from .metrics import metrics, serve_metrics
+from .progress import ProgressReporter, progress_scope
+from .profiling import profiler, start_from_env as start_profiling_from_env
+from .tracing import configure_from_env as configure_tracing, current_trace_id, span, start_trace
 
 # ================================================
 # Инициализация
@@ -46,9 +41,14 @@ server = Server("freelancehunt-mcp")
 client: Optional[FreelanceHuntClient] = None
 
 
-def init_client():
+def init_client(offline: bool = False):
     global client
     try:
+        if offline:
+            from .offline import OfflineClient
+            client = OfflineClient.from_env()
+            print("FreelanceHunt MCP Server initialized in offline mode", file=sys.stderr)
+            return
         client = FreelanceHuntClient()
         print("FreelanceHunt MCP Server initialized successfully", file=sys.stderr)
     except ValueError as e:
@@ -73,8 +73,24 @@ TOOLS_CONFIG = [
                 "skill_ids": {"type": "array", "items": {"type": "integer"}, "description": "List of skill IDs to filter by"},
                 "budget_from": {"type": "number", "description": "Minimum budget"},
                 "budget_to": {"type": "number", "description": "Maximum budget"},
+                "skills": {"type": "array", "items": {"type": "string"}, "description": "Skill names to filter by (any language or transliteration, resolved to IDs)"},
                 "employer_id": {"type": "integer", "description": "Filter by employer ID"},
-                "only_remote": {"type": "boolean", "description": "Show only remote projects"}
+                "only_remote": {"type": "boolean", "description": "Show only remote projects"},
+                "location_id": {"type": "integer", "description": "Filter by country or city ID"},
+                "location": {"type": "string", "description": "Country or city name, resolved to location_id"},
+                "collapse_duplicates": {"type": "boolean", "description": "Keep only the newest project of each group of near-duplicate or reposted projects on the page", "default": False}
+            }
+        }
+    },
+    {
+        "name": "find_duplicate_projects",
+        "description": "Find near-duplicate and reposted projects among projects fetched so far (MinHash similarity of name and description). With project_id returns duplicates of that project, otherwise groups of duplicates",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "project_id": {"type": "integer", "description": "Project to find duplicates of", "minimum": 1},
+                "threshold": {"type": "number", "description": "Minimum estimated text similarity (default: DUPLICATE_THRESHOLD, 0.7)", "minimum": 0.5, "maximum": 1},
+                "limit": {"type": "integer", "description": "Max duplicates or groups to return", "default": 20, "minimum": 1, "maximum": 200}
             }
         }
     },
@@ -220,7 +236,8 @@ TOOLS_CONFIG = [
             "properties": {
                 "page": {"type": "integer", "description": "Page number (default: 1)", "minimum": 1},
                 "per_page": {"type": "integer", "description": "Items per page (default: 20, max: 50)", "minimum": 1, "maximum": 50},
-                "skill_ids": {"type": "array", "items": {"type": "integer"}, "description": "List of skill IDs to filter by"}
+                "skill_ids": {"type": "array", "items": {"type": "integer"}, "description": "List of skill IDs to filter by"},
+                "skills": {"type": "array", "items": {"type": "string"}, "description": "Skill names to filter by (any language or transliteration, resolved to IDs)"}
             }
         }
     },
@@ -248,46 +265,263 @@ TOOLS_CONFIG = [
             },
             "required": ["country_id"]
         }
+    },
+    {
+        "name": "resolve_names",
+        "description": "Resolve skill, country or city names to IDs (normalised, transliteration-aware prefix and fuzzy matching) instead of loading the whole get_skills / get_countries / get_cities catalogue",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "names": {"type": "array", "items": {"type": "string"}, "description": "Names to resolve"},
+                "kind": {"type": "string", "description": "What the names are (location = countries and cities)", "enum": ["skill", "country", "city", "location"], "default": "skill"},
+                "country_id": {"type": "integer", "description": "Country of the cities (default: RESOLVER_CITY_COUNTRIES)", "minimum": 1},
+                "limit": {"type": "integer", "description": "Matches per name", "default": 3, "minimum": 1, "maximum": 20}
+            },
+            "required": ["names"]
+        }
+    },
+    {
+        "name": "get_bid_stats",
+        "description": "Get compact bid market statistics instead of raw bids: budget quantiles per currency, days distribution, safe_type mix and winner vs. other bids spread. Fetches all bid pages of the given projects; skill_ids aggregates bids already seen locally for projects with these skills",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "project_ids": {"type": "array", "items": {"type": "integer"}, "description": "Projects whose bids are aggregated"},
+                "skill_ids": {"type": "array", "items": {"type": "integer"}, "description": "Aggregate locally stored bids of projects with these skills"},
+                "max_pages": {"type": "integer", "description": "Max bid pages fetched per project", "default": 10, "minimum": 1, "maximum": 50},
+                "local_only": {"type": "boolean", "description": "Use only locally stored bids, no API requests", "default": False}
+            }
+        }
+    },
+    {
+        "name": "get_price_index",
+        "description": "Get per-skill price index (count, mean, quantiles) of project budgets and bid budgets per currency, accumulated from all projects and bids fetched so far. Without skill_ids returns the most observed skills",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "skill_ids": {"type": "array", "items": {"type": "integer"}, "description": "Skill IDs to look up"},
+                "currency": {"type": "string", "description": "Only this currency (UAH, USD, EUR, ...)"},
+                "limit": {"type": "integer", "description": "Number of skills when skill_ids is omitted", "default": 10, "minimum": 1, "maximum": 100}
+            }
+        }
+    },
+    {
+        "name": "rank_projects_for_me",
+        "description": "Rank projects by match with the skills of my profile (IDF-weighted cosine similarity) and return only the top-K with scores and matched skills. Candidates are locally known projects open for bids plus fresh pages fetched by my skills; projects I already bid on (from /my/bids, loaded once) are skipped",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "top_k": {"type": "integer", "description": "Number of projects to return", "default": 10, "minimum": 1, "maximum": 100},
+                "pages": {"type": "integer", "description": "Fresh project pages to fetch by my skills (0 = only locally known projects)", "default": 2, "minimum": 0, "maximum": 20},
+                "only_remote": {"type": "boolean", "description": "Only remote projects", "default": False},
+                "min_score": {"type": "number", "description": "Minimum score from 0 to 1", "default": 0, "minimum": 0, "maximum": 1}
+            }
+        }
+    },
+    {
+        "name": "get_employer_summary",
+        "description": "Get an aggregated employer profile from locally known projects: number of projects, budgets per currency, bid counts, share of projects with a chosen freelancer, repost rate and recency. Answers from local data; pages fetches fresh pages of the employer's projects first",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "employer_id": {"type": "integer", "description": "Employer ID", "minimum": 1},
+                "pages": {"type": "integer", "description": "Project pages of the employer to fetch first (0 = local data; one page is fetched for an unknown employer)", "default": 0, "minimum": 0, "maximum": 20}
+            },
+            "required": ["employer_id"]
+        }
+    },
+    {
+        "name": "get_server_stats",
+        "description": "Get server metrics: call counts, error classes, latency percentiles per tool and API endpoint, cache hit ratio, limiter wait time",
+        "schema": {"type": "object", "properties": {}}
+    },
+    {
+        "name": "start_profiling",
+        "description": "Profile tool execution for a time window and write a collapsed-stack (sample) or pstats (cprofile) file, optionally with tracemalloc snapshots",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "duration": {"type": "number", "description": "Profiling window in seconds (default: 60)", "exclusiveMinimum": 0, "maximum": 3600},
+                "mode": {"type": "string", "description": "sample (stack sampler, flamegraph-ready) or cprofile", "enum": ["sample", "cprofile"]},
+                "interval": {"type": "number", "description": "Sampling interval in seconds (default: 0.005)", "minimum": 0.001},
+                "trace_memory": {"type": "boolean", "description": "Also take a tracemalloc snapshot at the end of the window", "default": False}
+            }
+        }
+    },
+    {
+        "name": "stop_profiling",
+        "description": "Stop the running profiling window early and write its files",
+        "schema": {"type": "object", "properties": {}}
     }
 ]
 
-# Мапинг обработчиков
+# Дедлайн вызова: аргумент "timeout", иначе TOOL_TIMEOUTS (tool=seconds,...), иначе TOOL_TIMEOUT
+MAX_TOOL_TIMEOUT = 3600.0
+
+TIMEOUT_PROPERTY = {
+    "type": "number",
+    "description": "Deadline for the whole call in seconds (limiter wait and HTTP requests included)",
+    "exclusiveMinimum": 0,
+    "maximum": MAX_TOOL_TIMEOUT
+}
+
+DEFAULT_TOOL_TIMEOUT = float(os.getenv('TOOL_TIMEOUT', '60'))
+
+
+def _parse_tool_timeouts(value: str) -> Dict[str, float]:
+    timeouts = {}
+    for item in value.split(','):
+        if '=' in item:
+            tool_name, seconds = item.split('=', 1)
+            timeouts[tool_name.strip()] = float(seconds)
+    return timeouts
+
+
+TOOL_TIMEOUTS = _parse_tool_timeouts(os.getenv('TOOL_TIMEOUTS', ''))
+
+
+def get_tool_timeout(name: str, arguments: Dict[str, Any]) -> float:
+    """Дедлайн вызова в секундах; ValueError, если аргумент timeout не положительное число"""
+    timeout = arguments.get("timeout")
+    if timeout is None:
+        return TOOL_TIMEOUTS.get(name, DEFAULT_TOOL_TIMEOUT)
+    try:
+        seconds = float(timeout) if not isinstance(timeout, bool) else math.nan
+    except (TypeError, ValueError):
+        seconds = math.nan
+    if not seconds > 0:
+        raise ValueError(f"timeout must be a positive number of seconds, got {timeout!r}")
+    return min(seconds, MAX_TOOL_TIMEOUT)
+
+
+# Мапинг обработчиков: "модуль:функция" в пакете handlers, модуль импортируется при первом вызове tool
 HANDLERS_MAP = {
-    "search_projects": handle_search_projects,
-    "get_project": handle_get_project,
-    "create_bid": handle_create_bid,
-
-    "get_freelancer": handle_get_freelancer,
-    "get_skills": handle_get_skills,
-
-    "get_threads": handle_get_threads,
-    "get_project_bids": handle_get_project_bids,
-    "get_project_comments": handle_get_project_comments,
-    "get_my_bids": handle_get_my_bids,
-    "get_my_profile": handle_get_my_profile,
-    "get_freelancer_portfolio": handle_get_freelancer_portfolio,
-    "get_freelancer_reviews": handle_get_freelancer_reviews,
-    "search_contests": handle_search_contests,
-    "get_contest": handle_get_contest,
-    "get_countries": handle_get_countries,
-    "get_cities": handle_get_cities
+    "search_projects": "project_handlers:handle_search_projects",
+    "get_project": "project_handlers:handle_get_project",
+    "create_bid": "project_handlers:handle_create_bid",
+    "find_duplicate_projects": "project_handlers:handle_find_duplicate_projects",
+
+    "get_freelancer": "freelancer_handlers:handle_get_freelancer",
+    "get_skills": "location_handlers:handle_get_skills",
+
+    "get_threads": "thread_handlers:handle_get_threads",
+    "get_project_bids": "project_handlers:handle_get_project_bids",
+    "get_project_comments": "project_handlers:handle_get_project_comments",
+    "get_my_bids": "freelancer_handlers:handle_get_my_bids",
+    "get_my_profile": "freelancer_handlers:handle_get_my_profile",
+    "get_freelancer_portfolio": "freelancer_handlers:handle_get_freelancer_portfolio",
+    "get_freelancer_reviews": "freelancer_handlers:handle_get_freelancer_reviews",
+    "search_contests": "contest_handlers:handle_search_contests",
+    "get_contest": "contest_handlers:handle_get_contest",
+    "get_countries": "location_handlers:handle_get_countries",
+    "get_cities": "location_handlers:handle_get_cities",
+    "resolve_names": "location_handlers:handle_resolve_names",
+    "get_bid_stats": "analytics_handlers:handle_get_bid_stats",
+    "get_price_index": "analytics_handlers:handle_get_price_index",
+    "rank_projects_for_me": "analytics_handlers:handle_rank_projects_for_me",
+    "get_employer_summary": "analytics_handlers:handle_get_employer_summary",
+    "get_server_stats": "stats_handlers:handle_get_server_stats",
+    "start_profiling": "stats_handlers:handle_start_profiling",
+    "stop_profiling": "stats_handlers:handle_stop_profiling"
 }
 
+_resolved_handlers: Dict[str, Callable[..., Awaitable[List[types.TextContent]]]] = {}
+
+
+def get_handler(name: str) -> Callable[..., Awaitable[List[types.TextContent]]]:
+    handler = _resolved_handlers.get(name)
+    if handler is None:
+        module_name, function_name = HANDLERS_MAP[name].split(":")
+        module = importlib.import_module(f".handlers.{module_name}", __package__)
+        handler = _resolved_handlers[name] = getattr(module, function_name)
+    return handler
+
 
 # ================================================
 # MCP Server handlers
 # ================================================
 
+_tools: Optional[List[types.Tool]] = None
+
+
+def build_tools() -> List[types.Tool]:
+    """Tool объекты строятся один раз на процесс"""
+    global _tools
+    if _tools is None:
+        _tools = [
+            types.Tool(
+                name=tool_config["name"],
+                description=tool_config["description"],
+                inputSchema={
+                    **tool_config["schema"],
+                    "properties": {**tool_config["schema"]["properties"], "timeout": TIMEOUT_PROPERTY}
+                }
+            )
+            for tool_config in TOOLS_CONFIG
+        ]
+    return _tools
+
+
 @server.list_tools()
 async def handle_list_tools() -> List[types.Tool]:
-    return [
-        types.Tool(
-            name=tool_config["name"],
-            description=tool_config["description"],
-            inputSchema=tool_config["schema"]
-        )
-        for tool_config in TOOLS_CONFIG
-    ]
+    return build_tools()
+
+
+def stale_warning(stale: List[Dict[str, Any]]) -> types.TextContent:
+    sources = ", ".join(f"{item['key']} (age {item['age']:.0f}s)" for item in stale)
+    return types.TextContent(
+        type="text",
+        text=f"Warning: FreelanceHunt API unavailable ({stale[0]['reason']}); stale cached data served for {sources}"
+    )
+
+
+async def execute_tool(name: str, arguments: Dict[str, Any], timeout: float) -> List[types.TextContent]:
+    handler = get_handler(name)
+    # Отмена запроса клиентом MCP отменяет задачу и все вложенные ожидания (limiter, httpx)
+    with deadline_scope(timeout), track_stale() as stale, span("handler"):
+        result = await asyncio.wait_for(handler(client, arguments), timeout)
+    if stale:
+        result = list(result) + [stale_warning(stale)]
+    return result
+
+
+def progress_reporter() -> ProgressReporter:
+    """Прогресс вызова; уведомления отправляются, только если клиент передал progressToken"""
+    try:
+        context = server.request_context
+    except LookupError:
+        return ProgressReporter()
+    token = context.meta.progressToken if context.meta else None
+    if token is None:
+        return ProgressReporter()
+    
+    # message и related_request_id есть только в новых версиях mcp: передаются, если их принимает сессия
+    supported = inspect.signature(context.session.send_progress_notification).parameters
+    extra = {"related_request_id": str(context.request_id)} if "related_request_id" in supported else {}
+    
+    async def send(progress: float, total: Optional[float], message: Optional[str]) -> None:
+        if "message" in supported:
+            extra["message"] = message
+        await context.session.send_progress_notification(token, progress, total, **extra)
+    
+    return ProgressReporter(send, float(os.getenv('PROGRESS_INTERVAL', '0.5')))
+
+
+def partial_response(reporter: ProgressReporter, reason: str) -> Optional[List[types.TextContent]]:
+    """Частичный результат обработчика вместо ошибки дедлайна"""
+    try:
+        partial = reporter.partial()
+    except Exception:
+        return None
+    if partial is None:
+        return None
+    text = json.dumps({"partial": True, "reason": reason, **partial}, indent=2, default=str, ensure_ascii=False)
+    return [types.TextContent(type="text", text=text)]
+
+
+def trace_suffix() -> str:
+    trace_id = current_trace_id()
+    return f" (trace_id={trace_id})" if trace_id else ""
 
 
 @server.call_tool()
@@ -298,32 +532,156 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
             text="Error: FreelanceHunt client not initialized. Please set FREELANCEHUNT_API_KEY environment variable and restart the server."
         )]
     
-    try:
-        handler = HANDLERS_MAP.get(name)
-        if handler:
-            return await handler(client, arguments)
-        else:
-            return [types.TextContent(
-                type="text",
-                text=f"Error: Unknown tool '{name}'"
-            )]
-    except FreelanceHuntAPIError as e:
+    if name not in HANDLERS_MAP:
         return [types.TextContent(
             type="text",
-            text=f"FreelanceHunt API Error: {e}"
-        )]
-    except Exception as e:
-        return [types.TextContent(
-            type="text",
-            text=f"Unexpected error: {e}"
+            text=f"Error: Unknown tool '{name}'"
         )]
+    
+    try:
+        timeout = get_tool_timeout(name, arguments)
+    except ValueError as e:
+        metrics.inc('tool_calls_total', tool=name, outcome="InvalidTimeout")
+        return [types.TextContent(type="text", text=f"Error: {e}")]
+    arguments = {key: value for key, value in arguments.items() if key != "timeout"}
+    
+    started = time.perf_counter()
+    outcome = "ok"
+    reporter = progress_reporter()
+    with start_trace(f"tool/{name}", tool=name, timeout=timeout) as trace:
+        try:
+            with profiler.tool_call(), progress_scope(reporter):
+                result = await execute_tool(name, arguments, timeout)
+        except asyncio.CancelledError:
+            metrics.inc('tool_calls_total', tool=name, outcome="cancelled")
+            raise
+        except (asyncio.TimeoutError, DeadlineExceededError):
+            # Обработчики длинных вызовов оставляют частичный результат
+            result = partial_response(reporter, f"deadline of {timeout:g}s exceeded")
+            outcome = "partial" if result else "DeadlineExceeded"
+            if result is None:
+                result = [types.TextContent(
+                    type="text",
+                    text=f"Error: Tool '{name}' exceeded deadline of {timeout:g}s{trace_suffix()}"
+                )]
+        except FreelanceHuntAPIError as e:
+            outcome = type(e).__name__
+            result = [types.TextContent(
+                type="text",
+                text=f"FreelanceHunt API Error: {e}{trace_suffix()}"
+            )]
+        except Exception as e:
+            outcome = type(e).__name__
+            result = [types.TextContent(
+                type="text",
+                text=f"Unexpected error: {e}{trace_suffix()}"
+            )]
+        if trace:
+            trace.set_attribute("outcome", outcome)
+    
+    metrics.observe('tool_duration_seconds', time.perf_counter() - started, tool=name)
+    metrics.inc('tool_calls_total', tool=name, outcome=outcome)
+    if reporter.sent:
+        metrics.inc('tool_progress_notifications_total', reporter.sent, tool=name)
+    metrics.inc('tool_request_bytes_total', len(json.dumps(arguments, default=str)), tool=name)
+    metrics.inc('tool_response_bytes_total', sum(len(item.text.encode()) for item in result), tool=name)
+    return result
+
+
+def render_metrics() -> str:
+    if client:
+        client.collect_gauges()
+    return metrics.render_prometheus()
 
 
 # ================================================
 # Server entry point
 # ================================================
 
+async def warm_cache(path: str) -> None:
+    try:
+        loaded = await client.load_cache_snapshot(path)
+        print(f"Cache warmed with {loaded} entries from {path}", file=sys.stderr)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: failed to load cache snapshot {path}: {e}", file=sys.stderr)
+
+
+async def save_cache(path: str) -> None:
+    try:
+        await client.save_cache_snapshot(path)
+    except Exception as e:
+        print(f"Warning: failed to save cache snapshot {path}: {e}", file=sys.stderr)
+
+
+async def warm_mirror(path: str) -> None:
+    try:
+        loaded = await client.load_mirror(path)
+        print(f"Mirror restored with {loaded} records from {path}", file=sys.stderr)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: failed to load mirror {path}: {e}", file=sys.stderr)
+
+
+async def save_mirror(path: str) -> None:
+    try:
+        await client.save_mirror(path)
+    except Exception as e:
+        print(f"Warning: failed to save mirror {path}: {e}", file=sys.stderr)
+
+
+async def save_local_state(snapshot_path: Optional[str], mirror_path: Optional[str]) -> None:
+    if snapshot_path:
+        await save_cache(snapshot_path)
+    if mirror_path:
+        await save_mirror(mirror_path)
+
+
+async def snapshot_periodically(snapshot_path: Optional[str], mirror_path: Optional[str], interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await save_local_state(snapshot_path, mirror_path)
+
+
 async def run_server():
+    # Сетевой режим метрик: METRICS_PORT включает Prometheus эндпоинт /metrics
+    metrics_server = None
+    metrics_port = os.getenv('METRICS_PORT')
+    if metrics_port:
+        metrics_host = os.getenv('METRICS_HOST', '127.0.0.1')
+        metrics_server = await serve_metrics(metrics_host, int(metrics_port), render_metrics)
+        print(f"Metrics available at http://{metrics_host}:{metrics_port}/metrics", file=sys.stderr)
+    
+    start_profiling_from_env()
+    
+    # Снимок кэша и зеркало: загрузка параллельно с обслуживанием, запись при выходе
+    # и раз в CACHE_SNAPSHOT_INTERVAL; офлайн-клиент загружает их сам и ничего не пишет
+    persist = client is not None and not client.offline
+    snapshot_path = os.getenv('CACHE_SNAPSHOT_PATH') if persist else None
+    mirror_path = os.getenv('MIRROR_PATH') if persist else None
+    background: List[asyncio.Task] = []
+    if snapshot_path:
+        background.append(asyncio.create_task(warm_cache(snapshot_path)))
+    if mirror_path:
+        background.append(asyncio.create_task(warm_mirror(mirror_path)))
+    snapshot_interval = float(os.getenv('CACHE_SNAPSHOT_INTERVAL', '0'))
+    if (snapshot_path or mirror_path) and snapshot_interval > 0:
+        background.append(asyncio.create_task(snapshot_periodically(snapshot_path, mirror_path, snapshot_interval)))
+    
+    try:
+        await serve_stdio()
+    finally:
+        for task in background:
+            task.cancel()
+        await save_local_state(snapshot_path, mirror_path)
+        profiler.stop()
+        if metrics_server:
+            metrics_server.close()
+
+
+async def serve_stdio():
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream, 
@@ -340,8 +698,18 @@ async def run_server():
 
 
 def main():
+    parser = argparse.ArgumentParser(description="FreelanceHunt MCP server (stdio)")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        default=os.getenv('OFFLINE_MODE', '').lower() in ('1', 'true', 'yes'),
+        help="serve from MIRROR_PATH / CACHE_SNAPSHOT_PATH / CASSETTE_PATH without network access"
+    )
+    args = parser.parse_args()
+    
     # Initialize the client
-    init_client()
+    init_client(offline=args.offline)
+    configure_tracing()
     
     # Run the server
     asyncio.run(run_server())
@@ -0,0 +1,205 @@
+# ================================================
+# Трассировка вызовов tools (дерево спанов)
+# ================================================
+
+import atexit
+import contextvars
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "start_ns", "end_ns", "attributes", "children")
+
+    def __init__(self, name: str, trace_id: str, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.children: List["Span"] = []
+
+    def set_attribute(self, name: str, value: Any) -> None:
+        self.attributes[name] = value
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "start_ns": self.start_ns,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "children": [child.to_dict() for child in self.children]
+        }
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "freelancehunt_current_span", default=None
+)
+
+
+# ================================================
+# Экспортеры
+# ================================================
+
+class JsonLinesExporter:
+    """Одна строка JSON на трассу (дерево спанов целиком).
+
+    export только ставит запись в очередь: сериализация и запись в файл идут в отдельном
+    потоке пачками, чтобы не блокировать event loop на каждом вызове tool.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._queue: "queue.SimpleQueue[Optional[Dict[str, Any]]]" = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop, name="trace-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def export(self, root: Span) -> None:
+        self._queue.put({"trace_id": root.trace_id, **root.to_dict()})
+
+    def close(self) -> None:
+        """Дописать очередь и остановить поток записи"""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=5)
+
+    def _write_loop(self) -> None:
+        while True:
+            records = [self._queue.get()]
+            while not self._queue.empty():
+                records.append(self._queue.get())
+            stop = None in records
+            lines = [
+                json.dumps(record, default=str, ensure_ascii=False) + "\n"
+                for record in records if record is not None
+            ]
+            if lines:
+                try:
+                    with open(self.path, "a", encoding="utf-8") as f:
+                        f.writelines(lines)
+                except OSError as e:
+                    print(f"Warning: trace export failed: {e}", file=sys.stderr)
+            if stop:
+                return
+
+
+class OpenTelemetryExporter:
+    """Переносит готовое дерево спанов в OpenTelemetry tracer"""
+
+    def __init__(self):
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = trace.get_tracer("freelancehunt_mcp")
+
+    def export(self, root: Span) -> None:
+        self._emit(root, None)
+
+    def _emit(self, span: Span, parent_context: Any) -> None:
+        attributes = {
+            key: value if isinstance(value, (str, bool, int, float)) else str(value)
+            for key, value in span.attributes.items()
+        }
+        attributes["freelancehunt.trace_id"] = span.trace_id
+        otel_span = self._tracer.start_span(
+            span.name, context=parent_context, start_time=span.start_ns, attributes=attributes
+        )
+        context = self._trace.set_span_in_context(otel_span)
+        for child in span.children:
+            self._emit(child, context)
+        otel_span.end(end_time=span.end_ns)
+
+
+_exporter: Optional[Any] = None
+
+
+def set_exporter(exporter: Optional[Any]) -> None:
+    """Подключить экспортер (объект с методом export(root_span)); None выключает трассировку"""
+    global _exporter
+    _exporter = exporter
+
+
+def configure_from_env() -> None:
+    """TRACE_EXPORTER=auto|otel|jsonl (пусто - выключено), TRACE_FILE для jsonl"""
+    kind = os.getenv('TRACE_EXPORTER', '').lower()
+    if not kind:
+        return
+
+    if kind in ('auto', 'otel'):
+        try:
+            set_exporter(OpenTelemetryExporter())
+            return
+        except ImportError:
+            if kind == 'otel':
+                print("Warning: opentelemetry is not installed, falling back to JSON lines traces", file=sys.stderr)
+
+    set_exporter(JsonLinesExporter(os.getenv('TRACE_FILE', 'freelancehunt_traces.jsonl')))
+
+
+# ================================================
+# API спанов
+# ================================================
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Корневой спан вызова; без экспортера ничего не делает"""
+    if _exporter is None:
+        yield None
+        return
+
+    root = Span(name, uuid.uuid4().hex, attributes)
+    token = _current_span.set(root)
+    try:
+        yield root
+    except BaseException as e:
+        root.set_attribute("error", type(e).__name__)
+        raise
+    finally:
+        root.end_ns = time.time_ns()
+        _current_span.reset(token)
+        try:
+            _exporter.export(root)
+        except Exception as e:
+            print(f"Warning: trace export failed: {e}", file=sys.stderr)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Дочерний спан текущей трассы; вне трассы ничего не делает"""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    child = Span(name, parent.trace_id, attributes)
+    parent.children.append(child)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.set_attribute("error", type(e).__name__)
+        raise
+    finally:
+        child.end_ns = time.time_ns()
+        _current_span.reset(token)
+
+
+def current_trace_id() -> Optional[str]:
+    current = _current_span.get()
+    return current.trace_id if current else None
@@ -0,0 +1,27 @@
+# ================================================
+# Общие фикстуры тестов: клиент поверх in-process stub_api
+# ================================================
+
+import os
+import sys
+
+import httpx
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from freelancehunt_mcp.api_client import FreelanceHuntClient  # noqa: E402
+from stub_api import StubAPI  # noqa: E402
+
+
+@pytest.fixture
+def stub() -> StubAPI:
+    return StubAPI(projects=120, freelancers=40, contests=5, threads=5)
+
+
+@pytest.fixture
+def client(stub: StubAPI, monkeypatch: pytest.MonkeyPatch) -> FreelanceHuntClient:
+    monkeypatch.setenv("REQUEST_DELAY", "0")
+    return FreelanceHuntClient(api_key="stub", base_url="http://stub/v2", transport=httpx.ASGITransport(app=stub))
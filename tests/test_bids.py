@@ -0,0 +1,20 @@
+import asyncio
+
+from freelancehunt_mcp.models import CreateBidRequest, ProjectBudget
+
+
+def test_created_bid_is_visible_immediately(client, stub):
+    project_id = next(iter(stub.projects))
+    bid = CreateBidRequest(days=5, budget=ProjectBudget(amount=1000, currency="UAH"), comment="Готов сделать")
+
+    async def scenario():
+        before_mine = await client.get_my_bids()
+        before_project = await client.get_project_bids(project_id)
+        await client.create_bid(project_id, bid)
+        return before_mine, before_project, await client.get_my_bids(), await client.get_project_bids(project_id)
+
+    before_mine, before_project, after_mine, after_project = asyncio.run(scenario())
+
+    assert len(before_mine.data) == 0
+    assert len(after_mine.data) == 1
+    assert len(after_project.data) == len(before_project.data) + 1
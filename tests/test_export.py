@@ -0,0 +1,63 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from freelancehunt_mcp import export as export_module
+from freelancehunt_mcp.api_client import FreelanceHuntClient
+
+
+class Flaky:
+    """Заглушка, отвечающая 503 с Retry-After на запросы с заданными номерами"""
+
+    def __init__(self, app, failing):
+        self.app = app
+        self.failing = failing
+        self.calls = 0
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        if self.calls not in self.failing:
+            return await self.app(scope, receive, send)
+        await send({"type": "http.response.start", "status": 503, "headers": [(b"retry-after", b"0")]})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+
+def make_client(app):
+    return FreelanceHuntClient(api_key="stub", base_url="http://stub/v2", transport=httpx.ASGITransport(app=app))
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setenv("REQUEST_DELAY", "0")
+    monkeypatch.setattr(export_module, "RETRY_BASE_DELAY", 0.0)
+
+
+def read_ids(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line)["id"] for line in f]
+
+
+def test_export_retries_failed_pages(stub, tmp_path):
+    output = str(tmp_path / "projects.jsonl")
+    app = Flaky(stub, failing={2, 3})
+
+    stats = asyncio.run(export_module.export(make_client(app), "/projects", output, page_size=50, report_interval=60))
+
+    assert stats["items"] == len(stub.projects)
+    assert sorted(read_ids(output)) == sorted(stub.projects)
+
+
+def test_export_stops_with_checkpoint_and_resumes(stub, tmp_path):
+    output = str(tmp_path / "projects.jsonl")
+    app = Flaky(stub, failing={2, 3, 4})
+
+    with pytest.raises(SystemExit, match="resume"):
+        asyncio.run(export_module.export(make_client(app), "/projects", output, page_size=50, retries=2))
+    assert len(read_ids(output)) == 50
+
+    stats = asyncio.run(export_module.export(make_client(stub), "/projects", output, page_size=50, report_interval=60))
+
+    assert stats["items"] == len(stub.projects)
+    assert sorted(read_ids(output)) == sorted(stub.projects)
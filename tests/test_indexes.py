@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def small_mirror(monkeypatch):
+    monkeypatch.setenv("MIRROR_MAX_ENTRIES", "100")
+
+
+def test_indexes_stay_bounded_with_mirror(small_mirror, client, stub):
+    async def scenario():
+        for page in range(1, 4):
+            projects = await client.search_projects(page=page, per_page=50)
+            for project in projects.data[:10]:
+                await client.get_project_bids(project.id, per_page=50)
+
+    asyncio.run(scenario())
+
+    assert client.mirror.evictions > 0
+    assert len(client.mirror) == 100
+    mirrored = {item["id"] for item in client.mirror.items("projects")}
+
+    assert len(client.duplicates) <= len(mirrored)
+    assert all(project_id in mirrored for project_id in client.duplicates._signatures)
+    assert client.employers.stats()["projects"] == len(mirrored)
+    observed = client.price_index.stats()
+    assert observed["projects"] + observed["bids"] <= 100
+    # Агрегаты содержат только бюджеты элементов, оставшихся в зеркале
+    budgets = sum(1 for item in client.mirror.items("projects") if (item["attributes"].get("budget") or {}).get("amount"))
+    counted = [skills for skills, currency, _ in client.price_index._seen_projects.values() if currency]
+    assert len(counted) == budgets
+    assert sum(sketch.count for sketch in client.price_index.projects.values()) == sum(map(len, counted))
@@ -0,0 +1,25 @@
+from freelancehunt_mcp.mirror import LocalMirror
+
+
+def page(first, count):
+    return {"data": [{"id": first + i, "type": "project", "attributes": {"name": f"Проект {first + i}"}} for i in range(count)]}
+
+
+def test_mirror_evicts_least_recently_updated():
+    mirror = LocalMirror(max_entries=100)
+    for first in range(0, 1000, 50):
+        mirror.ingest("/projects", page(first, 50))
+
+    assert len(mirror) == 100
+    assert mirror.evictions == 900
+    assert mirror.get("projects", 999) is not None
+    assert mirror.get("projects", 0) is None
+
+
+def test_restore_does_not_evict_live_entries():
+    mirror = LocalMirror(max_entries=10)
+    mirror.ingest("/projects", page(0, 8))
+    restored = mirror.restore(("projects", item, 0.0) for item in page(100, 5)["data"])
+
+    assert restored == 2
+    assert all(mirror.contains("projects", item_id) for item_id in range(8))
@@ -0,0 +1,25 @@
+import asyncio
+import math
+
+import pytest
+
+from freelancehunt_mcp import server
+
+
+@pytest.mark.parametrize("value", ["abc", 0, -5, math.nan, True, [1]])
+def test_invalid_timeout_is_rejected(value):
+    with pytest.raises(ValueError):
+        server.get_tool_timeout("get_skills", {"timeout": value})
+
+
+def test_timeout_is_clamped():
+    assert server.get_tool_timeout("get_skills", {"timeout": math.inf}) == server.MAX_TOOL_TIMEOUT
+    assert server.get_tool_timeout("get_skills", {"timeout": "2.5"}) == 2.5
+
+
+def test_invalid_timeout_returns_error_content(client, monkeypatch):
+    monkeypatch.setattr(server, "client", client)
+
+    result = asyncio.run(server.handle_call_tool("get_skills", {"timeout": "abc"}))
+
+    assert result[0].text.startswith("Error: timeout must be a positive number")
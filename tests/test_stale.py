@@ -0,0 +1,20 @@
+import asyncio
+
+from freelancehunt_mcp.cache import track_stale
+
+
+def test_get_project_falls_back_to_mirror(client, stub):
+    async def scenario():
+        page = await client.search_projects(per_page=10)
+        project_id = page.data[0].id
+        # Проект есть только в зеркале (из списка), ответа по ID в кэше нет
+        stub.error_rate = 1.0
+        with track_stale() as stale:
+            project = await client.get_project(project_id)
+        return project_id, project, stale
+
+    project_id, project, stale = asyncio.run(scenario())
+
+    assert project.id == project_id
+    assert stale and stale[0]["key"] == f"/projects/{project_id}"
+    assert stale[0]["age"] >= 0
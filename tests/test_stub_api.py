@@ -0,0 +1,22 @@
+import asyncio
+
+from freelancehunt_mcp.models import SearchFilters
+
+
+def test_stub_applies_location_filter(client, stub):
+    city_ids = {
+        p["attributes"]["location"]["city"]["id"] for p in stub.projects.values() if p["attributes"]["location"]
+    }
+    city_id = min(city_ids)
+
+    async def scenario():
+        by_city = await client.search_projects(per_page=50, filters=SearchFilters(location_id=city_id))
+        by_country = await client.search_projects(per_page=50, filters=SearchFilters(location_id=city_id // 100))
+        return by_city, by_country
+
+    by_city, by_country = asyncio.run(scenario())
+
+    expected = [p for p in stub.projects.values() if (p["attributes"]["location"] or {}).get("city", {}).get("id") == city_id]
+    assert by_city.data and len(by_city.data) == len(expected)
+    assert all(project.attributes.location for project in by_country.data)
+    assert len(by_country.data) >= len(by_city.data)